@@ -0,0 +1,41 @@
+"""add_task_query_indexes
+
+Revision ID: 5b1e7c9a2d40
+Revises: cd842e321782
+Create Date: 2026-10-17 09:10:00.000000
+
+Task liste/count sorgulari icin composite index'ler. Her sorgu user_id ile
+filtrelenir ve created_at'e gore siralanir; status/priority filtreleri
+Specification'larla eklenir.
+
+Buyuk bir Postgres tablosunda yazmalari bloklamamak icin bu index'leri
+once elle CREATE INDEX CONCURRENTLY ile olusturup sonra bu revision'i
+'alembic stamp' ile isaretleyebilirsiniz.
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e7c9a2d40'
+down_revision: str | Sequence[str] | None = 'cd842e321782'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_user_created', 'tasks', ['user_id', 'created_at', 'id'])
+    op.create_index(
+        'ix_tasks_user_status', 'tasks', ['user_id', 'status', 'created_at']
+    )
+    op.create_index(
+        'ix_tasks_user_priority', 'tasks', ['user_id', 'priority', 'created_at']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_user_priority', table_name='tasks')
+    op.drop_index('ix_tasks_user_status', table_name='tasks')
+    op.drop_index('ix_tasks_user_created', table_name='tasks')
@@ -0,0 +1,112 @@
+"""add_task_full_text_search
+
+Revision ID: 8f3d2a6c41b7
+Revises: 5b1e7c9a2d40
+Create Date: 2026-10-17 10:20:00.000000
+
+Task aramasi icin index'li full-text backend (bkz. app.db.search):
+    - PostgreSQL: GENERATED search_vector kolonu + GIN index
+      (SEARCH_TRIGRAM_ENABLED=true ise pg_trgm ve trigram index'leri)
+    - SQLite: tasks_fts FTS5 tablosu, senkron trigger'lari ve mevcut
+      satirlarin index'e alinmasi
+
+DDL bu dosyaya kopyalanmistir; app.db.search sonradan degisse de bu
+revision ayni semayi uretir. Yalnizca dil ayari ve trigram secimi
+deploy ayarlarindan okunur.
+
+PostgreSQL uyarisi: GENERATED ... STORED kolon eklemek tum tabloyu
+ACCESS EXCLUSIVE kilit altinda yeniden yazar; islem bitene kadar tasks
+uzerindeki okuma ve yazmalar bekler. GIN index'leri de (CONCURRENTLY
+olmadan) yazmalari bloklar. Buyuk tablolarda bakim penceresinde calistirin.
+"""
+from collections.abc import Sequence
+
+from alembic import op
+from app.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3d2a6c41b7'
+down_revision: str | Sequence[str] | None = '5b1e7c9a2d40'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SQLITE_CREATE_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description,
+        content='tasks', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_au
+    AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+    # Mevcut satirlari index'e alir
+    "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')",
+]
+SQLITE_DROP_DDL = [
+    "DROP TRIGGER IF EXISTS tasks_fts_au",
+    "DROP TRIGGER IF EXISTS tasks_fts_ad",
+    "DROP TRIGGER IF EXISTS tasks_fts_ai",
+    "DROP TABLE IF EXISTS tasks_fts",
+]
+
+# {config}: to_tsvector dil ayari (SEARCH_PG_CONFIG)
+POSTGRES_CREATE_DDL = [
+    """ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{config}', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('{config}', coalesce(description, '')), 'B')
+    ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector "
+    "ON tasks USING GIN (search_vector)",
+]
+POSTGRES_TRIGRAM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_title_trgm "
+    "ON tasks USING GIN (title gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_description_trgm "
+    "ON tasks USING GIN (description gin_trgm_ops)",
+]
+POSTGRES_DROP_DDL = [
+    "DROP INDEX IF EXISTS ix_tasks_description_trgm",
+    "DROP INDEX IF EXISTS ix_tasks_title_trgm",
+    "DROP INDEX IF EXISTS ix_tasks_search_vector",
+    "ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        config = settings.search_pg_config
+        statements = [s.format(config=config) for s in POSTGRES_CREATE_DDL]
+        if settings.search_trigram_enabled:
+            statements += POSTGRES_TRIGRAM_DDL
+        for statement in statements:
+            op.execute(statement)
+    elif dialect == "sqlite":
+        for statement in SQLITE_CREATE_DDL:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        for statement in POSTGRES_DROP_DDL:
+            op.execute(statement)
+    elif dialect == "sqlite":
+        for statement in SQLITE_DROP_DDL:
+            op.execute(statement)
@@ -10,11 +10,12 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ForbiddenException, InvalidTokenException
+from app.core.principal_cache import principal_cache
 from app.core.security import decode_token
+from app.core.token_revocation import token_revocation
 from app.db.database import get_db_session
-from app.db.entities import UserEntity
-from app.db.repositories.user import UserRepository
 from app.db.unit_of_work import TaskUnitOfWork
+from app.models.user import UserPrincipal
 from app.services.auth import AuthService
 from app.services.task import TaskService
 
@@ -46,46 +47,77 @@ async def get_auth_service(uow: TaskUnitOfWork = Depends(get_unit_of_work)):
     return AuthService(uow)
 
 
-async def get_current_user(
+async def get_access_token_payload(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-    session: AsyncSession = Depends(get_db_session),
-) -> UserEntity:
+) -> dict:
     """
-    Gelen istekteki token'i dogrular ve veritabanindan kullaniciyi getirir.
+    Bearer token'i dogrular ve access token payload'ini dondurur.
+
+    Iptal kontrolu worker ici Bloom filtresiyle yapilir; iptal edilmemis
+    token'lar icin network I/O olmaz (bkz. TokenRevocationList).
 
-    Args:
-        credentials: HTTP Bearer token bilgileri.
-        session: Veritabani oturumu.
-    Returns:
-        UserEntity: Mevcut giris yapmis kullanici
     Raises:
-        InvalidTokenException: Token gecersiz, suresi dolmus veya
-        kullanici bulunamadiysa.
+        InvalidTokenException: Token gecersiz, suresi dolmus, access token
+        degil veya iptal edilmisse.
     """
-    # token al ve decode et
-    token = credentials.credentials
-    payload = decode_token(token)
+    payload = decode_token(credentials.credentials)
 
     # Token gecerlilik ve tip kontrolu
     if not payload or payload.get("type") != "access" or payload.get("sub") is None:
         raise InvalidTokenException()
 
-    # User id al ve kullaniciyi bul
-    user_id = int(payload["sub"])
-    repo = UserRepository(session)
-    user = await repo.get_by_id(user_id)
+    # Logout ile iptal edilmis mi
+    if await token_revocation.is_revoked(payload.get("jti")):
+        raise InvalidTokenException()
+    return payload
+
 
-    # Kullanici hala var mi kontrolu
-    if not user:
+async def get_current_user(
+    uow: TaskUnitOfWork = Depends(get_unit_of_work),
+    payload: dict = Depends(get_access_token_payload),
+) -> UserPrincipal:
+    """
+    Dogrulanmis access token'in sahibi olan kullaniciyi getirir.
+
+    Kullanici once principal cache'te aranir; yoksa istegin unit of work'u
+    (endpoint'in de kullandigi ayni session) ile DB'den okunup cache'lenir.
+    Boylece cache isabetinde istek basina ekstra SELECT yapilmaz.
+
+    Args:
+        uow: Istegin unit of work'u.
+        payload: Dogrulanmis access token payload'i.
+    Returns:
+        UserPrincipal: Mevcut giris yapmis kullanici
+    Raises:
+        InvalidTokenException: Token gecersiz, iptal edilmis,
+        kullanici bulunamadi veya pasif ise.
+    """
+    # User id al, once cache'e bak
+    user_id = int(payload["sub"])
+    principal = None
+    if principal_cache is not None:
+        principal = await principal_cache.get(user_id)
+
+    if principal is None:
+        user = await uow.users.get_by_id(user_id)
+        # Kullanici hala var mi kontrolu
+        if not user:
+            raise InvalidTokenException()
+        principal = UserPrincipal.model_validate(user)
+        if principal_cache is not None:
+            await principal_cache.set(principal)
+
+    # Pasif kullanici token'i gecerli olsa da kabul edilmez
+    if not principal.is_active:
         raise InvalidTokenException()
-    return user
+    return principal
 
 
 
 # User kisayolu(eger user kisayolu olmazsa admin user getiremeyiz diye burda tanimladik)
-CurrentUserDep = Annotated[UserEntity, Depends(get_current_user)]
+CurrentUserDep = Annotated[UserPrincipal, Depends(get_current_user)]
 
-async def get_current_admin_user(current_user: CurrentUserDep) -> UserEntity:
+async def get_current_admin_user(current_user: CurrentUserDep) -> UserPrincipal:
     """Sadece admin kullanicilari gecirir,digerlerine 403 doner."""
     if not current_user.is_superuser:
         raise ForbiddenException("Admin access required")
@@ -93,7 +125,8 @@ async def get_current_admin_user(current_user: CurrentUserDep) -> UserEntity:
 
 
 # --- TYPE ALIASES (KISAYOLLAR) ---
-AdminUserDep = Annotated[UserEntity, Depends(get_current_admin_user)]
+AccessTokenPayloadDep = Annotated[dict, Depends(get_access_token_payload)]
+AdminUserDep = Annotated[UserPrincipal, Depends(get_current_admin_user)]
 UnitOfWorkDep = Annotated[TaskUnitOfWork, Depends(get_unit_of_work)]
 TaskServiceDep = Annotated[TaskService, Depends(get_task_service)]
 AuthServiceDep = Annotated[AuthService, Depends(get_auth_service)]
\ No newline at end of file
@@ -6,9 +6,15 @@ Kayit,Giris,Token yenileme ve profil bilgilerine erisim islemlerini yonetir.
 from fastapi import APIRouter, status
 from pydantic import BaseModel
 
-from app.api.dependencies import AuthServiceDep, CurrentUserDep
+from app.api.dependencies import AccessTokenPayloadDep, AuthServiceDep, CurrentUserDep
 from app.models.common import ApiResponse
-from app.models.user import TokenResponse, UserCreate, UserLogin, UserResponse
+from app.models.user import (
+    LogoutRequest,
+    TokenResponse,
+    UserCreate,
+    UserLogin,
+    UserResponse,
+)
 
 auth_router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -53,11 +59,25 @@ async def refresh_token(request: RefreshRequest, service: AuthServiceDep):
     return ApiResponse(success=True, data=tokens)
 
 
+@auth_router.post("/logout", response_model=ApiResponse[None])
+async def logout(
+    payload: AccessTokenPayloadDep,
+    service: AuthServiceDep,
+    request: LogoutRequest | None = None,
+):
+    """
+    Istegi yapan access token'i (ve verildiyse refresh token'i) iptal eder.
+    Iptal edilen token'lar tum worker'larda hemen reddedilir.
+    """
+    await service.logout(payload, request.refresh_token if request else None)
+    return ApiResponse(success=True)
+
+
 @auth_router.get("/me", response_model=ApiResponse[UserResponse])
 async def get_me(current_user: CurrentUserDep):
     """
     O an giris yapmis olan kullanicinin bilgilerinin doner.
     bu endpoint Bearer Token (Autharization basligi) gerektirir.
     """
-    # CurrentUserDep zaten token'i cozup kullaniciyi DB'den bulup getiriyor.
+    # CurrentUserDep zaten token'i cozup kullaniciyi (cache'ten veya DB'den) getiriyor.
     return ApiResponse(success=True, data=UserResponse.model_validate(current_user))
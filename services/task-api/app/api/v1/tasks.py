@@ -1,8 +1,17 @@
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Query, Response, status
 
 from app.api.dependencies import CurrentUserDep, TaskServiceDep
-from app.models.common import ApiResponse, PaginatedResponse, PaginationParams
+from app.models.common import (
+    ApiResponse,
+    CursorPaginatedResponse,
+    PaginatedResponse,
+    PaginationParams,
+)
 from app.models.task import (
+    TaskBatchCreate,
+    TaskBatchDelete,
+    TaskBatchResult,
+    TaskBatchUpdate,
     TaskCreate,
     TaskFilter,
     TaskPriority,
@@ -26,7 +35,12 @@ async def create_task(
     return ApiResponse(success=True, data=task)
 
 
-@tasks_router.get("/", response_model=ApiResponse[PaginatedResponse[TaskResponse]])
+@tasks_router.get(
+    "/",
+    response_model=ApiResponse[
+        PaginatedResponse[TaskResponse] | CursorPaginatedResponse[TaskResponse]
+    ],
+)
 async def get_all_tasks(
     service: TaskServiceDep,
       current_user: CurrentUserDep,
@@ -34,29 +48,83 @@ async def get_all_tasks(
       priority: TaskPriority | None = None,
       search: str | None= None,
       page: int = Query(default=1, ge=1),
-      page_size: int = Query(default=10, ge=1, le=100)
+      page_size: int = Query(default=10, ge=1, le=100),
+      cursor: str | None = Query(
+          default=None,
+          description="Cursor sayfalama; ilk sayfa icin bos birakin (cursor=)",
+      )
     ):
-    """Giris yapan kullanicinin tum task'larini filtre ve sayfali olarak listeler."""
+    """
+    Giris yapan kullanicinin tum task'larini filtre ve sayfali olarak listeler.
+
+    Iki sayfalama modu vardir:
+        - page/page_size: toplam sayi ve sayfa numarasi ile (OFFSET)
+        - cursor: her response'taki next_cursor ile (keyset); derin sayfalar
+          da ilk sayfa kadar hizlidir. "cursor=" (bos) ilk sayfayi getirir.
+
+    Body serviste hazir render edilip cache'lendigi icin dogrudan ham
+    Response olarak donulur; response_model sadece dokumantasyon icindir.
+    """
     filters= TaskFilter(status=status, priority=priority, search=search)
-    pagination = PaginationParams(page=page,page_size=page_size)
+    pagination = PaginationParams(page=page, page_size=page_size, cursor=cursor)
 
-    tasks, total = await service.get_all(
+    body = await service.get_all_response_body(
         user_id=current_user.id,
         filters=filters,
         pagination=pagination
-    ) 
+    )
 
-    total_pages = (total + page_size - 1) // page_size # Yukari yuvarlama
+    return Response(content=body, media_type="application/json")
 
-    paginated = PaginatedResponse(
-        items=tasks,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages
-    )
 
-    return ApiResponse(success=True, data=paginated)
+# Toplu endpoint'ler "/{task_id}" route'larindan once tanimlanmali;
+# aksi halde "batch" task_id olarak eslesir.
+@tasks_router.post(
+    "/batch",
+    response_model=ApiResponse[TaskBatchResult],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_tasks_batch(
+    batch: TaskBatchCreate, service: TaskServiceDep, current_user: CurrentUserDep
+):
+    """
+    Birden fazla task'i tek istek ve tek transaction ile olusturur.
+
+    Ya hepsi olusturulur ya hicbiri; sonuclar istekteki sirayla doner.
+    En fazla task_batch_max_size task gonderilebilir (asilirsa 413).
+    """
+    result = await service.create_many(batch.items, user_id=current_user.id)
+
+    return ApiResponse(success=True, data=result)
+
+
+@tasks_router.patch("/batch", response_model=ApiResponse[TaskBatchResult])
+async def update_tasks_batch(
+    batch: TaskBatchUpdate, service: TaskServiceDep, current_user: CurrentUserDep
+):
+    """
+    Giris yapan kullanicinin task'larini toplu gunceller.
+
+    Her oge id ve degisecek alanlari icerir. Bulunamayan task'lar islemi
+    durdurmaz; oge bazli sonuclarda success=false ve TASK_NOT_FOUND doner.
+    """
+    result = await service.update_many(batch.items, user_id=current_user.id)
+
+    return ApiResponse(success=True, data=result)
+
+
+@tasks_router.delete("/batch", response_model=ApiResponse[TaskBatchResult])
+async def delete_tasks_batch(
+    batch: TaskBatchDelete, service: TaskServiceDep, current_user: CurrentUserDep
+):
+    """
+    Giris yapan kullanicinin task'larini toplu siler.
+
+    Bulunamayan task'lar oge bazli sonuclarda success=false olarak doner.
+    """
+    result = await service.delete_many(batch.ids, user_id=current_user.id)
+
+    return ApiResponse(success=True, data=result)
 
 
 @tasks_router.get("/{task_id}", response_model=ApiResponse[TaskResponse])
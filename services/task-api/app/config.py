@@ -1,3 +1,5 @@
+from importlib.util import find_spec
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,6 +21,22 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 30
     jwt_refresh_token_expire_days: int = 7
+    jwt_decode_cache_enabled: bool = True # dogrulanmis payload'larin worker ici cache'i
+    jwt_decode_cache_max_size: int = 10000
+    jwt_decode_cache_ttl_seconds: float = 300.0 # ust sinir; token'in exp'ini gecmez
+    # Token Revocation Settings
+    token_revocation_channel: str = "auth:revocations" # iptaller worker'lara yayilir
+    token_revocation_bloom_capacity: int = 100000 # asilinca Redis'ten yeniden kurulur
+    token_revocation_bloom_error_rate: float = 0.001 # yalniz false positive'ler Redis'e
+    # Principal (current user) Cache Settings
+    principal_cache_enabled: bool = True
+    principal_cache_local_ttl_seconds: float = 5.0 # worker ici kopyanin azami bayatligi
+    principal_cache_max_size: int = 10000
+    principal_cache_redis_enabled: bool = False # worker'lar arasi ikinci seviye (Redis)
+    principal_cache_ttl_seconds: int = 60 # Redis kopyasinin suresi
+    # Password Hashing Settings
+    bcrypt_max_workers: int = 4 # ayni anda calisan bcrypt islemi (thread) sayisi
+    bcrypt_queue_timeout_seconds: float = 5.0 # slot bu surede bosalmazsa 503 doner
     #RabbitMQ Settings
     rabbitmq_host: str = "localhost"
     rabbitmq_port: int = 5672
@@ -35,9 +53,48 @@ class Settings(BaseSettings):
     redis_db: int = 0 
     redis_password: str |None = None
     cache_ttl_seconds: int = 300 # cache ne kadar yasasin suresi 300 saniye
+    # Cache Serialization Settings
+    # json | orjson | msgpack; orjson/msgpack/lz4 "cache" extra'si ile kurulur
+    # (uv sync --extra cache). Varsayilan: extra kuruluysa orjson, degilse json
+    cache_serializer: str = "orjson" if find_spec("orjson") is not None else "json"
+    cache_compression: str | None = None # None | zlib | lz4
+    cache_compression_threshold_bytes: int = 1024 # bundan kucuk payload sikistirilmaz
+    # L1 (in-process) Cache Settings
+    local_cache_enabled: bool = False # Redis'in onunde worker ici LRU cache
+    local_cache_max_size: int = 1000 # worker basina maksimum kayit
+    local_cache_ttl_seconds: int = 30 # pub/sub mesaji kaybolursa azami bayatlik
+    cache_invalidation_channel: str = "cache:invalidate"
+    # Cache Stampede Settings
+    cache_lock_ttl_ms: int = 5000 # DB yuklemesi icin alinan lock'un azami omru
+    cache_lock_wait_seconds: float = 1.0 # lock'u alamayan worker'in bekleme suresi
+    cache_lock_poll_interval_seconds: float = 0.05
+    cache_xfetch_beta: float = 1.0 # >1 daha erken yeniler, <1 daha gec
+    cache_negative_ttl_seconds: int = 30 # olmayan task'lar icin tombstone suresi
+    cache_write_through_enabled: bool = True # yazma sonrasi detay cache'i tazelenir
+    # Task Search Settings
+    search_pg_config: str = "simple" # to_tsvector dili; "simple" kok bulma yapmaz
+    search_trigram_enabled: bool = False # pg_trgm ile alt dize (ILIKE) de index'ten
+    # Task List Total Settings
+    task_list_total_estimate_threshold: int = 0 # 0 = kapali; esik ustunde tahmini total
+    task_list_total_estimate_ttl_seconds: int = 300 # tahmini total'in azami yasi
+    # Task Batch Settings
+    task_batch_max_size: int = 100 # /tasks/batch isteginde en fazla bu kadar task
     #Rate Limiting Settings
     rate_limiting_requests: int= 100
     rate_limit_window_seconds: int = 60
+    rate_limit_list_cost: int = 2 # GET /tasks (liste) icin harcanan token
+    # GET /tasks?search=: full-text index sorgusu + skor siralamasi (FTS5/tsvector)
+    rate_limit_search_cost: int = 5
+    rate_limit_auth_cost: int = 5 # login/register (bcrypt) icin harcanan token
+    rate_limit_batch_cost: int = 10 # /tasks/batch (create/update/delete) icin token
+    rate_limit_mode: str = "redis" # "redis" (her istekte Lua) veya "hybrid" (lease)
+    rate_limit_lease_size: int = 10 # hybrid: worker'in tek seferde aldigi token sayisi
+    rate_limit_lease_ttl_seconds: float = 1.0 # hybrid: kullanilmayan lease omru
+    rate_limit_local_max_entries: int = 10000 # worker basina azami bucket sayisi
+    rate_limit_redis_timeout_seconds: float = 0.05 # Redis cagrisi icin sure butcesi
+    rate_limit_breaker_failure_threshold: int = 5
+    rate_limit_breaker_recovery_timeout: int = 10
+    rate_limit_fallback_share: float = 1.0 # degraded modda worker basina limit orani
     # Resilience Retry Settings
     retry_max_attempts: int = 3
     retry_min_wait_seconds: float = 1.0
@@ -1,33 +1,68 @@
+import asyncio
 import json
-from datetime import date, datetime
+import math
+import random
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any
 
 from redis.asyncio import Redis, from_url
 
 from app.config import settings
+from app.core.cache_keys import get_cache_lock_key
+from app.core.local_cache import LocalLRUCache
 from app.core.logging import get_logger
+from app.core.serializers import CacheCodec, build_codec
 
 logger = get_logger(__name__)
 
-# --- CUSTOM JSON ENCODER ---
-class DateTimeEncoder(json.JSONEncoder):
+@dataclass
+class CacheEntry:
     """
-    datetime ve date objelerini JSON'A serialize edebilen encoder.
+    Cache'teki bir deger ve erken yenileme (XFetch) icin meta verisi.
 
-    Kullanim:
-        json.dumps(data,cls=DateTimeEncoder)
+    Attributes:
+        value: Cache'lenen deger
+        delta: Degerin hesaplanmasi kac saniye surdu
+        expiry: Degerin dolacagi unix zamani (0 = bilinmiyor)
     """
-    def default(self, obj):
-        if isinstance(obj,datetime):
-            return obj.isoformat()
-        if isinstance(obj,date):
-            return obj.isoformat
-        return super().default(obj)
+    value: Any
+    delta: float = 0.0
+    expiry: float = 0.0
+
+# Lock'u sadece sahibi (ayni token'a sahip olan) silebilsin diye
+RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
 
 class RedisCache:
-    """Cache islemlerini yonetmek icin olusturulan class"""
-    def __init__(self):
+    """
+    Cache islemlerini yonetmek icin olusturulan class
+
+    Opsiyonel olarak her worker'da bir L1 (LocalLRUCache) tutar.
+    L1 tutarliligi Redis pub/sub ile saglanir: bir key silindiginde veya
+    generation arttirildiginda tum worker'lara invalidation mesaji gider.
+    """
+    def __init__(
+        self,
+        local_cache: LocalLRUCache | None = None,
+        codec: CacheCodec | None = None
+    ):
         self.redis : Redis | None = None
+        self.local = local_cache
+        # Degerlerin byte'a cevrilme stratejisi (json/orjson/msgpack + sikistirma)
+        self.codec = codec or build_codec()
+        # Kendi yayinladigimiz invalidation mesajlarini ayirt etmek icin
+        self.instance_id = uuid.uuid4().hex
+        self._listener_task: asyncio.Task | None = None
+        # Arka planda erken yenilenen key'ler (ayni key icin tek refresh)
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
 
     async def connect(self):
         """Redis'e asenkron baglanti kurar."""
@@ -35,7 +70,8 @@ class RedisCache:
             redis_url = f"redis://{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
             if settings.redis_password:
                 redis_url=f"redis://{settings.redis_password}@{settings.redis_host}:{settings.redis_port}/{settings.redis_db}"
-            self.redis = from_url(redis_url,encoding="utf-8",decode_responses= True)
+            # Binary baglanti: degerler codec ile cozulur, ara str donusumu yapilmaz
+            self.redis = from_url(redis_url,decode_responses= False)
 
             #Baglanti testi
             await self.redis.ping()
@@ -43,62 +79,725 @@ class RedisCache:
         except Exception as e:
             logger.error(f"Redis Connection Error: {e}")
             self.redis = None
+            return
+
+        if self.local is not None:
+            self.start_invalidation_listener()
 
     async def disconnect(self):
         """Redis baglantisini guvenli bir sekilde kapatir."""
+        await self.stop_invalidation_listener()
         if self.redis:
             await self.redis.close()
             logger.info("Disconnected From Redis")
-    
-    async def get(self, key : str)-> Any | None :
-        """Cache'den veri alir ve JSON'dan Python objesine donusturur."""
+
+    @property
+    def local_enabled(self) -> bool:
+        """
+        L1 sadece Redis bagliyken kullanilir; invalidation mesajlari ve
+        generation sayaci Redis olmadan worker'lar arasinda tasinamaz.
+        """
+        return self.local is not None and self.redis is not None
+
+    # --- L1 INVALIDATION (PUB/SUB) ---
+
+    def start_invalidation_listener(self) -> None:
+        """Invalidation kanalini dinleyen arka plan task'ini baslatir."""
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._listen_invalidations())
+
+    async def stop_invalidation_listener(self) -> None:
+        """Invalidation dinleyicisini durdurur."""
+        if self._listener_task is None:
+            return
+        self._listener_task.cancel()
+        try:
+            await self._listener_task
+        except asyncio.CancelledError:
+            pass
+        self._listener_task = None
+
+    async def _listen_invalidations(self) -> None:
+        """
+        Diger worker'lardan gelen invalidation mesajlarini L1'e uygular.
+
+        Baglanti koparsa yeniden abone olur. Aradaki surede mesaj kacirmis
+        olabilecegimiz icin yeniden baglanirken L1 tamamen temizlenir.
+        """
+        while self.redis is not None:
+            pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(settings.cache_invalidation_channel)
+                if self.local is not None:
+                    self.local.clear()
+                async for message in pubsub.listen():
+                    self._apply_invalidation(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Redis invalidation listener error: {e}")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def _apply_invalidation(self, data: Any) -> None:
+        """Tek bir invalidation mesajini L1'e uygular."""
+        if self.local is None or not data:
+            return
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid cache invalidation message: {data!r}")
+            return
+        # Kendi mesajimizi L1'e zaten uyguladik
+        if payload.get("origin") == self.instance_id:
+            return
+        for key in payload.get("keys", []):
+            self.local.delete(key)
+
+    async def _publish_invalidation(self, *keys: str) -> None:
+        """Key'lerin L1 kopyalarini tum worker'larda gecersiz kilar."""
+        if not self.local_enabled or not keys:
+            return
+        try:
+            message = json.dumps({"origin": self.instance_id, "keys": list(keys)})
+            await self.redis.publish(settings.cache_invalidation_channel, message)
+        except Exception as e:
+            logger.error(f"Redis PUBLISH invalidation error for {keys}: {e}")
+
+    # --- KEY/VALUE ISLEMLERI ---
+
+    @staticmethod
+    def _unwrap(data: Any) -> CacheEntry:
+        """
+        Redis'ten okunan zarfi CacheEntry'e cevirir.
+
+        Zarf formati: {"v": deger, "d": hesaplama_suresi, "e": bitis_zamani}
+        Zarfsiz eski kayitlar (deploy sirasinda) meta verisiz okunur.
+        """
+        if isinstance(data, dict) and data.keys() == {"v", "d", "e"}:
+            return CacheEntry(value=data["v"], delta=data["d"], expiry=data["e"])
+        return CacheEntry(value=data)
+
+    async def _get_entry(
+        self,
+        key: str,
+        decoder: Callable[[Any], Any] | None = None
+    ) -> CacheEntry | None:
+        """Degeri meta verisiyle (delta, expiry) birlikte okur."""
+        if decoder is not None and self.local_enabled:
+            local_entry = self.local.get(key)
+            if local_entry is not None:
+                return local_entry
+
         if not self.redis:
             return None
         try:
             value = await self.redis.get(key)
-            if value:
-                return json.loads(value)
-            return None
+            if not value:
+                return None
+            entry = self._unwrap(self.codec.decode(value))
         except Exception as e:
             logger.error(f"Redis GET error for key {key}: {e}")
             return None
+
+        if decoder is None:
+            return entry
+        # Tombstone (negatif cache) kayitlari decoder'dan gecmez
+        if entry.value is not None:
+            entry.value = decoder(entry.value)
+        if self.local_enabled:
+            remaining = max(entry.expiry - time.time(), 0) if entry.expiry else None
+            self.local.set(key, entry, ttl=remaining)
+        return entry
+
+    async def get(
+        self,
+        key : str,
+        decoder: Callable[[Any], Any] | None = None
+    )-> Any | None :
+        """
+        Cache'den veri alir ve JSON'dan Python objesine donusturur.
+
+        Args:
+            key: Cache key'i
+            decoder: Verilirse JSON'dan cozulen veri bununla donusturulur
+                (orn: Pydantic model'e) ve L1 aktifse donusturulmus hali
+                L1'de tutulur. Decoder verilmeyen key'ler L1'e hic girmez;
+                rate limiter gibi her istekte degisen veriler bu sayede
+                worker'lar arasinda tutarli kalir.
+        """
+        entry = await self._get_entry(key, decoder)
+        return entry.value if entry is not None else None
     
-    async def set(self, key:str, value:Any, ttl:int | None = None):
-        """Veriyi JSON'a cevirir ve belirtilen sureyle (TTL) Redis'e kaydeder."""
+    async def set(
+        self,
+        key:str,
+        value:Any,
+        ttl:int | None = None,
+        local_value: Any = None,
+        compute_time: float = 0.0,
+        broadcast: bool = False
+    ):
+        """
+        Veriyi JSON'a cevirir ve belirtilen sureyle (TTL) Redis'e kaydeder.
+
+        Deger; hesaplama suresi (delta) ve mutlak bitis zamani (expiry) ile
+        birlikte bir zarf icinde saklanir. get_or_compute bu bilgilerle
+        erken yenileme (XFetch) karari verir.
+
+        Args:
+            local_value: L1 aktifse bu key icin L1'e yazilacak (decode
+                edilmis) deger. get()'teki decoder ciktisiyla ayni tipte
+                olmalidir. None ise L1'e yazilmaz.
+            compute_time: Degerin uretilmesinin kac saniye surdugu.
+            broadcast: True ise diger worker'larin L1 kopyalari pub/sub ile
+                gecersiz kilinir. Mevcut degerin degistigi yazmalarda
+                (write-through) kullanilir; cache doldurmalarinda gerekmez.
+        """
+        # Eger TTL verilmediyse configdeki varsayilani kullan
+        expiration = ttl or settings.cache_ttl_seconds
+
         if not self.redis:
             return
+
+        expiry = time.time() + expiration
+        if local_value is not None and self.local_enabled:
+            self.local.set(
+                key,
+                CacheEntry(value=local_value, delta=compute_time, expiry=expiry),
+                ttl=expiration
+            )
         
         try:
-            # Eger TTL verilmediyse configdeki varsayilani kullan
-            expiration = ttl or settings.cache_ttl_seconds
-
-            
-            json_value = json.dumps(value, cls=DateTimeEncoder)
-            await self.redis.set(key, json_value, ex = expiration)
+            payload = self.codec.encode({"v": value, "d": compute_time, "e": expiry})
+            await self.redis.set(key, payload, ex = expiration)
             logger.debug(f"Cached key: {key} (TTL={expiration}s)")
         except Exception as e:
             logger.error(f"Redis SET error for key {key}: {e}")
+        if broadcast:
+            await self._publish_invalidation(key)
+
+    async def set_missing(
+        self, key: str, ttl: int | None = None, broadcast: bool = False
+    ):
+        """
+        Key icin negatif cache kaydi (tombstone) yazar.
+
+        Tombstone, degeri None olan bir zarftir. get_or_compute bunu hit
+        olarak gorur ve None dondurur; boylece olmayan kayitlar icin her
+        istekte DB'ye gidilmez.
+
+        Args:
+            ttl: Tombstone suresi (None ise cache_negative_ttl_seconds)
+            broadcast: set()'teki ile ayni anlamda
+        """
+        expiration = ttl or settings.cache_negative_ttl_seconds
+        if not self.redis:
+            return
+
+        expiry = time.time() + expiration
+        if self.local_enabled:
+            self.local.set(key, CacheEntry(value=None, expiry=expiry), ttl=expiration)
+
+        try:
+            payload = self.codec.encode({"v": None, "d": 0.0, "e": expiry})
+            await self.redis.set(key, payload, ex=expiration)
+            logger.debug(f"Cached tombstone for key: {key} (TTL={expiration}s)")
+        except Exception as e:
+            logger.error(f"Redis SET error for key {key}: {e}")
+        if broadcast:
+            await self._publish_invalidation(key)
+
+    # --- COKLU KEY ISLEMLERI (TEK ROUND TRIP) ---
+
+    async def get_many(
+        self,
+        keys: list[str],
+        decoder: Callable[[Any], Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Birden fazla key'i tek MGET ile okur.
+
+        Kismi hit semantigi: sadece bulunan key'ler sonuc dict'inde yer alir;
+        eksik veya cozulemeyen key'ler atlanir. Tombstone'lar None degeriyle
+        doner. L1 aktifse ve decoder verildiyse once L1'e bakilir, sadece
+        kalanlar Redis'e sorulur.
+
+        Returns:
+            dict: {key: deger} (sadece hit olanlar)
+        """
+        result: dict[str, Any] = {}
+        if not self.redis or not keys:
+            return result
+
+        missing = []
+        for key in keys:
+            if decoder is not None and self.local_enabled:
+                local_entry = self.local.get(key)
+                if local_entry is not None:
+                    result[key] = local_entry.value
+                    continue
+            missing.append(key)
+
+        if not missing:
+            return result
+        try:
+            values = await self.redis.mget(missing)
+        except Exception as e:
+            logger.error(f"Redis MGET error for {len(missing)} keys: {e}")
+            return result
+
+        for key, value in zip(missing, values, strict=True):
+            if value is None:
+                continue
+            try:
+                entry = self._unwrap(self.codec.decode(value))
+                # Tombstone (negatif cache) kayitlari decoder'dan gecmez
+                if decoder is not None and entry.value is not None:
+                    entry.value = decoder(entry.value)
+            except Exception as e:
+                logger.error(f"Redis MGET decode error for key {key}: {e}")
+                continue
+            if decoder is not None and self.local_enabled:
+                remaining = max(entry.expiry - time.time(), 0) if entry.expiry else None
+                self.local.set(key, entry, ttl=remaining)
+            result[key] = entry.value
+
+        logger.debug(f"Cache MGET: {len(result)}/{len(keys)} hits")
+        return result
+
+    async def set_many(
+        self,
+        items: dict[str, Any],
+        ttl: int | None = None,
+        local_values: dict[str, Any] | None = None,
+        nx: bool = False,
+        broadcast: bool = False
+    ):
+        """
+        Birden fazla key'i tek pipeline ile (SET EX) kaydeder.
+
+        Args:
+            items: {key: JSON-uyumlu deger}
+            ttl: Tum key'ler icin cache suresi
+            local_values: L1 aktifse key basina L1'e yazilacak decode
+                edilmis degerler (set()'teki local_value ile ayni anlamda)
+            nx: True ise sadece olmayan key'ler yazilir (SET NX). Toplu
+                isitma (warm) sirasinda write-through ile yazilmis daha
+                taze bir degerin ezilmemesi icin kullanilir.
+            broadcast: set()'teki ile ayni anlamda; tum key'ler tek
+                pub/sub mesajiyla gecersiz kilinir.
+        """
+        if not self.redis or not items:
+            return
+        expiration = ttl or settings.cache_ttl_seconds
+        expiry = time.time() + expiration
+
+        if local_values and self.local_enabled:
+            for key, local_value in local_values.items():
+                if nx and key in self.local:
+                    continue
+                entry = CacheEntry(value=local_value, expiry=expiry)
+                self.local.set(key, entry, ttl=expiration)
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.set(
+                    key,
+                    self.codec.encode({"v": value, "d": 0.0, "e": expiry}),
+                    ex=expiration,
+                    nx=nx
+                )
+            await pipe.execute()
+            logger.debug(
+                f"Cached {len(items)} keys in one pipeline (TTL={expiration}s)"
+            )
+        except Exception as e:
+            logger.error(f"Redis pipeline SET error for {len(items)} keys: {e}")
+        if broadcast:
+            await self._publish_invalidation(*items)
+
+    async def set_missing_many(
+        self, keys: list[str], ttl: int | None = None, broadcast: bool = False
+    ):
+        """
+        Birden fazla key icin tek pipeline ile tombstone yazar.
+
+        set_missing'in toplu hali; tombstone degeri None olan zarf oldugu
+        icin set_many uzerinden yazilir.
+        """
+        missing = dict.fromkeys(keys)
+        await self.set_many(
+            missing,
+            ttl=ttl or settings.cache_negative_ttl_seconds,
+            local_values=missing,
+            broadcast=broadcast
+        )
+
+    async def delete_many(self, keys: list[str]):
+        """Birden fazla key'i tek DEL ile siler (L1 kopyalari dahil)."""
+        if not self.redis or not keys:
+            return
+        if self.local_enabled:
+            for key in keys:
+                self.local.delete(key)
+        try:
+            await self.redis.delete(*keys)
+            logger.debug(f"Deleted {len(keys)} cache keys")
+        except Exception as e:
+            logger.error(f"Redis DELETE error for {len(keys)} keys: {e}")
+        await self._publish_invalidation(*keys)
+
+    async def get_raw(self, key: str) -> bytes | None:
+        """
+        Byte degeri codec'ten gecirmeden okur.
+
+        Hazir render edilmis HTTP body'leri gibi oldugu gibi sunulacak
+        veriler icin kullanilir. L1 aktifse once L1'e bakilir.
+        """
+        if not self.redis:
+            return None
+        if self.local_enabled:
+            local_value = self.local.get(key)
+            if local_value is not None:
+                return local_value
+        try:
+            value = await self.redis.get(key)
+        except Exception as e:
+            logger.error(f"Redis GET error for key {key}: {e}")
+            return None
+        if value is not None and self.local_enabled:
+            self.local.set(key, value)
+        return value
+
+    async def set_raw(self, key: str, value: bytes, ttl: int | None = None):
+        """Byte degeri codec'ten gecirmeden (zarfsiz) kaydeder."""
+        if not self.redis:
+            return
+        expiration = ttl or settings.cache_ttl_seconds
+        if self.local_enabled:
+            self.local.set(key, value, ttl=expiration)
+        try:
+            await self.redis.set(key, value, ex=expiration)
+            logger.debug(f"Cached raw key: {key} (TTL={expiration}s)")
+        except Exception as e:
+            logger.error(f"Redis SET error for key {key}: {e}")
 
     async def delete(self, key: str):
-        """Tek bir key'i siler"""
+        """Tek bir key'i siler (L1 kopyalari dahil)."""
         if not self.redis:
             return
+        if self.local_enabled:
+            self.local.delete(key)
         try:
             await self.redis.delete(key)
             logger.debug(f"Deleted cache key: {key}")
         except Exception as e:
             logger.error(f"Redis DELETE error for key {key} : {e}")
+        await self._publish_invalidation(key)
+
+    async def get_generation(self, key: str) -> int:
+        """
+        Namespace generation sayacini okur.
+
+        L1 aktifse sayac L1'de tutulur; degistiginde pub/sub mesajiyla
+        silinir. Sayac hic olusmamissa veya Redis yoksa 0 doner.
+        """
+        if not self.redis:
+            return 0
+        if self.local_enabled:
+            local_value = self.local.get(key)
+            if local_value is not None:
+                return local_value
+        try:
+            value = await self.redis.get(key)
+            generation = int(value) if value else 0
+        except Exception as e:
+            logger.error(f"Redis GET generation error for key {key}: {e}")
+            return 0
+        if self.local_enabled:
+            self.local.set(key, generation)
+        return generation
 
-    async def delete_pattern(self, pattern: str):
-        """Pattern'e uyan tum anahtarlari siler(invalidation icin gerekli)"""
+    async def bump_generation(self, key: str) -> int | None:
+        """
+        Namespace generation sayacini tek bir INCR ile arttirir.
+
+        Eski generation'a ait tum key'ler bir daha okunmaz ve TTL
+        dolunca Redis tarafindan silinir. Keyspace buyuklugunden
+        bagimsiz olarak O(1) calisir.
+
+        Not: Sayaca TTL verilmez. Sayac silinip 0'dan baslarsa hala
+        yasayan eski generation key'leri tekrar gorunur hale gelebilir.
+        """
         if not self.redis:
+            return None
+        try:
+            generation = await self.redis.incr(key)
+            logger.debug(f"Bumped cache generation: {key} -> {generation}")
+        except Exception as e:
+            logger.error(f"Redis INCR error for key {key}: {e}")
+            # Diger worker'lara haber veremiyoruz; en azindan kendi L1'imiz
+            # bayat kalmasin
+            if self.local_enabled:
+                self.local.clear()
+            return None
+        if self.local_enabled:
+            self.local.set(key, generation)
+        await self._publish_invalidation(key)
+        return generation
+
+    @asynccontextmanager
+    async def lock(self, key: str, ttl_ms: int) -> AsyncIterator[bool]:
+        """
+        Worker'lar arasi kisa sureli dagitik lock (SET NX PX).
+
+        Cache stampede'i onlemek icin kullanilir: lock'u alan worker DB'den
+        yukler, digerleri cache'in dolmasini bekler (bkz. wait_for).
+        Lock TTL ile kendiliginden duser, boylece cokmus bir worker
+        digerlerini kilitli birakmaz.
+
+        Kullanim:
+            async with redis_cache.lock("lock:key", ttl_ms=5000) as acquired:
+                if not acquired:
+                    ...
+
+        Redis yoksa veya hata verirse fail-open davranir ve True yield eder.
+        """
+        token = uuid.uuid4().hex
+        owned = False
+        if self.redis:
+            try:
+                owned = bool(await self.redis.set(key, token, nx=True, px=ttl_ms))
+            except Exception as e:
+                logger.error(f"Redis LOCK error for key {key}: {e}")
+                # Fail-open: lock alinamiyorsa yukleme engellenmemeli
+                yield True
+                return
+
+            try:
+                yield owned
+            finally:
+                if owned:
+                    try:
+                        await self.redis.eval(RELEASE_LOCK_SCRIPT, 1, key, token)
+                    except Exception as e:
+                        logger.error(f"Redis UNLOCK error for key {key}: {e}")
+        else:
+            yield True
+
+    async def wait_for(
+        self,
+        key: str,
+        timeout: float,
+        interval: float = 0.05,
+        decoder: Callable[[Any], Any] | None = None
+    ) -> Any | None:
+        """
+        Key cache'e yazilana kadar (en fazla timeout saniye) bekler.
+
+        Returns:
+            Cache degeri veya sure dolarsa None
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            value = await self.get(key, decoder=decoder)
+            if value is not None:
+                return value
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.redis:
+                return None
+            await asyncio.sleep(min(interval, remaining))
+
+    # --- ERKEN YENILEME (XFETCH) ---
+
+    @staticmethod
+    def should_refresh_early(
+        entry: CacheEntry,
+        beta: float,
+        now: float | None = None
+    ) -> bool:
+        """
+        XFetch (probabilistic early expiration) karari.
+
+        Kayit, bitis zamanina yaklastikca artan olasilikla erken yenilenir:
+            now - delta * beta * ln(rand()) >= expiry
+        delta (hesaplama suresi) buyudukce yenileme daha erken baslar.
+        Meta verisi olmayan kayitlar sadece TTL ile dolar.
+        """
+        if not entry.expiry or not entry.delta:
+            return False
+        now = now if now is not None else time.time()
+        # random() 0 donebilir, log(0) tanimsiz oldugu icin 1 - random()
+        gap = entry.delta * beta * math.log(1.0 - random.random())
+        return now - gap >= entry.expiry
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        encoder: Callable[[Any], Any],
+        decoder: Callable[[Any], Any],
+        ttl: int | None = None,
+        refresh: Callable[[], Awaitable[Any]] | None = None,
+        lock_ttl_ms: int | None = None,
+        beta: float | None = None,
+        negative_ttl: int | None = None
+    ) -> Any:
+        """
+        Degeri cache'den dondurur, yoksa hesaplayip cache'e yazar.
+
+        Hit durumunda kayit XFetch'e gore erken yenilenmeye aday ise
+        yenileme arka planda yapilir ve istek bekletilmez. Boylece sik
+        okunan key'ler neredeyse hic miss almaz.
+
+        Args:
+            key: Cache key'i
+            compute: Miss durumunda degeri ureten fonksiyon
+            encoder: Degeri JSON-serializable hale getirir
+            decoder: encoder'in tersi (L1 ve hit'lerde kullanilir)
+            ttl: Cache suresi (None ise config'deki varsayilan)
+            refresh: Arka plan yenilemesi icin kullanilacak fonksiyon.
+                Istek kapsamli kaynaklara (DB session vb.) baglanmamalidir.
+                None ise compute kullanilir.
+            lock_ttl_ms: Verilirse miss/yenileme sirasinda worker'lar arasi
+                lock alinir (cache stampede korumasi).
+            beta: XFetch katsayisi; >1 daha erken, <1 daha gec yeniler.
+            negative_ttl: Verilirse compute'un None dondurdugu sonuclar bu
+                sureyle tombstone olarak cache'lenir ve sonraki isteklerde
+                None dondurulur (negatif cache). None ise cache'lenmez.
+        """
+        beta = beta if beta is not None else settings.cache_xfetch_beta
+
+        entry = await self._get_entry(key, decoder)
+        if entry is not None:
+            if self.should_refresh_early(entry, beta):
+                self._schedule_refresh(
+                    key, refresh or compute, encoder, ttl, lock_ttl_ms, negative_ttl
+                )
+            return entry.value
+
+        if lock_ttl_ms is None:
+            return await self._compute_and_set(key, compute, encoder, ttl, negative_ttl)
+
+        async with self.lock(get_cache_lock_key(key), lock_ttl_ms) as acquired:
+            if not acquired:
+                value = await self.wait_for(
+                    key,
+                    timeout=settings.cache_lock_wait_seconds,
+                    interval=settings.cache_lock_poll_interval_seconds,
+                    decoder=decoder
+                )
+                if value is not None:
+                    logger.debug(f"Cache filled by another worker for key: {key}")
+                    return value
+                logger.debug(f"Cache lock wait timed out for key: {key}")
+            return await self._compute_and_set(key, compute, encoder, ttl, negative_ttl)
+
+    async def _compute_and_set(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        encoder: Callable[[Any], Any],
+        ttl: int | None,
+        negative_ttl: int | None = None
+    ) -> Any:
+        """Degeri hesaplar, suresini olcer ve cache'e yazar."""
+        start = time.perf_counter()
+        value = await compute()
+        compute_time = time.perf_counter() - start
+        if value is None:
+            if negative_ttl:
+                await self.set_missing(key, ttl=negative_ttl)
+            return None
+        await self.set(
+            key, encoder(value), ttl=ttl, local_value=value, compute_time=compute_time
+        )
+        return value
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        refresh: Callable[[], Awaitable[Any]],
+        encoder: Callable[[Any], Any],
+        ttl: int | None,
+        lock_ttl_ms: int | None,
+        negative_ttl: int | None = None
+    ) -> None:
+        """Key icin arka plan yenilemesi baslatir (zaten calisiyorsa atlar)."""
+        if key in self._refresh_tasks:
             return
+        task = asyncio.create_task(
+            self._refresh(key, refresh, encoder, ttl, lock_ttl_ms, negative_ttl)
+        )
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+
+    async def _refresh(
+        self,
+        key: str,
+        refresh: Callable[[], Awaitable[Any]],
+        encoder: Callable[[Any], Any],
+        ttl: int | None,
+        lock_ttl_ms: int | None,
+        negative_ttl: int | None = None
+    ) -> None:
+        """Arka plan yenilemesi; baska worker yeniliyorsa hic beklemeden cikar."""
         try:
-            keys = await self.redis.keys(pattern)
-            if keys:
-                await self.redis.delete(*keys)
-                logger.debug(f"Deleted{len(keys)} keys with pattern: {pattern}")
+            if lock_ttl_ms is None:
+                await self._compute_and_set(key, refresh, encoder, ttl, negative_ttl)
+                return
+            async with self.lock(get_cache_lock_key(key), lock_ttl_ms) as acquired:
+                if acquired:
+                    await self._compute_and_set(
+                        key, refresh, encoder, ttl, negative_ttl
+                    )
+                    logger.debug(f"Refreshed cache key early: {key}")
+        except Exception as e:
+            logger.warning(f"Background cache refresh failed for key {key}: {e}")
+
+    async def delete_pattern(self, pattern: str, batch_size: int = 500):
+        """
+        Pattern'e uyan tum anahtarlari siler.
+
+        KEYS yerine SCAN kullanir, boylece Redis'i bloklamaz. Yine de
+        keyspace boyutuyla orantili calisir; siklikla yapilan invalidation
+        icin bump_generation tercih edilmelidir.
+        """
+        if not self.redis:
+            return
+        try:
+            deleted = 0
+            batch: list[str] = []
+            async for key in self.redis.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += await self.redis.unlink(*batch)
+                    batch.clear()
+            if batch:
+                deleted += await self.redis.unlink(*batch)
+            if deleted:
+                logger.debug(f"Deleted {deleted} keys with pattern: {pattern}")
         except Exception as e:
             logger.error(f"Redis DELETE PATTERN error for {pattern}:{e}")
 
-redis_cache = RedisCache()
\ No newline at end of file
+def _build_codec() -> CacheCodec:
+    """Ayarlara gore cache codec'ini olusturur."""
+    return build_codec(
+        serializer=settings.cache_serializer,
+        compression=settings.cache_compression,
+        threshold=settings.cache_compression_threshold_bytes,
+    )
+
+def _build_local_cache() -> LocalLRUCache | None:
+    """Ayarlara gore L1 cache olusturur (kapaliysa None)."""
+    if not settings.local_cache_enabled:
+        return None
+    return LocalLRUCache(
+        max_size=settings.local_cache_max_size,
+        ttl_seconds=settings.local_cache_ttl_seconds,
+    )
+
+redis_cache = RedisCache(local_cache=_build_local_cache(), codec=_build_codec())
\ No newline at end of file
@@ -1,48 +1,169 @@
 """
 Cache key'lerini olusturmak icin yardimci fonksiyonlar.
 
+Namespace versiyonlama:
+    Her kullanicinin bir generation (nesil) sayaci vardir:
+        tasks:user:{user_id}:gen -> 7
+    Liste key'leri bu sayaci icerir:
+        tasks:user:{user_id}:v7:list:...
+    Invalidation icin sayaci INCR etmek yeterlidir; eski nesildeki
+    key'ler artik okunmaz ve TTL dolunca kendiliginden silinir.
+
+    Detay key'leri generation icermez; yazma islemlerinde dogrudan
+    guncellenir (write-through) veya silinir.
 """
 
+def get_task_generation_key(user_id: int) -> str:
+    """
+    Kullanicinin cache generation sayacinin key'ini olusturur.
+
+    Format: tasks:user:{user_id}:gen
+    Ornek: get_task_generation_key(1)
+    ->"tasks:user:1:gen"
+    """
+    return f"tasks:user:{user_id}:gen"
+
 def get_task_list_cache_key(
         user_id : int,
         status : str | None = None,
         priority : str | None = None,
         search : str | None = None,
-        page : int = 1
+        page : int = 1,
+        generation : int = 0,
+        page_size : int = 10,
+        cursor : str | None = None
 ) -> str:
     """
     Docstring for get_task_list_cache_key
     Task listesi cache key'i olusturur
-    Format: task:user {user_id};list{status}{priority}{search}{page}
-    Ornek: get_task_list_cache_key(1,"pending","high",None,1)
-    ->"tasks:user:1:list:pending:high::1"
+    Format: tasks:user:{user_id}:v{generation}:list:
+            {status}:{priority}:{search}:{page}:{page_size}
+    Ornek: get_task_list_cache_key(1,"pending","high",None,1,generation=3)
+    ->"tasks:user:1:v3:list:pending:high::1:10"
     """
+    return f"tasks:user:{user_id}:v{generation}:list:" + _list_suffix(
+        status, priority, search, page, page_size, cursor
+    )
+
+def get_task_list_body_cache_key(
+        user_id : int,
+        status : str | None = None,
+        priority : str | None = None,
+        search : str | None = None,
+        page : int = 1,
+        generation : int = 0,
+        page_size : int = 10,
+        cursor : str | None = None
+) -> str:
+    """
+    Task listesinin hazir render edilmis HTTP body'si icin cache key'i.
+
+    Format: tasks:user:{user_id}:v{generation}:body:
+            {status}:{priority}:{search}:{page}:{page_size}
+    Ornek: get_task_list_body_cache_key(1,None,None,None,2,generation=3,page_size=20)
+    ->"tasks:user:1:v3:body:all:all::2:20"
+    """
+    return f"tasks:user:{user_id}:v{generation}:body:" + _list_suffix(
+        status, priority, search, page, page_size, cursor
+    )
+
+def _list_suffix(
+        status: str | None,
+        priority: str | None,
+        search: str | None,
+        page: int,
+        page_size: int,
+        cursor: str | None = None
+) -> str:
+    """Liste key'lerinin filtre/sayfa kismini olusturur (cursor varsa sona eklenir)."""
     # None degerlerini all yapalim ki key de bosluk olmasin
     status_str = status or "all"
     priority_str = priority or "all"
     search_str = search or ""
-    
-    return f"tasks:user:{user_id}:list:{status_str}:{priority_str}:{search_str}:{page}"
+
+    suffix = f"{status_str}:{priority_str}:{search_str}:{page}:{page_size}"
+    return f"{suffix}:c:{cursor}" if cursor is not None else suffix
+
+def get_task_list_total_cache_key(
+        user_id: int,
+        status: str | None = None,
+        priority: str | None = None,
+        search: str | None = None
+) -> str:
+    """
+    Liste filtresinin (sayfadan bagimsiz) toplam kayit sayisi icin key.
+
+    Generation icermez: yazmalarla invalidate edilmez, TTL ile yenilenir.
+    Bu yuzden sadece tahmini total (total_is_estimate) icin kullanilir.
+
+    Format: tasks:user:{user_id}:total:{status}:{priority}:{search}
+    Ornek: get_task_list_total_cache_key(1, "pending")
+    ->"tasks:user:1:total:pending:all:"
+    """
+    return (
+        f"tasks:user:{user_id}:total:"
+        f"{status or 'all'}:{priority or 'all'}:{search or ''}"
+    )
 
 def get_task_detail_cache_key(user_id: int,task_id: int) -> str:
     """
     Docstring for get_task_detail_cache_key
-    
+
     Task detay cache key'i olusturur.
-    Format: task:user:{user_id}:detail:{task_id}
+    Format: tasks:user:{user_id}:detail:{task_id}
     ornek:
     get_task_detail_cache_key(1, 5)
     ->"tasks:user:1:detail:5"
-    
+
+    Not: Liste key'lerinden farkli olarak generation icermez; create/update
+    sonrasi taze deger bu key'e yazilir, delete'te key silinir.
     """
     return f"tasks:user:{user_id}:detail:{task_id}"
 
+def get_cache_lock_key(cache_key: str) -> str:
+    """
+    Bir cache key'ini dolduran worker'in tuttugu lock key'i.
+
+    Format: lock:{cache_key}
+    ornek:
+    get_cache_lock_key("tasks:user:1:v3:list:all:all::1")
+    ->"lock:tasks:user:1:v3:list:all:all::1"
+    """
+    return f"lock:{cache_key}"
+
+def get_user_principal_cache_key(user_id: int) -> str:
+    """
+    Dogrulanmis kullanici (principal) cache key'i.
+
+    Format: users:{user_id}:principal
+    ornek:
+    get_user_principal_cache_key(1)
+    ->"users:1:principal"
+    """
+    return f"users:{user_id}:principal"
+
+def get_revoked_token_key(jti: str) -> str:
+    """
+    Iptal edilmis token (denylist) key'i. TTL'i token'in kalan omru kadardir.
+
+    Format: auth:revoked:{jti}
+    ornek:
+    get_revoked_token_key("3f2a...")
+    ->"auth:revoked:3f2a..."
+    """
+    return f"auth:revoked:{jti}"
+
+def get_revoked_token_pattern() -> str:
+    """Tum iptal edilmis token key'lerini eslestiren pattern (filtre kurulumu icin)."""
+    return "auth:revoked:*"
+
 def get_task_user_pattern(user_id: int)-> str:
     """
-    Belirli bir kullanicinin tum task cache'lerini silmek icin pattern.
+    Belirli bir kullanicinin tum task cache'lerini eslestiren pattern.
     Format: tasks:user:{user_id}:*
-    Kullanim:
-        await cache_delete_pattern(get_task_user_pattern(1))
-        ->user:1'in tum cache'leri silinir.'
+
+    Not: TaskService artik invalidation icin generation sayacini kullanir
+    (bkz. get_task_generation_key). Bu pattern sadece bakim/temizlik
+    islemlerinde SCAN ile kullanilmak icin duruyor.
     """
-    return f"tasks:user:{user_id}:*"
\ No newline at end of file
+    return f"tasks:user:{user_id}:*"
@@ -11,9 +11,8 @@ tum log'larda ve response header'larda tasir.
 import uuid
 from contextvars import ContextVar
 from typing import Optional
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import logging
 
 logger = logging.getLogger(__name__)
@@ -53,7 +52,7 @@ def generate_correlation_id() -> str:
     """
     return str(uuid.uuid4())
 
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
+class CorrelationIdMiddleware:
     """
     Her HTTP istegine correlation ID atar.
 
@@ -61,49 +60,60 @@ class CorrelationIdMiddleware(BaseHTTPMiddleware):
     - Yoksa yeni bir ID uretir.
     - Response header'ina ID'yi ekler.
     - Context variable'a ID'yi kaydeder.(log'lar icin)
+
+    Saf ASGI middleware'dir; header, "send" sarmalanarak response
+    baslangicina eklenir (streaming response'lar da desteklenir).
     """
-    async def dispatch(
-        self,
-        request:Request,
-        call_next: RequestResponseEndpoint
-    ) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Request'i isler ve correlation ID yonetimini yapar.
 
         Args:
-            request: Gelen HTTP istegi
-            call_next: Sonraki middleware/endpoint
-
-        Returns:
-            Response: HTTP yaniti (correlation ID header'i ile gonderir.)
+            scope: ASGI scope
+            receive: ASGI receive kanali
+            send: ASGI send kanali (correlation ID header'i eklenerek sarmalanir)
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Gelen header'dan ID al veya yeni uret
-        correlation_id = request.headers.get(
+        request_headers = Headers(scope=scope)
+        correlation_id = request_headers.get(
             CORRELATION_ID_HEADER
-        ) or request.headers.get(
+        ) or request_headers.get(
             REQUEST_ID_HEADER
         ) or generate_correlation_id()
-    
-        # Context'e kaydet (loglar bu degeri kullanabilsin diye)
-        set_correlation_id(correlation_id)
+
+        # Context'e kaydet (loglar bu degeri kullanabilsin diye).
+        # Istek bitince eski degere donulur; ayni task'ta calisan sonraki
+        # isler (orn. testlerde in-process client) bu ID'yi devralmaz.
+        token = correlation_id_ctx.set(correlation_id)
 
         # Debug log
         logger.debug(
-            f"Request started: {request.method} {request.url.path}",
+            f"Request started: {scope['method']} {scope['path']}",
             extra = {"correlation_id": correlation_id}
         )
 
-        # Request'e isle
-        response = await call_next(request)
+        async def send_with_correlation_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Response header'a ekle
+                MutableHeaders(scope=message)[CORRELATION_ID_HEADER] = correlation_id
 
-        # Response header'a ekle
-        response.headers[CORRELATION_ID_HEADER] = correlation_id
+                # Debug log
+                logger.debug(
+                    f"Request Completed: {scope['method']} {scope['path']} "
+                    f"- Status: {message['status']}",
+                    extra={"correlation_id": correlation_id}
+                )
+            await send(message)
 
-        # Debug log
-        logger.debug(
-            f"Request Completed: {request.method} {request.url.path} "
-            f"- Status: {response.status_code}",
-            extra={"correlation_id": correlation_id}
-        )
-        
-        return response
\ No newline at end of file
+        # Request'e isle
+        try:
+            await self.app(scope, receive, send_with_correlation_id)
+        finally:
+            correlation_id_ctx.reset(token)
@@ -2,6 +2,7 @@
 Task event publisher
 Event'leri RabbitMQ'ya publish eden is mantigi.
 """
+from collections.abc import Sequence
 from datetime import datetime, UTC
 from app.core.correlation import get_correlation_id
 from app.core.logging import get_logger
@@ -144,6 +145,57 @@ class TaskEventPublisher:
             f"Published TaskCompleted event for tas {task_id}",
             extra= {"correlation_id":event.correlation_id }
         )
+    async def publish_batch(
+        self,
+        user_id: int,
+        events: Sequence[tuple[TaskEventType, int, dict | None]]
+    ) -> None:
+        """
+        Toplu islemlerin event'lerini tek seferde publish eder.
+
+        Her task icin yine ayri bir event (ayni routing key ve format)
+        gonderilir; consumer'lar degismez. Sadece publish'ler tek tek
+        beklenmez.
+
+        Ne zaman kullanilir?
+        - TaskService.create_many/update_many/delete_many sonrasinda
+
+        Args:
+            user_id: Islemi yapan kullanici ID'si
+            events: (event tipi, task ID'si, task verisi) uclulari
+        """
+        if not events:
+            return
+        correlation_id = get_correlation_id()
+        timestamp = datetime.now(UTC)
+        messages = [
+            (
+                event_type.value,
+                TaskEvent(
+                    event_type=event_type,
+                    task_id=task_id,
+                    user_id=user_id,
+                    timestamp=timestamp,
+                    correlation_id=correlation_id,
+                    data=task_data
+                ).to_dict()
+            )
+            for event_type, task_id, task_data in events
+        ]
+        try:
+            await self.client.publish_many(messages, correlation_id=correlation_id)
+        except Exception as e:
+            #Event publish hatasi ana islemi etkilememeli
+            logger.error(
+                f"Failed to publish {len(messages)} batch events: {e}",
+                extra={"correlation_id":correlation_id}
+            )
+            return
+        logger.info(
+            f"Published {len(messages)} batch events for user {user_id}",
+            extra={"correlation_id":correlation_id}
+        )
+
     async def _publish(self, event: TaskEvent) -> None:
         """
         Event'i RabbitMQ'ya gonderir.
@@ -27,6 +27,15 @@ class TaskBadRequestException(AppException):
         )
 
 
+class TaskBatchTooLargeException(AppException):
+    def __init__(self, size: int, max_size: int):
+        super().__init__(
+            status_code=413,
+            error_code="TASK_BATCH_TOO_LARGE",
+            message=f"Batch of {size} tasks exceeds the limit of {max_size}",
+        )
+
+
 class ValidationException(AppException):
     def __init__(self, message: str):
         super().__init__(
@@ -14,6 +14,8 @@ from app.config import settings
 from app.core.logging import get_logger
 from app.db.database import async_session_maker
 from app.core.cache import redis_cache
+from app.core.rate_limiter import rate_limiter
+from app.core.security import bcrypt_bulkhead
 from app.models.health import HealthStatus, HealthCheckResult
 logger = get_logger(__name__)
 
@@ -174,6 +176,143 @@ class RedisHealthCheck(BaseHealthCheck):
                 message=str(e)
             )
 
+class LocalCacheHealthCheck(BaseHealthCheck):
+    """
+    Worker ici (L1) cache istatistiklerini raporlar.
+
+    Hit/miss/eviction sayaclari L1 boyutunu worker basina ayarlamak icin
+    kullanilir. L1 kapaliysa sadece durum bilgisi doner.
+
+    Args:
+        name: Check adi
+        timeout: Maksimum kontrol suresi
+        critical: Kritik mi (L1 olmadan da calisabiliriz)
+    """
+    def __init__(
+        self,
+        name: str = "local_cache",
+        timeout: float = 1.0,
+        critical: bool = False
+    ):
+        super().__init__(name, timeout, critical)
+
+    async def check(self) -> HealthCheckResult:
+        """
+        L1 cache istatistiklerini dondurur.
+
+        Returns:
+            HealthCheckResult: L1 durumu ve sayaclar
+        """
+        if redis_cache.local is None:
+            return HealthCheckResult(
+                name=self.name,
+                status=HealthStatus.HEALTHY,
+                message="Local cache disabled",
+                details={"enabled": False}
+            )
+
+        active = redis_cache.local_enabled
+        return HealthCheckResult(
+            name=self.name,
+            status=HealthStatus.HEALTHY,
+            message=(
+                "Local cache OK" if active
+                else "Local cache inactive (Redis not connected)"
+            ),
+            details={"enabled": True, "active": active, **redis_cache.local.get_stats()}
+        )
+
+class RateLimiterHealthCheck(BaseHealthCheck):
+    """
+    Rate limiter'in hangi modda calistigini raporlar.
+
+    Redis'e ulasilamiyor veya breaker aciksa limiter worker ici yedek
+    bucket'larla (yaklasik limit) calisir; bu durum DEGRADED olarak doner.
+
+    Args:
+        name: Check adi
+        timeout: Maksimum kontrol suresi
+        critical: Kritik mi (yedek modda da trafik alabiliriz)
+    """
+    def __init__(
+        self,
+        name: str = "rate_limiter",
+        timeout: float = 1.0,
+        critical: bool = False
+    ):
+        super().__init__(name, timeout, critical)
+
+    async def check(self) -> HealthCheckResult:
+        """
+        Limiter modunu ve breaker durumunu dondurur.
+
+        Returns:
+            HealthCheckResult: HEALTHY (Redis) veya DEGRADED (lokal yedek)
+        """
+        stats = rate_limiter.get_stats()
+        if stats["degraded"]:
+            return HealthCheckResult(
+                name=self.name,
+                status=HealthStatus.DEGRADED,
+                message=(
+                    "Rate limiter running on local fallback buckets "
+                    "(approximate limits)"
+                ),
+                details=stats
+            )
+
+        return HealthCheckResult(
+            name=self.name,
+            status=HealthStatus.HEALTHY,
+            message="Rate limiter OK",
+            details=stats
+        )
+
+class PasswordHashingHealthCheck(BaseHealthCheck):
+    """
+    bcrypt thread pool'unun doluluk ve kuyruk derinligini raporlar.
+
+    Slot bekleyen istek sayisi pool boyutunu asarsa login/register
+    gecikmeleri artiyor demektir; bu durum DEGRADED olarak doner.
+
+    Args:
+        name: Check adi
+        timeout: Maksimum kontrol suresi
+        critical: Kritik mi (sadece auth endpoint'lerini etkiler)
+    """
+    def __init__(
+        self,
+        name: str = "password_hashing",
+        timeout: float = 1.0,
+        critical: bool = False
+    ):
+        super().__init__(name, timeout, critical)
+
+    async def check(self) -> HealthCheckResult:
+        """
+        bcrypt bulkhead istatistiklerini dondurur.
+
+        Returns:
+            HealthCheckResult: HEALTHY veya DEGRADED (kuyruk pool'dan derin)
+        """
+        stats = bcrypt_bulkhead.get_stats()
+        if stats["waiting_count"] > stats["max_concurrent"]:
+            return HealthCheckResult(
+                name=self.name,
+                status=HealthStatus.DEGRADED,
+                message=(
+                    f"bcrypt queue is backing up ({stats['waiting_count']} waiting)"
+                ),
+                details=stats
+            )
+
+        return HealthCheckResult(
+            name=self.name,
+            status=HealthStatus.HEALTHY,
+            message="Password hashing pool OK",
+            details=stats
+        )
+
 class DiskHealthCheck(BaseHealthCheck):
     """
     Disk Alani kontrolu.
@@ -317,4 +456,7 @@ class HealthChecker:
 health_checker = HealthChecker()
 health_checker.add_check(DatabaseHealthCheck())
 health_checker.add_check(RedisHealthCheck())
+health_checker.add_check(LocalCacheHealthCheck())
+health_checker.add_check(RateLimiterHealthCheck())
+health_checker.add_check(PasswordHashingHealthCheck())
 health_checker.add_check(DiskHealthCheck())
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""
+In-process (L1) cache.
+
+Her worker kendi belleginde sinirli boyutlu, TTL'li bir LRU cache tutar.
+RedisCache'in onune konur; hit durumunda Redis round trip'i, JSON parse
+ve Pydantic validation maliyeti tamamen ortadan kalkar.
+
+Worker'lar arasi tutarlilik RedisCache tarafinda pub/sub ile saglanir
+(bkz. RedisCache.start_invalidation_listener).
+"""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class LocalCacheStats:
+    """L1 cache istatistikleri (worker basina boyutlandirma icin)."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+class LocalLRUCache:
+    """
+    TTL destekli, boyutu sinirli LRU cache.
+
+    Kullanim:
+        cache = LocalLRUCache(max_size=1000, ttl_seconds=30)
+        cache.set("key", value)
+        cache.get("key")
+
+    Args:
+        max_size: Maksimum kayit sayisi, asilinca en eski kullanilan atilir.
+        ttl_seconds: Kayitlarin varsayilan yasam suresi.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl_seconds: float = 30.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires_at, value)
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._stats = LocalCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        """Key suresi dolmamis olarak mevcut mu (istatistikleri etkilemez)."""
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def get(self, key: str) -> Any | None:
+        """Key'i dondurur, yoksa veya suresi dolduysa None doner."""
+        entry = self._data.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+
+        # En son kullanilan olarak isaretle
+        self._data.move_to_end(key)
+        self._stats.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Key'i kaydeder, kapasite asilirsa en eski kaydi atar."""
+        expiration = ttl if ttl is not None else self.ttl_seconds
+        # L1 hicbir zaman kendi TTL'inden uzun tutmaz
+        expiration = min(expiration, self.ttl_seconds)
+
+        self._data[key] = (time.monotonic() + expiration, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self._stats.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        """Key'i siler, silindiyse True doner."""
+        if self._data.pop(key, None) is None:
+            return False
+        self._stats.invalidations += 1
+        return True
+
+    def clear(self) -> None:
+        """Tum kayitlari siler."""
+        self._stats.invalidations += len(self._data)
+        self._data.clear()
+
+    def get_stats(self) -> dict:
+        """Istatistikleri dondur."""
+        lookups = self._stats.hits + self._stats.misses
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self._stats.hits,
+            "misses": self._stats.misses,
+            "hit_ratio": round(self._stats.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self._stats.evictions,
+            "expirations": self._stats.expirations,
+            "invalidations": self._stats.invalidations,
+        }
@@ -4,6 +4,7 @@ Asenkron mesajlasma islemleri icin kullanilir.
 Event publishing ve consuming islemlerini yonetir.
 """
 
+import asyncio
 import json
 import logging
 from types import coroutine
@@ -112,6 +113,48 @@ class RabbitMQClient:
             extra={"correlation_id":correlation_id}
         )
     
+    async def publish_many(
+        self,
+        messages: list[tuple[str, dict[str, Any]]],
+        correlation_id: str | None = None
+    ) -> None:
+        """
+        Birden fazla mesaji ayni anda publish eder.
+
+        Mesajlar tek tek beklenmez; hepsi kanala birlikte yazilir ve
+        (publisher confirm'leri dahil) birlikte beklenir.
+
+        Args:
+            messages: (routing_key, mesaj) ciftleri
+            correlation_id: Request tracing icin correlation ID
+
+        Raises:
+            RuntimeError: Baglanti kurulmamissa
+        """
+        if not self.exchange:
+            raise RuntimeError(
+                "RabbitMQ connection not established. Call connect() first."
+            )
+
+        publishes = []
+        for routing_key, message in messages:
+            if correlation_id:
+                message["correlation_id"] = correlation_id
+            amqp_message = Message(
+                body=json.dumps(message, default=str).encode(),
+                content_type="application/json",
+                correlation_id=correlation_id
+            )
+            publishes.append(
+                self.exchange.publish(amqp_message, routing_key=routing_key)
+            )
+        await asyncio.gather(*publishes)
+
+        logger.debug(
+            f"Published {len(messages)} messages",
+            extra={"correlation_id":correlation_id}
+        )
+
     async def health_check() -> bool:
         """
         RabbitMQ baglanti durumunu kontrol eder.
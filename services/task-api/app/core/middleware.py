@@ -5,26 +5,41 @@ FastAPI middleware'lerini barindirir.(amaci kullaniciyi etiketlemektir.)
 
 Calisma prensibi:
 - Request -> Middleware -> Endpoint -> Middleware -> Response
+
+Middleware'ler saf ASGI olarak yazilmistir (BaseHTTPMiddleware degil):
+istek basina ek task ve memory stream olusmaz, streaming response'lar
+bozulmaz. Header'lar "send" sarmalanarak http.response.start mesajina
+eklenir.
 """
+import math
+
 from fastapi import Request,status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from app.core.rate_limiter import rate_limiter
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.config import settings
+from app.core.rate_limiter import RateLimiter, rate_limiter
 from app.core.logging import get_logger
+from app.core.security import get_access_token_subject
 
 logger = get_logger(__name__)
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
     Docstring for RateLimitMiddleware
     
     Rate Limiting middleware sinifi
 
     Her istekte:
-    1-Kullanici identifier'ini belirle
-    2-Rate limiter'dan izin kontrol et.
+    1-Kullanici identifier'ini belirle (gecerli access token varsa
+      user:{id}, yoksa ip:{client_ip})
+    2-Route'un maliyetini belirle ve rate limiter'dan izin kontrol et.
     3-Izin varsa: istegi gecir $ Header'lara bilgi ekle
     4-Izin yoksa: 429 To Many Requests don
+
+    Args:
+        app: Sarmalanan ASGI uygulamasi
+        limiter: Kullanilacak limiter (default: global rate_limiter)
     """
     EXCLUDED_PATHS={
         "/",
@@ -33,19 +48,74 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         "/redoc",
         "/openapi.json"
     }
-    async def dispatch(self,request: Request, call_next):
+    # (method, path) -> token maliyeti. Listede olmayan route'lar 1 token.
+    # Path'ler sondaki "/" olmadan yazilir.
+    ROUTE_COSTS = {
+        ("GET", f"{settings.api_v1_prefix}/tasks"): settings.rate_limit_list_cost,
+        ("POST", f"{settings.api_v1_prefix}/auth/login"): settings.rate_limit_auth_cost,
+        ("POST", f"{settings.api_v1_prefix}/auth/register"): (
+            settings.rate_limit_auth_cost
+        ),
+        ("POST", f"{settings.api_v1_prefix}/tasks/batch"): (
+            settings.rate_limit_batch_cost
+        ),
+        ("PATCH", f"{settings.api_v1_prefix}/tasks/batch"): (
+            settings.rate_limit_batch_cost
+        ),
+        ("DELETE", f"{settings.api_v1_prefix}/tasks/batch"): (
+            settings.rate_limit_batch_cost
+        ),
+    }
+    # Bu route'larda "search" parametresi varsa maliyet rate_limit_search_cost olur
+    SEARCH_ROUTES = {("GET", f"{settings.api_v1_prefix}/tasks")}
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter | None = None):
+        self.app = app
+        self.limiter = limiter or rate_limiter
+
+    @staticmethod
+    def get_identifier(request: Request) -> str:
+        """
+        Bucket identifier'ini belirler.
+
+        Bearer token gecerli bir access token ise kullanici id'si kullanilir.
+        Token sadece imza/sure olarak dogrulanir, DB'ye gidilmez. Token yoksa
+        veya gecersizse client IP'sine dusulur; sahte token ile baska bir
+        kullanicinin bucket'i tuketilemez.
+        """
+        authorization = request.headers.get("authorization")
+        if authorization and authorization[:7].lower() == "bearer ":
+            user_id = get_access_token_subject(authorization[7:])
+            if user_id:
+                return f"user:{user_id}"
+        client_ip = request.client.host if request.client else "unkown"
+        return f"ip:{client_ip}"
+
+    @classmethod
+    def get_cost(cls, request: Request) -> int:
+        """Istegin token maliyetini ROUTE_COSTS tablosundan belirler."""
+        route = (request.method, request.url.path.rstrip("/"))
+        if route in cls.SEARCH_ROUTES and request.query_params.get("search"):
+            return settings.rate_limit_search_cost
+        return cls.ROUTE_COSTS.get(route, 1)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Her istek bu metoddan gecer."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Excluded path kontrolu
-        if request.url.path in self.EXCLUDED_PATHS:
-            return await call_next(request)
-        
-        #identifieri belirle(JWT USER ID OLARAK GUNCELLENECEK)
-        client_ip = request.client.host if request.client else "unkown"
-        identifier = f"ip:{client_ip}"
+        if scope["path"] in self.EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        #identifier ve maliyeti belirle
+        request = Request(scope)
+        identifier = self.get_identifier(request)
+        cost = self.get_cost(request)
 
         #Rate limit kontrolu
-        allowed, info = await rate_limiter.is_allowed(identifier)
+        allowed, info = await self.limiter.is_allowed(identifier, cost)
 
         #response header'lari
         headers={
@@ -54,8 +124,10 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             "X-RateLimit-Reset-After":str(info["reset_after"])
         }
         if not allowed:
-            logger.warning(f"Rate limit exceeded for {identifier} on {request.url.path}")
-            return JSONResponse(
+            logger.warning(f"Rate limit exceeded for {identifier} on {scope['path']}")
+            # HTTP Retry-After tam saniye ister; yukari yuvarlanir
+            headers["Retry-After"] = str(max(1, math.ceil(info["reset_after"])))
+            response = JSONResponse(
                 status_code = status.HTTP_429_TOO_MANY_REQUESTS,
                 content ={
                     "success": False,
@@ -66,10 +138,15 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     }
                 },headers=headers
             )
-        #istegi gecir ve response a header ekle
-        response = await call_next(request)
-        #headerlari responsa ekledigimiz kisim
-        for key,value in headers.items():
-            response.headers[key]=value
-        
-        return response
\ No newline at end of file
+            await response(scope, receive, send)
+            return
+
+        #istegi gecir ve response baslangicina header ekle
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for key,value in headers.items():
+                    response_headers[key]=value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
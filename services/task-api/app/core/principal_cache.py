@@ -0,0 +1,114 @@
+"""
+Dogrulanmis kullanici (principal) cache'i.
+
+get_current_user her istekte JWT'yi cozdukten sonra kullaniciyi DB'den
+okuyordu; yani asil isten once istek basina bir SELECT. Bu modul
+kullaniciyi user id ile kisa sureligine saklar:
+
+    - L1: worker ici LocalLRUCache (her zaman, cok kisa TTL)
+    - L2: Redis (opsiyonel, principal_cache_redis_enabled)
+
+Invalidation:
+    Kullanici guncellenince veya silinince TaskUnitOfWork commit'ten sonra
+    invalidate() cagirir; bu worker'in L1'i ve Redis kaydi silinir. Diger
+    worker'larin L1 kopyalari en fazla principal_cache_local_ttl_seconds
+    kadar eski kalabilir, bu yuzden L1 TTL'i kisa tutulur.
+"""
+from app.config import settings
+from app.core.cache import redis_cache
+from app.core.cache_keys import get_user_principal_cache_key
+from app.core.local_cache import LocalLRUCache
+from app.core.logging import get_logger
+from app.models.user import UserPrincipal
+
+logger = get_logger(__name__)
+
+
+class PrincipalCache:
+    """
+    User id -> UserPrincipal cache'i.
+
+    Kullanim:
+        principal = await principal_cache.get(user_id)
+        if principal is None:
+            principal = UserPrincipal.model_validate(user_entity)
+            await principal_cache.set(principal)
+
+    Args:
+        local: Worker ici cache (None ise L1 kullanilmaz)
+        use_redis: True ise Redis ikinci seviye olarak kullanilir
+        ttl_seconds: Redis kayitlarinin suresi
+    """
+
+    def __init__(
+        self,
+        local: LocalLRUCache | None = None,
+        use_redis: bool = False,
+        ttl_seconds: int = 60
+    ):
+        self.local = local
+        self.use_redis = use_redis
+        self.ttl_seconds = ttl_seconds
+
+    async def get(self, user_id: int) -> UserPrincipal | None:
+        """Kullaniciyi once L1'den, sonra (aciksa) Redis'ten okur."""
+        key = get_user_principal_cache_key(user_id)
+        if self.local is not None:
+            principal = self.local.get(key)
+            if principal is not None:
+                return principal
+
+        if not self.use_redis:
+            return None
+        principal = await redis_cache.get(key, decoder=UserPrincipal.model_validate)
+        if principal is not None and self.local is not None:
+            self.local.set(key, principal)
+        return principal
+
+    async def set(self, principal: UserPrincipal) -> None:
+        """Kullaniciyi L1'e ve (aciksa) Redis'e yazar."""
+        key = get_user_principal_cache_key(principal.id)
+        if self.local is not None:
+            self.local.set(key, principal)
+        if self.use_redis:
+            await redis_cache.set(
+                key,
+                principal.model_dump(),
+                ttl=self.ttl_seconds,
+                local_value=principal
+            )
+
+    async def invalidate(self, *user_ids: int) -> None:
+        """Kullanicilarin cache kayitlarini siler (guncelleme/silme sonrasi)."""
+        if not user_ids:
+            return
+        keys = [get_user_principal_cache_key(user_id) for user_id in user_ids]
+        if self.local is not None:
+            for key in keys:
+                self.local.delete(key)
+        if self.use_redis:
+            await redis_cache.delete_many(keys)
+        logger.debug(f"Invalidated principal cache for users {list(user_ids)}")
+
+    def clear_local(self) -> None:
+        """Bu worker'in L1 kayitlarini siler."""
+        if self.local is not None:
+            self.local.clear()
+
+
+def _build_principal_cache() -> PrincipalCache | None:
+    """Ayarlara gore principal cache'i olusturur (kapaliysa None)."""
+    if not settings.principal_cache_enabled:
+        return None
+    return PrincipalCache(
+        local=LocalLRUCache(
+            max_size=settings.principal_cache_max_size,
+            ttl_seconds=settings.principal_cache_local_ttl_seconds
+        ),
+        use_redis=settings.principal_cache_redis_enabled,
+        ttl_seconds=settings.principal_cache_ttl_seconds
+    )
+
+
+# --- GLOBAL PRINCIPAL CACHE ---
+principal_cache = _build_principal_cache()
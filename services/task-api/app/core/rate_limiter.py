@@ -1,37 +1,158 @@
 from app.core.cache import redis_cache
+from app.core.exceptions import CircuitBreakerError
+from app.core.local_cache import LocalLRUCache
 from app.core.logging import get_logger
+from app.core.resilience import CircuitBreaker, CircuitState
+import asyncio
+import hashlib
 import time
+from dataclasses import dataclass
+from redis.exceptions import NoScriptError
 from app.config import settings
 logger = get_logger(__name__)
 
+# --- TOKEN BUCKET LUA SCRIPT ---
+# Okuma, refill, token dusme ve yazma Redis icinde tek adimda yapilir.
+# Script atomik calistigi icin ayni identifier'a gelen es zamanli istekler
+# ayni token sayisini okuyamaz; limit birebir uygulanir.
+# Zaman olarak Redis'in saati (TIME) kullanilir, boylece worker'lar arasi
+# saat farklari bucket'i bozmaz.
+#
+# KEYS[1] = bucket key'i
+# ARGV[1] = kapasite, ARGV[2] = saniyedeki refill, ARGV[3] = istek maliyeti,
+# ARGV[4] = key TTL (saniye), ARGV[5] = tek seferde alinabilecek en fazla token
+# Donus: {verilen token, kalan token} (string, Lua sayilari integer'a kesilmesin)
+# Verilen token 0 ise istek reddedilmistir.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local max_take = tonumber(ARGV[5])
+
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local state = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(state[1])
+local last_update = tonumber(state[2])
+if tokens == nil or last_update == nil then
+    tokens = capacity
+    last_update = now
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - last_update) * refill_rate)
+
+-- Yeterli token varsa en az cost, en fazla max_take (lease) kadar token verilir
+local granted = 0
+if tokens >= cost then
+    granted = math.max(cost, math.min(max_take, math.floor(tokens)))
+    tokens = tokens - granted
+end
+
+redis.call(
+    "HSET", KEYS[1], "tokens", tostring(tokens), "ts", string.format("%.6f", now)
+)
+redis.call("EXPIRE", KEYS[1], ARGV[4])
+return {tostring(granted), tostring(tokens)}
+"""
+TOKEN_BUCKET_SHA = hashlib.sha1(TOKEN_BUCKET_SCRIPT.encode()).hexdigest()
+
+
+class LocalTokenBuckets:
+    """
+    Worker ici (Redis'siz) token bucket'lar.
+
+    TOKEN_BUCKET_SCRIPT ile ayni hesabi bellekte yapar. Redis'e
+    ulasilamadiginda RateLimiter'in yedek (degraded) modu olarak kullanilir.
+    Her worker kendi bucket'larini tuttugu icin limit yaklasiktir:
+    N worker'li bir cluster'da istemci en fazla N kati kadar istek
+    yapabilir (bkz. rate_limit_fallback_share).
+
+    Kullanim:
+        buckets = LocalTokenBuckets(capacity=100, refill_rate=1.67)
+        granted, tokens = buckets.take("ip:1.2.3.4", cost=1)
+    """
+    def __init__(self, capacity: float, refill_rate: float, max_entries: int = 10000):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        # identifier -> (tokens, last_update); bos bucket dolana kadar tutulur
+        self._buckets = LocalLRUCache(
+            max_size=max_entries,
+            ttl_seconds=capacity / refill_rate if refill_rate else 3600
+        )
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def clear(self) -> None:
+        """Tum bucket'lari siler."""
+        self._buckets.clear()
+
+    def take(
+        self, identifier: str, cost: float = 1, max_take: float | None = None
+    ) -> tuple[float, float]:
+        """
+        Bucket'tan en az cost, en fazla max_take token alir.
+
+        Returns:
+            tuple[float, float]: (verilen_token, kalan_token)
+        """
+        now = time.monotonic()
+        state = self._buckets.get(identifier)
+        tokens, last_update = state if state is not None else (self.capacity, now)
+        tokens = min(self.capacity, tokens + (now - last_update) * self.refill_rate)
+
+        granted = 0
+        if tokens >= cost:
+            granted = max(cost, min(max_take or cost, int(tokens)))
+            tokens -= granted
+
+        self._buckets.set(identifier, (tokens, now))
+        return granted, tokens
+
+
 class RateLimiter:
     """
     Token Bucket algoritmasi kullanilarak rate limiting yapar.
-    
+
     Calisma mantigi:
     1-Her kullanicinin bir bucket'i olur.(Rediste)
     2-Kova maksimum N token alir.
-    3-Her istek 1 token harcar.
+    3-Her istek route'un maliyeti kadar token harcar (varsayilan 1).
     4-her saniye kova yavasca dolar.
     5-Kova bos ise -> 429 To Many Requests doner.
-    
+
     Redis Key Formati:
-        ratelimit::{identifier}
+        ratelimit:v2:{identifier}
 
-    Redis value(JSON):
-        {"tokens":95.5,"last_update":1706012345.123}
+    Redis value(HASH):
+        tokens -> "95.5", ts -> "1706012345.123"
+
+    Bucket, TOKEN_BUCKET_SCRIPT ile Redis tarafinda guncellenir (EVALSHA):
+    istek basina tek round trip, JSON serialization yok ve es zamanli
+    isteklerde limit asilmaz.
+
+    Degraded mod:
+        Redis cagrilari kendi timeout butcesiyle (rate_limit_redis_timeout_seconds)
+        ve bir CircuitBreaker arkasinda yapilir. Redis bagli degilse, hata
+        veriyor ya da yavassa veya breaker aciksa istekler herkese bos bir
+        bucket vermek yerine worker ici LocalTokenBuckets ile yaklasik
+        olarak sinirlanir. Yavas bir Redis boylece her istege gecikme eklemez.
     """
     def __init__(
         self,
         max_requests:int | None = None,
-        window_seconds:int | None = None
+        window_seconds:int | None = None,
+        breaker: CircuitBreaker | None = None
     ):
         """
         Docstring for __init__
-        
+
         Args:
             max_requests = Maksimum token sayisi(default : config'den)
             window_seconds: Token yenileme suresi (default : config'den)
+            breaker: Redis cagrilarini koruyan circuit breaker
+                (default : limiter'a ozel yeni bir breaker)
         """
         self.max_requests = max_requests or settings.rate_limiting_requests
         self.window_seconds = window_seconds or settings.rate_limit_window_seconds
@@ -39,7 +160,26 @@ class RateLimiter:
         #Token yenileme hizi = max_requests/window_seconds
         #ornek:100 token/ 60 saniye = 1.67 token/saniye
         self.refill_rate = self.max_requests/self.window_seconds
-    
+
+        self.breaker = breaker or CircuitBreaker(
+            failure_threshold=settings.rate_limit_breaker_failure_threshold,
+            recovery_timeout=settings.rate_limit_breaker_recovery_timeout,
+            name="rate_limiter"
+        )
+        # Degraded modda kullanilan worker ici bucket'lar
+        share = settings.rate_limit_fallback_share
+        self._fallback = LocalTokenBuckets(
+            capacity=max(1, self.max_requests * share),
+            refill_rate=self.refill_rate * share,
+            max_entries=settings.rate_limit_local_max_entries
+        )
+        self.fallback_decisions = 0
+
+    @property
+    def degraded(self) -> bool:
+        """Redis yerine worker ici yedek limiter mi kullaniliyor."""
+        return redis_cache.redis is None or self.breaker.state == CircuitState.OPEN
+
     def _get_key(self,identifier: str) -> str:
         """
         Docstring for _get_key
@@ -48,21 +188,107 @@ class RateLimiter:
         Args:
             identifier: Kullanici ip ya da id adresi
         Returns:
-            Redis Key: "ratelimit:{identifier}"
+            Redis Key: "ratelimit:v2:{identifier}"
+
+        Not: Eski JSON (string) bucket'lar "ratelimit:{identifier}"
+        altindaydi; hash ile WRONGTYPE cakismasi olmasin diye prefix
+        versiyonlandi. Eski key'ler TTL ile kendiliginden silinir.
         """
-        return f"ratelimit:{identifier}"
-    async def is_allowed(self, identifier:str) -> tuple[bool, dict]:
+        return f"ratelimit:v2:{identifier}"
+
+    async def _consume(
+        self, key: str, cost: float, max_take: float
+    ) -> tuple[float, float]:
+        """
+        Token bucket script'ini EVALSHA ile calistirir.
+
+        Script Redis'in script cache'inde yoksa (restart, SCRIPT FLUSH)
+        bir kez yuklenip tekrar denenir.
+
+        Returns:
+            tuple[float, float]: (verilen_token, kalan_token)
+        """
+        args = (
+            self.max_requests, self.refill_rate, cost, self.window_seconds * 2, max_take
+        )
+        redis = redis_cache.redis
+        try:
+            granted, tokens = await redis.evalsha(TOKEN_BUCKET_SHA, 1, key, *args)
+        except NoScriptError:
+            await redis.script_load(TOKEN_BUCKET_SCRIPT)
+            granted, tokens = await redis.evalsha(TOKEN_BUCKET_SHA, 1, key, *args)
+        return float(granted), float(tokens)
+
+    async def _take(
+        self,
+        identifier: str,
+        cost: float = 1,
+        max_take: float | None = None
+    ) -> tuple[float, float]:
+        """
+        Global bucket'tan token alir.
+
+        Redis bagli degilse, breaker aciksa, script hata verirse veya
+        timeout butcesini asarsa worker ici yedek bucket'tan alinir.
+
+        Returns:
+            tuple[float, float]: (verilen_token, kalan_token)
+        """
+        if redis_cache.redis is None:
+            return self._take_fallback(identifier, cost, max_take)
+        try:
+            async with self.breaker:
+                return await asyncio.wait_for(
+                    self._consume(self._get_key(identifier), cost, max_take or cost),
+                    timeout=settings.rate_limit_redis_timeout_seconds
+                )
+        except CircuitBreakerError:
+            return self._take_fallback(identifier, cost, max_take)
+        except Exception as e:
+            logger.error(
+                f"Rate limit check failed for {identifier} "
+                f"({type(e).__name__}: {e}), using local fallback"
+            )
+            return self._take_fallback(identifier, cost, max_take)
+
+    def _take_fallback(
+        self,
+        identifier: str,
+        cost: float,
+        max_take: float | None
+    ) -> tuple[float, float]:
+        """Degraded mod: worker ici bucket'tan token alir."""
+        self.fallback_decisions += 1
+        return self._fallback.take(identifier, cost, max_take)
+
+    def _build_info(self, allowed: bool, tokens: float, cost: float = 1) -> dict:
+        """Middleware header'lari icin bilgi dict'ini hazirlar."""
+        reset_after = (cost-tokens) / self.refill_rate if tokens < cost else 0
+        return {
+            "allowed":allowed,
+            "remaining": max(0, int(tokens)),
+            "reset_after":round(reset_after,2),
+            "limit": self.max_requests
+        }
+
+    async def is_allowed(self, identifier:str, cost: int = 1) -> tuple[bool, dict]:
         """
         Istegin rate limit'e takilip takilmadigini kontrol eder.
 
-        Token Bucket algoritmasi:
+        Token Bucket algoritmasi (Redis'te, atomik):
         1-Mevcut token sayisini al.
         2-Son guncellemeden bu yana gecen sureye gore token ekle.
-        3-Token >= 1 ise: izin ver,1 token dus
-        4-Token < 1 ise: Reddet
-        
+        3-Token >= cost ise: izin ver, cost kadar token dus
+        4-Token < cost ise: Reddet
+
+        Redis bagli degilse, hata verir veya timeout butcesini asarsa ya da
+        circuit breaker aciksa limit worker ici yedek bucket'larla
+        (LocalTokenBuckets) yaklasik olarak uygulanmaya devam eder
+        (degraded mod); istekler sinirsiz gecmez.
+
         Args:
             identifier: Kullanici ip ya da id adresi
+            cost: Istegin harcayacagi token (agir route'lar icin > 1)
         Returns:
             tuple[bool,dict]: (izin_var_mi, bilgi_dict)
 
@@ -72,54 +298,161 @@ class RateLimiter:
             -reset_after: float(saniye, token dolmasina kalan sure)
             -limit: int(maksimum token)
         """
-        key = self._get_key(identifier)
-        now = time.time()
-
-        # Redisten mevcut durum aliyoruz.
-        data = await redis_cache.get(key)
-
-        if data is None:
-            #ilk istek atilir(kova dolu baslar.)
-            tokens = self.max_requests
-            last_update = now
-        else:
-            tokens = data["tokens"]
-            last_update = data["last_update"]
-        
-        # Gecen sureye gore token ekle (refill)
-        time_passed = now - last_update
-        tokens = min(
-            self.max_requests, #maksimumu gecemez.
-            tokens + (time_passed * self.refill_rate)
+        cost = min(cost, self.max_requests)
+        granted, tokens = await self._take(identifier, cost)
+        allowed = granted > 0
+
+        if not allowed:
+            logger.warning(f"Rate Limit exceeded for {identifier}")
+
+        return allowed, self._build_info(allowed, tokens, cost)
+
+    def reset_local_state(self) -> None:
+        """Worker ici bucket'lari temizler (Redis'teki bucket'lara dokunmaz)."""
+        self._fallback.clear()
+
+    def get_stats(self) -> dict:
+        """Limiter modu ve istatistikleri (health check icin)."""
+        return {
+            "mode": settings.rate_limit_mode.lower(),
+            "degraded": self.degraded,
+            "backend": "local" if self.degraded else "redis",
+            "fallback_decisions": self.fallback_decisions,
+            "fallback_buckets": len(self._fallback),
+            "breaker": self.breaker.get_stats(),
+        }
+
+
+@dataclass
+class TokenLease:
+    """
+    Worker'in global bucket'tan onceden aldigi token dilimi.
+
+    Attributes:
+        tokens: Bu worker'da harcanabilecek kalan token
+        global_remaining: Lease alindigi anda global bucket'ta kalan token
+        denied: True ise global bucket bos; lease suresince Redis'e
+            gitmeden reddedilir
+    """
+    tokens: float
+    global_remaining: float
+    denied: bool = False
+
+
+class HybridRateLimiter(RateLimiter):
+    """
+    Lokal lease'li (hibrit) rate limiter.
+
+    Her worker, identifier basina global bucket'tan tek seferde lease_size
+    kadar token alir (lease) ve bunlari Redis'e gitmeden bellekte harcar.
+    Redis'e sadece lease bittiginde veya suresi doldugunda gidilir; limitin
+    altindaki istemciler icin istek basina Redis round trip'i kalkar.
+
+    Lease'ler global bucket'tan dusuldugu icin cluster genelinde limit
+    asilmaz. Bedeli: kullanilmayan lease token'lari lease suresi dolunca
+    kaybolur, yani en kotu durumda istemci (worker sayisi x lease_size)
+    kadar token'i kullanamadan bekleyebilir. Bu yuzden lease_size limite
+    gore kucuk, lease_ttl_seconds kisa tutulmalidir.
+
+    Global bucket bos ise red karari da lease gibi (reset_after'a kadar,
+    en fazla lease_ttl_seconds) lokal tutulur; limiti asan istemciler
+    Redis'e yuk bindirmez.
+
+    Kullanim:
+        limiter = HybridRateLimiter(lease_size=10, lease_ttl_seconds=1.0)
+        allowed, info = await limiter.is_allowed("ip:1.2.3.4")
+    """
+    def __init__(
+        self,
+        max_requests: int | None = None,
+        window_seconds: int | None = None,
+        lease_size: int | None = None,
+        lease_ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+        breaker: CircuitBreaker | None = None
+    ):
+        super().__init__(max_requests, window_seconds, breaker)
+        self.lease_size = max(1, min(
+            lease_size or settings.rate_limit_lease_size, self.max_requests
+        ))
+        self.lease_ttl_seconds = (
+            lease_ttl_seconds or settings.rate_limit_lease_ttl_seconds
+        )
+        # identifier -> TokenLease (boyut sinirli, TTL'li)
+        self._leases = LocalLRUCache(
+            max_size=max_entries or settings.rate_limit_local_max_entries,
+            ttl_seconds=self.lease_ttl_seconds
+        )
+        self.local_decisions = 0
+        self.syncs = 0
+
+    async def is_allowed(self, identifier: str, cost: int = 1) -> tuple[bool, dict]:
+        """
+        Once lokal lease'e bakar, yetmiyorsa Redis'ten yeni lease alir.
+
+        Args/Returns: RateLimiter.is_allowed ile ayni.
+        """
+        cost = min(cost, self.max_requests)
+        lease: TokenLease | None = self._leases.get(identifier)
+        if lease is not None:
+            if lease.tokens >= cost:
+                lease.tokens -= cost
+                self.local_decisions += 1
+                remaining = lease.tokens + lease.global_remaining
+                return True, self._build_info(True, remaining, cost)
+            if lease.denied and lease.global_remaining + lease.tokens < cost:
+                self.local_decisions += 1
+                return False, self._build_info(False, lease.global_remaining, cost)
+
+        self.syncs += 1
+        # Lease'te kalan (cost'a yetmeyen) token'lar yeni lease'e eklenir
+        leftover = lease.tokens if lease is not None else 0
+        granted, tokens = await self._take(
+            identifier, cost=cost, max_take=max(self.lease_size, cost)
         )
+        if granted <= 0:
+            reset_after = (cost - tokens) / self.refill_rate
+            self._leases.set(
+                identifier,
+                TokenLease(tokens=leftover, global_remaining=tokens, denied=True),
+                ttl=reset_after
+            )
+            logger.warning(f"Rate Limit exceeded for {identifier}")
+            return False, self._build_info(False, tokens, cost)
 
-        # Token kontrolu
-        if tokens >= 1:
-            tokens -= 1
-            allowed = True
-        else:
-            allowed = False
-        
-        # Guncel Durumu Redis'e kaydet
-        await redis_cache.set(
-            key,
-            {"tokens" : tokens, "last_update" : now},
-            ttl= self.window_seconds * 2
+        # Bu istek icin cost kadar token harcanir, kalani lease olarak saklanir
+        lease_tokens = leftover + granted - cost
+        self._leases.set(
+            identifier,
+            TokenLease(tokens=lease_tokens, global_remaining=tokens)
         )
-        
-        # Bilgi dict'i hazirla.
-        reset_after = (1-tokens) / self.refill_rate if tokens < 1 else 0
+        return True, self._build_info(True, lease_tokens + tokens, cost)
 
-        info = {
-            "allowed":allowed,
-            "remaining": max(0, int(tokens)),
-            "reset_after":round(reset_after,2),
-            "limit": self.max_requests
+    def reset_local_state(self) -> None:
+        """Yedek bucket'lari ve lease'leri temizler."""
+        super().reset_local_state()
+        self._leases.clear()
+
+    def get_stats(self) -> dict:
+        """Istatistikleri dondur."""
+        return {
+            **super().get_stats(),
+            "lease_size": self.lease_size,
+            "lease_ttl_seconds": self.lease_ttl_seconds,
+            "local_decisions": self.local_decisions,
+            "syncs": self.syncs,
+            "active_leases": len(self._leases),
         }
 
-        if not allowed:
-            logger.warning(f"Rate Limit exceeded for {identifier}")
-        
-        return allowed, info
 
-rate_limiter = RateLimiter()
\ No newline at end of file
+def _build_rate_limiter() -> RateLimiter:
+    """Ayarlardaki rate_limit_mode'a gore limiter'i olusturur."""
+    mode = settings.rate_limit_mode.lower()
+    if mode == "hybrid":
+        return HybridRateLimiter()
+    if mode != "redis":
+        raise ValueError(f"Unknown rate limit mode: {settings.rate_limit_mode}")
+    return RateLimiter()
+
+
+rate_limiter = _build_rate_limiter()
@@ -409,12 +409,20 @@ class Bulkhead:
         self.name=name
         self._semaphore=asyncio.Semaphore(max_concurrent)
         self._active_count = 0
+        self._waiting_count = 0
+        self._peak_waiting = 0
+        self._rejected_count = 0
     
     @property
     def active_count(self)-> int:
         """Su an aktif olan istek sayisi"""
         return self._active_count 
     
+    @property
+    def waiting_count(self)-> int:
+        """Slot bekleyen istek sayisi (kuyruk derinligi)"""
+        return self._waiting_count
+
     @property
     def available_slots(self)-> int:
         """Kullanilabilir slot sayisi"""
@@ -423,19 +431,25 @@ class Bulkhead:
     async def __aenter__(self):
         """Context Manager girisi - slot alarak girer."""
         if self.timeout is not None:
+            self._waiting_count += 1
+            self._peak_waiting = max(self._peak_waiting, self._waiting_count)
             try:
                 await asyncio.wait_for(
                     self._semaphore.acquire(),
                     timeout=self.timeout
                 )
             except asyncio.TimeoutError:
+                self._rejected_count += 1
                 raise BulkheadFullError(
                     self.name,
                     self.active_count,
                     self.max_concurrent
                 )
+            finally:
+                self._waiting_count -= 1
         else:
             if self._semaphore.locked():
+                self._rejected_count += 1
                 raise BulkheadFullError(
                     self.name,
                     self._active_count,
@@ -468,6 +482,9 @@ class Bulkhead:
             "max_concurrent":self.max_concurrent,
             "active_count":self._active_count,
             "available_slots":self.available_slots,
+            "waiting_count":self._waiting_count,
+            "peak_waiting":self._peak_waiting,
+            "rejected_count":self._rejected_count,
             "timeout": self.timeout
         }
 
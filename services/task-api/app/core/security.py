@@ -1,11 +1,32 @@
+import asyncio
+import hashlib
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 
 import bcrypt
 import jwt
 
 from app.config import settings
+from app.core.local_cache import LocalLRUCache
+from app.core.resilience import Bulkhead
 
 # ---  SIFRE ISLEMLERI (BCRYPT) ---
+# bcrypt bilerek yavastir (~100-300 ms CPU). Async kodda dogrudan cagrilirsa
+# o sure boyunca worker'in event loop'u durur ve diger tum istekler bekler.
+# Async kod *_async versiyonlarini kullanir: is sinirli bir thread pool'da
+# calisir, es zamanli cagri sayisi bcrypt_bulkhead ile sinirlanir ve slot
+# bekleyenler (kuyruk derinligi) bulkhead istatistiklerinde gorunur.
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=settings.bcrypt_max_workers,
+    thread_name_prefix="bcrypt"
+)
+bcrypt_bulkhead = Bulkhead(
+    max_concurrent=settings.bcrypt_max_workers,
+    timeout=settings.bcrypt_queue_timeout_seconds,
+    name="bcrypt"
+)
 
 
 def hash_password(password: str) -> str:
@@ -20,6 +41,32 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 
+async def hash_password_async(password: str) -> str:
+    """
+    hash_password'un event loop'u bloklamayan versiyonu.
+
+    Raises:
+        BulkheadFullError: Slot bcrypt_queue_timeout_seconds icinde bosalmazsa (503)
+    """
+    async with bcrypt_bulkhead:
+        return await asyncio.get_running_loop().run_in_executor(
+            _bcrypt_executor, hash_password, password
+        )
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    verify_password'un event loop'u bloklamayan versiyonu.
+
+    Raises:
+        BulkheadFullError: Slot bcrypt_queue_timeout_seconds icinde bosalmazsa (503)
+    """
+    async with bcrypt_bulkhead:
+        return await asyncio.get_running_loop().run_in_executor(
+            _bcrypt_executor, verify_password, plain_password, hashed_password
+        )
+
+
 # --- TOKEN ISLEMLERI (JWT) ---
 
 
@@ -28,7 +75,10 @@ def create_access_token(user_id: int) -> str:
     expire = datetime.now(UTC) + timedelta(
         minutes=settings.jwt_access_token_expire_minutes
     )
-    payload = {"sub": str(user_id), "exp": expire, "type": "access"}
+    # jti: token'i tek basina iptal edebilmek icin (bkz. token_revocation)
+    payload = {
+        "sub": str(user_id), "exp": expire, "type": "access", "jti": uuid.uuid4().hex
+    }
     return jwt.encode(
         payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
     )
@@ -37,14 +87,31 @@ def create_access_token(user_id: int) -> str:
 def create_refresh_token(user_id: int) -> str:
     """Uzun Sureli erisim icin yenileme token'i olusturur"""
     expire = datetime.now(UTC) + timedelta(days=settings.jwt_refresh_token_expire_days)
-    payload = {"sub": str(user_id), "exp": expire, "type": "refresh"}
+    payload = {
+        "sub": str(user_id), "exp": expire, "type": "refresh", "jti": uuid.uuid4().hex
+    }
     return jwt.encode(
         payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
     )
 
 
-def decode_token(token: str) -> dict | None:
-    """Token'i dogrular ve icindeki veriyi (payload) cozer"""
+# Istemciler ayni access token'i yuzlerce kez gonderir; her istekte HMAC
+# imzasini yeniden dogrulamak yerine dogrulanmis payload, token'in
+# SHA-256 ozeti ile worker icinde tutulur. Kayit en gec token'in exp
+# aninda duser, yani suresi dolmus bir token cache'ten gecemez.
+# Sadece gecerli token'lar cache'lenir; gecersizler her seferinde reddedilir.
+_decode_cache: LocalLRUCache | None = (
+    LocalLRUCache(
+        max_size=settings.jwt_decode_cache_max_size,
+        ttl_seconds=settings.jwt_decode_cache_ttl_seconds
+    )
+    if settings.jwt_decode_cache_enabled
+    else None
+)
+
+
+def _verify_token(token: str) -> dict | None:
+    """Token imzasini ve exp'ini dogrular, payload'i dondurur (cache'siz)."""
     try:
         decoded_payload = jwt.decode(
             token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
@@ -53,3 +120,48 @@ def decode_token(token: str) -> dict | None:
     except (jwt.PyJWTError, Exception):
         # Token Gecersiz, suresi dolmus veya bozulmussa
         return None
+
+
+def decode_token(token: str) -> dict | None:
+    """Token'i dogrular ve icindeki veriyi (payload) cozer"""
+    if _decode_cache is None:
+        return _verify_token(token)
+
+    digest = hashlib.sha256(token.encode()).hexdigest()
+    payload = _decode_cache.get(digest)
+    if payload is not None:
+        return dict(payload)
+
+    payload = _verify_token(token)
+    if payload is None:
+        return None
+
+    exp = payload.get("exp")
+    ttl = exp - time.time() if isinstance(exp, (int, float)) else None
+    if ttl is None or ttl > 0:
+        _decode_cache.set(digest, payload, ttl=ttl)
+    return dict(payload)
+
+
+def clear_token_cache() -> None:
+    """Dogrulanmis token cache'ini temizler (or. secret rotasyonunda)."""
+    if _decode_cache is not None:
+        _decode_cache.clear()
+
+
+def get_token_cache_stats() -> dict | None:
+    """Token cache istatistiklerini dondurur (kapaliysa None)."""
+    return _decode_cache.get_stats() if _decode_cache is not None else None
+
+
+def get_access_token_subject(token: str) -> str | None:
+    """
+    Access token'in imzasini dogrular ve kullanici id'sini (sub) dondurur.
+
+    DB'ye gitmez; rate limiting gibi kullaniciyi sadece tanimlamak gereken
+    yerlerde kullanilir. Gecersiz, suresi dolmus veya refresh token ise None.
+    """
+    payload = decode_token(token)
+    if not payload or payload.get("type") != "access":
+        return None
+    return payload.get("sub")
@@ -0,0 +1,265 @@
+"""
+Cache serializer'lari.
+
+RedisCache degerleri byte olarak saklar; hangi formatin kullanilacagi
+buradaki strateji siniflariyla secilir:
+    - json    : stdlib json (her zaman mevcut)
+    - orjson  : JSON ile ayni format, C ile yazilmis hizli encoder/decoder
+    - msgpack : binary format, daha kucuk payload
+
+Opsiyonel olarak belirli bir boyutun uzerindeki payload'lar zlib veya lz4
+ile sikistirilir.
+
+Frame formati:
+    [1 byte header][payload]
+    header = (codec_id << 4) | compression_id
+
+Header sayesinde her kayit kendini tanimlar; farkli ayarlarla calisan
+worker'lar (orn. rolling deploy sirasinda) birbirinin yazdigini okuyabilir.
+Header'siz eski JSON kayitlari da okunmaya devam eder.
+
+orjson, msgpack ve lz4 opsiyonel bagimliliklardir ("cache" extra'si:
+uv sync --extra cache). Ayarlarda secilen kutuphane kurulu degilse uyari
+loglanir ve stdlib'e (json/zlib) geri donulur.
+"""
+import json
+import zlib
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+from app.core.logging import get_logger
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - opsiyonel bagimlilik
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - opsiyonel bagimlilik
+    msgpack = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - opsiyonel bagimlilik
+    lz4_frame = None
+
+logger = get_logger(__name__)
+
+# Codec ve sikistirma kimlikleri (header byte'inda saklanir)
+CODEC_JSON = 0
+CODEC_MSGPACK = 1
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_LZ4 = 2
+
+
+# --- CUSTOM JSON ENCODER ---
+class DateTimeEncoder(json.JSONEncoder):
+    """
+    datetime ve date objelerini JSON'A serialize edebilen encoder.
+
+    Kullanim:
+        json.dumps(data,cls=DateTimeEncoder)
+    """
+    def default(self, obj):
+        if isinstance(obj,datetime):
+            return obj.isoformat()
+        if isinstance(obj,date):
+            return obj.isoformat()
+        return super().default(obj)
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """msgpack'in desteklemedigi tipleri JSON ile ayni sekilde cevirir."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not msgpack serializable")
+
+
+class CacheSerializer(ABC):
+    """Cache serializer'lari icin abstract base class."""
+
+    name: str
+    codec_id: int
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Python objesini byte'a cevirir."""
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Byte'i Python objesine cevirir."""
+        pass
+
+
+class JsonSerializer(CacheSerializer):
+    """stdlib json serializer."""
+
+    name = "json"
+    codec_id = CODEC_JSON
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, cls=DateTimeEncoder, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer(CacheSerializer):
+    """
+    orjson serializer.
+
+    datetime, date ve Enum'lari kendisi destekler. Ciktisi JSON oldugu
+    icin JsonSerializer ile ayni codec_id'yi kullanir.
+    """
+
+    name = "orjson"
+    codec_id = CODEC_JSON
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackSerializer(CacheSerializer):
+    """msgpack serializer (binary, JSON'dan daha kucuk)."""
+
+    name = "msgpack"
+    codec_id = CODEC_MSGPACK
+
+    def dumps(self, obj: Any) -> bytes:
+        return msgpack.packb(obj, default=_msgpack_default, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+
+class CacheCodec:
+    """
+    Serializer + opsiyonel sikistirma.
+
+    Kullanim:
+        codec = CacheCodec(OrjsonSerializer(), compression="lz4", threshold=1024)
+        data = codec.encode({"items": [...]})
+        codec.decode(data)
+
+    Args:
+        serializer: Yazarken kullanilacak serializer
+        compression: None, "zlib" veya "lz4"
+        threshold: Bu boyuttan (byte) kucuk payload'lar sikistirilmaz
+    """
+
+    def __init__(
+        self,
+        serializer: CacheSerializer,
+        compression: str | None = None,
+        threshold: int = 1024
+    ):
+        self.serializer = serializer
+        self.compression = compression
+        self.threshold = threshold
+        self._compression_id = {
+            None: COMPRESSION_NONE,
+            "zlib": COMPRESSION_ZLIB,
+            "lz4": COMPRESSION_LZ4,
+        }[compression]
+        # Okurken her codec_id icin mevcut en hizli decoder
+        self._decoders: dict[int, CacheSerializer] = {
+            CODEC_JSON: OrjsonSerializer() if orjson is not None else JsonSerializer(),
+        }
+        if msgpack is not None:
+            self._decoders[CODEC_MSGPACK] = MsgpackSerializer()
+
+    @property
+    def name(self) -> str:
+        """Okunabilir codec adi (orn: "orjson+lz4")."""
+        if self.compression:
+            return f"{self.serializer.name}+{self.compression}"
+        return self.serializer.name
+
+    def encode(self, obj: Any) -> bytes:
+        """Objeyi header'li frame'e cevirir."""
+        payload = self.serializer.dumps(obj)
+        compression_id = COMPRESSION_NONE
+
+        if self._compression_id != COMPRESSION_NONE and len(payload) >= self.threshold:
+            compression_id = self._compression_id
+            if compression_id == COMPRESSION_ZLIB:
+                payload = zlib.compress(payload)
+            else:
+                payload = lz4_frame.compress(payload)
+
+        header = (self.serializer.codec_id << 4) | compression_id
+        return bytes([header]) + payload
+
+    def decode(self, data: bytes | str) -> Any:
+        """Header'li frame'i (veya header'siz eski JSON'u) cozer."""
+        if isinstance(data, str):
+            data = data.encode()
+        if not data:
+            raise ValueError("Empty cache payload")
+
+        header = data[0]
+        # Eski kayitlar duz JSON'dur ve yazdirilabilir bir karakterle baslar
+        if header >= 0x20:
+            return self._decoders[CODEC_JSON].loads(data)
+
+        codec_id, compression_id = header >> 4, header & 0x0F
+        payload = data[1:]
+        if compression_id == COMPRESSION_ZLIB:
+            payload = zlib.decompress(payload)
+        elif compression_id == COMPRESSION_LZ4:
+            if lz4_frame is None:
+                raise ValueError("lz4 compressed cache payload, lz4 is not installed")
+            payload = lz4_frame.decompress(payload)
+
+        decoder = self._decoders.get(codec_id)
+        if decoder is None:
+            raise ValueError(f"No decoder available for cache codec {codec_id}")
+        return decoder.loads(payload)
+
+
+def build_codec(
+    serializer: str = "json",
+    compression: str | None = None,
+    threshold: int = 1024
+) -> CacheCodec:
+    """
+    Ayarlardaki isimlere gore CacheCodec olusturur.
+
+    Istenen kutuphane kurulu degilse uyari loglar ve stdlib karsiligina
+    (json / zlib) geri doner.
+    """
+    serializer = serializer.lower()
+    chosen: CacheSerializer
+    if serializer == "orjson" and orjson is not None:
+        chosen = OrjsonSerializer()
+    elif serializer == "msgpack" and msgpack is not None:
+        chosen = MsgpackSerializer()
+    else:
+        if serializer not in ("json", "orjson", "msgpack"):
+            raise ValueError(f"Unknown cache serializer: {serializer}")
+        if serializer != "json":
+            logger.warning(
+                f"Cache serializer '{serializer}' is not installed, "
+                "falling back to json"
+            )
+        chosen = JsonSerializer()
+
+    if compression is not None:
+        compression = compression.lower()
+        if compression not in ("zlib", "lz4"):
+            raise ValueError(f"Unknown cache compression: {compression}")
+        if compression == "lz4" and lz4_frame is None:
+            logger.warning("lz4 is not installed, falling back to zlib compression")
+            compression = "zlib"
+
+    return CacheCodec(chosen, compression=compression, threshold=threshold)
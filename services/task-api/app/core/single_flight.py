@@ -0,0 +1,104 @@
+"""
+Single-flight (request coalescing) pattern.
+
+Ayni key icin ayni anda gelen istekler tek bir yukleme islemini paylasir.
+Ornek: bir kullanicinin liste cache'i invalidate olunca ayni filtreyle
+poll eden tum dashboard'lar ayni anda miss alir; bu class sayesinde worker
+icinde sadece ilki DB'ye gider, digerleri onun sonucunu bekler.
+
+Worker'lar arasi koruma icin bkz. RedisCache.lock.
+"""
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SingleFlight:
+    """
+    Key bazli istek birlestirici.
+
+    Kullanim:
+        flight = SingleFlight(name="task_list")
+        result = await flight.do(cache_key, lambda: load_from_db())
+
+    Davranis:
+        - Ilk cagiran (leader) fonksiyonu calistirir.
+        - Ayni key icin bekleyenler (follower) leader'in sonucunu alir.
+        - Leader hata alirsa ayni hata follower'lara da iletilir.
+        - Leader iptal edilirse (client baglantiyi kopardi vb.) follower'lar
+          iptal edilmez; aralarindan biri yeni leader olarak tekrar dener.
+    """
+
+    def __init__(self, name: str = "default"):
+        self.name = name
+        self._calls: dict[str, asyncio.Future] = {}
+        self.leader_calls = 0
+        self.shared_calls = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Su an yuklenmekte olan key sayisi"""
+        return len(self._calls)
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Key icin func'i calistirir veya devam eden cagrinin sonucunu bekler.
+
+        Args:
+            key: Birlestirme anahtari (genelde cache key'i)
+            func: Sonucu ureten async fonksiyon
+
+        Returns:
+            func'in sonucu (leader veya follower fark etmeksizin)
+        """
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+
+            self.shared_calls += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                current = asyncio.current_task()
+                # Biz iptal edilmediysek leader iptal edilmistir; tekrar dene
+                if future.cancelled() and (current is None or not current.cancelling()):
+                    continue
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        # Hic follower yoksa "exception was never retrieved" uyarisi cikmasin
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._calls[key] = future
+        self.leader_calls += 1
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._calls.pop(key, None)
+
+    def get_stats(self) -> dict:
+        """Istatistikleri dondur."""
+        return {
+            "name": self.name,
+            "in_flight": self.in_flight,
+            "leader_calls": self.leader_calls,
+            "shared_calls": self.shared_calls,
+        }
+
+
+# --- GLOBAL SINGLE FLIGHT ---
+task_list_single_flight = SingleFlight(name="task_list")
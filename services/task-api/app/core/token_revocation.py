@@ -0,0 +1,286 @@
+"""
+Token iptali (logout / refresh token rotasyonu).
+
+Iptal edilen token'larin jti'leri Redis'te token'in kalan omru kadar TTL
+ile tutulur (denylist). Her istekte Redis'e sormak ekstra bir round trip
+demek oldugu icin her worker onunde bir Bloom filtresi tutar:
+
+    - Filtrede olmayan jti kesinlikle iptal edilmemistir -> network I/O yok
+    - Filtrede olan jti (gercek iptal veya false positive) Redis'e sorulur
+
+Filtre acilista Redis'teki denylist'ten kurulur ve yeni iptaller pub/sub
+kanaliyla tum worker'lara yayilir. Bloom filtresinden eleman silinemez;
+eklenen jti sayisi kapasiteyi asinca filtre Redis'ten (suresi dolmus
+kayitlar artik olmadigi icin) yeniden kurulur.
+
+Iptal SET NX ile yazilir; ayni jti'yi ikinci kez iptal etmeye calisan
+istek (ornegin ayni refresh token ile es zamanli iki rotasyon) bunu
+donus degerinden anlar.
+"""
+import asyncio
+import hashlib
+import math
+import time
+
+from app.config import settings
+from app.core.cache import redis_cache
+from app.core.cache_keys import get_revoked_token_key, get_revoked_token_pattern
+from app.core.exceptions import CircuitBreakerError
+from app.core.logging import get_logger
+from app.core.resilience import CircuitBreaker
+
+logger = get_logger(__name__)
+
+
+class BloomFilter:
+    """
+    Sabit boyutlu Bloom filtresi.
+
+    Kullanim:
+        bloom = BloomFilter(capacity=100000, error_rate=0.001)
+        bloom.add("jti")
+        "jti" in bloom  # True; eklenmeyenler icin ~%0.1 ihtimalle True
+
+    Args:
+        capacity: Beklenen eleman sayisi
+        error_rate: Kapasitede hedeflenen false positive orani
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        bits = -self.capacity * math.log(error_rate) / math.log(2) ** 2
+        self.size = max(8, int(bits))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        # Double hashing: tek digest'ten k pozisyon (Kirsch-Mitzenmacher)
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class TokenRevocationList:
+    """
+    Redis denylist'i + worker ici Bloom filtresi.
+
+    Kullanim:
+        await token_revocation.revoke(payload["jti"], payload["exp"])
+        if await token_revocation.is_revoked(payload.get("jti")):
+            raise InvalidTokenException()
+
+    Redis yokken (gelistirme/test) veya Redis'e yazilamadiginda iptal bu
+    worker'in belleginde (yerel denylist) tutulur. Sorgularda once yerel
+    denylist'e bakilir; Redis hata verirse veya breaker aciksa karar yerel
+    denylist'e gore verilir.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100000,
+        error_rate: float = 0.001,
+        channel: str = "auth:revocations",
+        breaker: CircuitBreaker | None = None
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.channel = channel
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.breaker = breaker or CircuitBreaker(name="token_revocation")
+        # Redis yokken kullanilan denylist: jti -> exp
+        self._local_denylist: dict[str, float] = {}
+        self._listener_task: asyncio.Task | None = None
+        self._rebuild_task: asyncio.Task | None = None
+        self._redis_checks = 0
+
+    # --- SORGU ---
+
+    async def is_revoked(self, jti: str | None) -> bool:
+        """Token iptal edilmis mi; filtre negatifse network I/O yapmaz."""
+        if not jti or jti not in self.bloom:
+            return False
+        if self._is_locally_revoked(jti):
+            return True
+
+        redis = redis_cache.redis
+        if redis is None:
+            return False
+
+        self._redis_checks += 1
+        try:
+            async with self.breaker:
+                return bool(await redis.exists(get_revoked_token_key(jti)))
+        except CircuitBreakerError:
+            return False
+        except Exception as e:
+            logger.error(f"Redis EXISTS error for revoked token {jti}: {e}")
+            return False
+
+    def _is_locally_revoked(self, jti: str) -> bool:
+        exp = self._local_denylist.get(jti)
+        return exp is not None and exp > time.time()
+
+    # --- IPTAL ---
+
+    async def revoke(self, jti: str | None, exp: float | None) -> bool:
+        """
+        Token'i kalan omru boyunca iptal eder ve diger worker'lara yayar.
+
+        Args:
+            jti: Token id'si (jti claim'i)
+            exp: Token'in bitis zamani (unix); suresi dolmussa islem yapilmaz
+        Returns:
+            bool: Token bu cagriyla iptal edildiyse True; jti yoksa, suresi
+                dolmussa veya token zaten iptal edilmisse False
+        """
+        if not jti:
+            return False
+        expires_at = exp or 0.0
+        ttl = int(math.ceil(expires_at - time.time()))
+        if ttl <= 0 or self._is_locally_revoked(jti):
+            return False
+
+        self._add(jti)
+        redis = redis_cache.redis
+        if redis is None:
+            self._remember_locally(jti, expires_at)
+            return True
+        try:
+            async with self.breaker:
+                # NX: kontrol ve iptal tek komutta; yarisi tek istek kazanir
+                created = await redis.set(
+                    get_revoked_token_key(jti), b"1", ex=ttl, nx=True
+                )
+            if not created:
+                return False
+            await redis.publish(self.channel, jti)
+        except CircuitBreakerError:
+            self._remember_locally(jti, expires_at)
+        except Exception as e:
+            logger.error(f"Redis token revocation error for {jti}: {e}")
+            self._remember_locally(jti, expires_at)
+        logger.info(f"Token revoked: {jti}")
+        return True
+
+    def _remember_locally(self, jti: str, exp: float) -> None:
+        """jti'yi yerel denylist'e yazar, suresi dolmus kayitlari atar."""
+        now = time.time()
+        expired = [key for key, value in self._local_denylist.items() if value <= now]
+        for key in expired:
+            del self._local_denylist[key]
+        self._local_denylist[jti] = exp
+
+    def _add(self, jti: str) -> None:
+        """jti'yi filtreye ekler; kapasite asildiysa yeniden kurulum planlar."""
+        self.bloom.add(jti)
+        if self.bloom.count > self.capacity and redis_cache.redis is not None:
+            if self._rebuild_task is None or self._rebuild_task.done():
+                self._rebuild_task = asyncio.create_task(self.rebuild())
+
+    # --- FILTRE SENKRONIZASYONU ---
+
+    async def rebuild(self) -> None:
+        """Filtreyi Redis'teki (suresi dolmamis) denylist'ten yeniden kurar."""
+        redis = redis_cache.redis
+        if redis is None:
+            return
+        prefix_length = len(get_revoked_token_key(""))
+        bloom = BloomFilter(self.capacity, self.error_rate)
+        try:
+            pattern = get_revoked_token_pattern()
+            async for key in redis.scan_iter(match=pattern, count=1000):
+                bloom.add(key.decode()[prefix_length:])
+        except Exception as e:
+            logger.error(f"Token revocation filter rebuild failed: {e}")
+            return
+        # Tarama sirasinda gelen iptaller kaybolmasin diye yerel denylist de eklenir
+        for jti in self._local_denylist:
+            bloom.add(jti)
+        self.bloom = bloom
+        logger.info(f"Token revocation filter rebuilt with {bloom.count} entries")
+
+    async def start(self) -> None:
+        """Pub/sub dinleyicisini baslatir (filtre abone olunca kurulur)."""
+        if redis_cache.redis is None:
+            return
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Arka plan task'larini durdurur."""
+        for task in (self._listener_task, self._rebuild_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._listener_task = None
+        self._rebuild_task = None
+
+    async def _listen(self) -> None:
+        """
+        Diger worker'larin iptallerini filtreye ekler.
+
+        Once abone olunur, sonra filtre Redis'ten kurulur; boylece kurulum
+        sirasinda yapilan iptaller de kanaldan gelir. Baglanti koparsa ayni
+        sirayla yeniden kurulur (aradaki mesajlar kacmis olabilir).
+        """
+        while redis_cache.redis is not None:
+            pubsub = redis_cache.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                await self.rebuild()
+                async for message in pubsub.listen():
+                    data = message.get("data")
+                    if isinstance(data, bytes):
+                        data = data.decode()
+                    if data:
+                        self._add(str(data))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Token revocation listener error: {e}")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def reset_local_state(self) -> None:
+        """Filtreyi ve yerel denylist'i sifirlar (testler icin)."""
+        self.bloom = BloomFilter(self.capacity, self.error_rate)
+        self._local_denylist.clear()
+
+    def get_stats(self) -> dict:
+        """Filtre istatistikleri (boyutlandirma icin)."""
+        return {
+            "entries": self.bloom.count,
+            "capacity": self.capacity,
+            "error_rate": self.error_rate,
+            "size_bytes": len(self.bloom._bits),
+            "hash_count": self.bloom.hash_count,
+            "redis_checks": self._redis_checks,
+            "local_denylist": len(self._local_denylist),
+        }
+
+
+# --- GLOBAL REVOCATION LIST ---
+token_revocation = TokenRevocationList(
+    capacity=settings.token_revocation_bloom_capacity,
+    error_rate=settings.token_revocation_bloom_error_rate,
+    channel=settings.token_revocation_channel
+)
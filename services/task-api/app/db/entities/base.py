@@ -9,6 +9,11 @@ class Base(DeclarativeBase):
 
 
 class TimestampMixin:
+    # Sunucuda uretilen kolonlar (id, updated_at'in onupdate=now() degeri)
+    # INSERT/UPDATE ile ayni statement'ta RETURNING ile geri okunur;
+    # commit sonrasi ayrica refresh (SELECT) gerekmez.
+    __mapper_args__ = {"eager_defaults": True}
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(UTC),
@@ -1,9 +1,10 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column
 
+from app.db.search import register_search_ddl
 from app.models.task import TaskPriority, TaskStatus
 
 from .base import Base, TimestampMixin
@@ -11,6 +12,15 @@ from .base import Base, TimestampMixin
 
 class TaskEntity(Base, TimestampMixin):
     __tablename__ = "tasks"
+    # Liste sorgulari her zaman user_id ile filtrelenir ve created_at'e gore
+    # siralanir (bkz. TaskService._load_task_page). Status/priority filtreli
+    # sorgular da ayni siralamayi index'ten okuyabilsin diye created_at
+    # her index'in sonunda. Sadece user_id filtresi ix_tasks_user_created'i kullanir.
+    __table_args__ = (
+        Index("ix_tasks_user_created", "user_id", "created_at", "id"),
+        Index("ix_tasks_user_status", "user_id", "status", "created_at"),
+        Index("ix_tasks_user_priority", "user_id", "priority", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -21,3 +31,7 @@ class TaskEntity(Base, TimestampMixin):
     due_date: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+
+
+# Full-text search tablosu/kolonu ve trigger'lari (bkz. app.db.search)
+register_search_ddl(TaskEntity.__table__)
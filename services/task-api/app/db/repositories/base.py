@@ -2,7 +2,11 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.resilience import with_db_retry
 from app.db.entities.base import Base
-from app.db.repositories.specifications import PaginationSpecification, Specification
+from app.db.repositories.specifications import (
+    OrderBySpecification,
+    PaginationSpecification,
+    Specification,
+)
 
 
 class BaseRepository[T: Base]:
@@ -63,6 +67,27 @@ class BaseRepository[T: Base]:
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
     
+    @with_db_retry
+    async def find_with_total(
+        self, *specifications: Specification[T]
+    ) -> tuple[list[T], int]:
+        """
+        Sayfayi ve filtrelenmis toplam kayit sayisini tek sorguda doner.
+
+        COUNT(*) OVER() LIMIT/OFFSET'ten once hesaplanir; ayri bir count
+        sorgusu ve filtrelenmis kumenin ikinci kez taranmasi gerekmez.
+        Sayfa bos donerse (son sayfanin otesi) toplam ayrica sayilir.
+        """
+        query = select(self.model, func.count().over().label("total"))
+
+        for spec in specifications:
+            query = spec.apply(query)
+
+        rows = (await self.session.execute(query)).all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+        return [], await self.count(*specifications)
+
     @with_db_retry
     async def count(self,*specifications:Specification[T]) -> int:
         """Specification'lara gore kayit sayisini doner. 
@@ -70,7 +95,8 @@ class BaseRepository[T: Base]:
         query= select(func.count()).select_from(self.model)
 
         for spec in specifications:
-            if not isinstance(spec, PaginationSpecification): # pagination count'u etkilemesin diye
+            # pagination ve siralama count'u etkilemesin diye
+            if not isinstance(spec, (PaginationSpecification, OrderBySpecification)):
                 query=spec.apply(query)
         
         result = await self.session.execute(query)
@@ -1,10 +1,31 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Generic, TypeVar
 
-from sqlalchemy import asc, desc, or_
-from sqlalchemy.sql import Select
+from sqlalchemy import (
+    asc,
+    column,
+    desc,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+    tuple_,
+)
+from sqlalchemy.sql import ColumnElement, Select
 
+from app.config import settings
 from app.db.entities.task import TaskEntity, TaskPriority, TaskStatus
+from app.db.search import (
+    FTS_TABLE,
+    postgres_tsquery,
+    search_terms,
+    sqlite_match_query,
+)
+
+# SQLite arama alt sorgusunun adi (SearchRankSpecification skoru buradan okur)
+SEARCH_HITS = "search_hits"
 
 #Generic tip tanimi (hangi model ile calisacagimi temsil eder)
 T= TypeVar("T")
@@ -66,6 +87,48 @@ class TaskSearchSpecification(Specification[TaskEntity]):
                 TaskEntity.description.ilike(self.search)
             )
         )
+class SearchSpecification(Specification[TaskEntity]):
+    """
+    Index'li full-text arama; backend'i dialect'e gore secer.
+
+    - postgresql: search_vector @@ to_tsquery (GIN), trigram aciksa ILIKE de
+    - sqlite: tasks_fts MATCH (FTS5)
+    - diger / kelime icermeyen arama: TaskSearchSpecification (ILIKE)
+
+    Kelimeler on ek olarak eslesir ("rap" -> "rapor"); tum kelimeler gerekir.
+    Siralama icin bkz. SearchRankSpecification.
+    """
+    def __init__(self, search: str, dialect: str):
+        self.search = search
+        self.dialect = dialect
+        self.terms = search_terms(search)
+
+    def apply(self, query: Select) -> Select:
+        if self.terms and self.dialect == "sqlite":
+            # IN (alt sorgu) MATCH'i bir kez calistirir; join'de planner
+            # kullanicinin her task'i icin MATCH'i yeniden calistirabilir
+            fts = table(FTS_TABLE, column("rowid"))
+            matches = select(fts.c.rowid).where(
+                literal_column(FTS_TABLE).op("MATCH")(sqlite_match_query(self.terms))
+            )
+            return query.where(TaskEntity.id.in_(matches))
+        if self.terms and self.dialect == "postgresql":
+            tsquery = func.to_tsquery(
+                settings.search_pg_config, postgres_tsquery(self.terms)
+            )
+            condition: ColumnElement[bool] = (
+                literal_column("tasks.search_vector").op("@@")(tsquery)
+            )
+            if settings.search_trigram_enabled:
+                pattern = f"%{self.search}%"
+                condition = or_(
+                    condition,
+                    TaskEntity.title.ilike(pattern),
+                    TaskEntity.description.ilike(pattern)
+                )
+            return query.where(condition)
+        return TaskSearchSpecification(self.search).apply(query)
+
 class PaginationSpecification(Specification[TaskEntity]):
     """Veritabanı sonuçlarını sayfalara böler(offset ve limit mantığıyla)"""
     def __init__(self,page:int, page_size:int):
@@ -76,6 +139,27 @@ class PaginationSpecification(Specification[TaskEntity]):
         offset = (self.page -1) * self.page_size
         return query.offset(offset).limit(self.page_size)
 
+class KeysetPaginationSpecification(PaginationSpecification):
+    """
+    Cursor (keyset) sayfalama: created_at DESC, id DESC siralamasinda
+    verilen (created_at, id) noktasindan sonraki kayitlari getirir.
+
+    OFFSET kullanmadigi icin (user_id, created_at, id) index'iyle her sayfa
+    ilk sayfa kadar ucuzdur. Sonraki sayfa olup olmadigini anlamak icin
+    page_size + 1 kayit ister. Cursor yoksa ilk sayfayi getirir.
+    """
+    def __init__(self, page_size: int, after: tuple[datetime, int] | None = None):
+        super().__init__(1, page_size)
+        self.after = after
+
+    def apply(self, query: Select) -> Select:
+        if self.after is not None:
+            key = tuple_(TaskEntity.created_at, TaskEntity.id)
+            query = query.where(key < tuple_(*self.after))
+        return query.order_by(
+            desc(TaskEntity.created_at), desc(TaskEntity.id)
+        ).limit(self.page_size + 1)
+
 class OrderBySpecification(Specification[TaskEntity]):
     """Sonuçları belirli bir kolona göre artan veya azalan şekilde sıralar."""
     def __init__(self, field: str, descending: bool = False):
@@ -86,4 +170,50 @@ class OrderBySpecification(Specification[TaskEntity]):
         column = getattr(TaskEntity,self.field,TaskEntity.id)
         order_func = desc if self.descending else asc
         return query.order_by(order_func(column))
+
+class SearchRankSpecification(OrderBySpecification):
+    """
+    SearchSpecification sonuclarini alakaya gore (en alakali once) siralar.
+
+    Baslik eslesmeleri aciklamadan agir basar: sqlite'ta bm25 agirliklari,
+    postgresql'de tsvector agirliklari (A/B) ile ts_rank. Ayni sorguda
+    SearchSpecification'in da uygulanmis olmasi gerekir. Siralama oldugu
+    icin count sorgularina uygulanmaz; sqlite'ta skor join'i de bu yuzden
+    filtreden ayri tutulur.
+    """
+    TITLE_WEIGHT = 10.0
+    DESCRIPTION_WEIGHT = 1.0
+
+    def __init__(self, search: str, dialect: str):
+        super().__init__("id")
+        self.dialect = dialect
+        self.terms = search_terms(search)
+
+    def apply(self, query: Select) -> Select:
+        if self.terms and self.dialect == "sqlite":
+            # bm25 sadece MATCH'in FTS tablosunu surdugu sorguda calisir; bu
+            # yuzden skorlar once MATERIALIZED bir CTE'de toplanir.
+            # Kucuk (negatif) deger daha alakali.
+            fts = table(FTS_TABLE, column("rowid"))
+            hits = (
+                select(
+                    fts.c.rowid.label("id"),
+                    func.bm25(
+                        literal_column(FTS_TABLE),
+                        self.TITLE_WEIGHT,
+                        self.DESCRIPTION_WEIGHT,
+                    ).label("rank")
+                )
+                .where(literal_column(FTS_TABLE).op("MATCH")(sqlite_match_query(self.terms)))
+                .cte(SEARCH_HITS)
+                .prefix_with("MATERIALIZED")
+            )
+            return query.join(hits, hits.c.id == TaskEntity.id).order_by(hits.c.rank)
+        if self.terms and self.dialect == "postgresql":
+            tsquery = func.to_tsquery(
+                settings.search_pg_config, postgres_tsquery(self.terms)
+            )
+            rank = func.ts_rank(literal_column("tasks.search_vector"), tsquery)
+            return query.order_by(desc(rank))
+        return query
     
\ No newline at end of file
@@ -1,7 +1,10 @@
-from sqlalchemy import select
+from typing import Any
+
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.entities import TaskEntity
+from app.models.task import TaskStatus
 
 from .base import BaseRepository
 
@@ -15,4 +18,132 @@ class TaskRepository(BaseRepository[TaskEntity]):
         query = select(TaskEntity).where(TaskEntity.user_id == user_id)
         result = await self.session.execute(query)
 
-        return list(result.scalars().all())
\ No newline at end of file
+        return list(result.scalars().all())
+
+    async def update_owned(
+        self,
+        task_id: int,
+        user_id: int,
+        values: dict[str, Any],
+        unless_status: TaskStatus | None = None,
+    ) -> TaskEntity | None:
+        """
+        Kullaniciya ait taski tek statement ile gunceller:
+        UPDATE ... WHERE id=:id AND user_id=:uid RETURNING *
+
+        Args:
+            task_id: Guncellenecek task
+            user_id: Sahip; baska kullanicinin taski bulunamamis sayilir
+            values: Degisecek kolonlar (bos ise sadece okunur)
+            unless_status: Verilirse, task zaten bu statusteyse guncellenmez
+                (or. "completed'a gecis" tespiti icin)
+        Returns:
+            Guncel task; task yoksa, baskasinin ise veya unless_status
+            kosuluna takildiysa None.
+        """
+        conditions = [TaskEntity.id == task_id, TaskEntity.user_id == user_id]
+        if unless_status is not None:
+            conditions.append(TaskEntity.status != unless_status)
+
+        if not values:
+            return await self.session.scalar(select(TaskEntity).where(*conditions))
+
+        query = (
+            update(TaskEntity)
+            .where(*conditions)
+            .values(**values)
+            .returning(TaskEntity)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def delete_owned(self, task_id: int, user_id: int) -> bool:
+        """
+        Kullaniciya ait taski tek statement ile siler:
+        DELETE ... WHERE id=:id AND user_id=:uid RETURNING id
+
+        Returns:
+            Silindiyse True; task yoksa veya baskasinin ise False.
+        """
+        query = (
+            delete(TaskEntity)
+            .where(TaskEntity.id == task_id, TaskEntity.user_id == user_id)
+            .returning(TaskEntity.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none() is not None
+
+    async def create_many(self, rows: list[dict[str, Any]]) -> list[TaskEntity]:
+        """
+        Task'lari tek multi-row INSERT ... RETURNING ile olusturur.
+
+        Args:
+            rows: Kolon degerleri (user_id dahil)
+        Returns:
+            Olusturulan task'lar, rows ile ayni sirada.
+        """
+        if not rows:
+            return []
+        # sort_by_parameter_order sqlite'ta satir basina INSERT'e duser.
+        # RETURNING sirasi garanti degil ama id'ler VALUES sirasiyla
+        # verildigi icin id'ye gore siralamak istek sirasini geri verir.
+        query = insert(TaskEntity).returning(TaskEntity)
+        result = await self.session.scalars(query, rows)
+        return sorted(result.all(), key=lambda task: task.id)
+
+    async def update_many_owned(
+        self,
+        task_ids: list[int],
+        user_id: int,
+        values: dict[str, Any],
+        unless_status: TaskStatus | None = None,
+    ) -> list[TaskEntity]:
+        """
+        Kullaniciya ait task'lara ayni degerleri tek statement ile uygular:
+        UPDATE ... WHERE id IN (...) AND user_id=:uid RETURNING *
+
+        Args ve kosullar update_owned ile aynidir.
+        Returns:
+            Guncellenen task'lar (sira garanti edilmez); yok olan, baskasina
+            ait olan veya unless_status'a takilan id'ler listede yer almaz.
+        """
+        if not task_ids:
+            return []
+        conditions = [TaskEntity.id.in_(task_ids), TaskEntity.user_id == user_id]
+        if unless_status is not None:
+            conditions.append(TaskEntity.status != unless_status)
+
+        if not values:
+            result = await self.session.scalars(select(TaskEntity).where(*conditions))
+            return list(result.all())
+
+        query = (
+            update(TaskEntity)
+            .where(*conditions)
+            .values(**values)
+            .returning(TaskEntity)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result = await self.session.scalars(query)
+        return list(result.all())
+
+    async def delete_many_owned(self, task_ids: list[int], user_id: int) -> set[int]:
+        """
+        Kullaniciya ait task'lari tek statement ile siler:
+        DELETE ... WHERE id IN (...) AND user_id=:uid RETURNING id
+
+        Returns:
+            Silinen task id'leri; yok olan veya baskasina ait olanlar haric.
+        """
+        if not task_ids:
+            return set()
+        query = (
+            delete(TaskEntity)
+            .where(TaskEntity.id.in_(task_ids), TaskEntity.user_id == user_id)
+            .returning(TaskEntity.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.scalars(query)
+        return set(result.all())
@@ -9,6 +9,17 @@ from .base import BaseRepository
 class UserRepository(BaseRepository[UserEntity]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, UserEntity)
+        # Bu transaction'da degisen kullanicilar; commit sonrasi principal
+        # cache'ten silinirler (bkz. TaskUnitOfWork.commit)
+        self.changed_ids: set[int] = set()
+
+    async def update(self, entity: UserEntity) -> UserEntity:
+        self.changed_ids.add(entity.id)
+        return await super().update(entity)
+
+    async def delete(self, entity: UserEntity) -> None:
+        self.changed_ids.add(entity.id)
+        await super().delete(entity)
 
     async def get_by_email(self, email: str) -> UserEntity | None:
         query = select(UserEntity).where(UserEntity.email == email)
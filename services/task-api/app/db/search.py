@@ -0,0 +1,107 @@
+"""
+Task full-text search altyapisi.
+
+ILIKE '%terim%' hicbir index'i kullanamaz; arama maliyeti kullanicinin task
+sayisiyla dogrusal artar. Bu modul dialect'e gore index'li bir arama
+backend'i kurar:
+
+    - PostgreSQL: tasks.search_vector (GENERATED tsvector, baslik 'A',
+      aciklama 'B' agirlikli) + GIN index. Opsiyonel olarak pg_trgm ile
+      baslik/aciklama uzerinde trigram GIN index'leri (alt dize eslesmesi).
+    - SQLite: tasks tablosunu kaynak alan FTS5 sanal tablosu (tasks_fts);
+      INSERT/UPDATE/DELETE trigger'lari ile senkron tutulur.
+
+DDL metadata.create_all'a entity event'leriyle verilir. Alembic
+migration'i (8f3d2a6c41b7) ayni DDL'in dondurulmus bir kopyasini icerir;
+buradaki degisiklikler yeni bir migration gerektirir.
+Sorgu tarafi icin bkz. SearchSpecification / SearchRankSpecification.
+"""
+import re
+
+from sqlalchemy import DDL, event
+from sqlalchemy.sql import FromClause
+
+from app.config import settings
+
+FTS_TABLE = "tasks_fts"
+
+SQLITE_CREATE_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description,
+        content='tasks', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_fts_au
+    AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+
+def postgres_create_ddl(trigram: bool | None = None) -> list[str]:
+    """PostgreSQL arama kolonu ve index DDL'leri (trigram opsiyonel)."""
+    config = settings.search_pg_config
+    statements = [
+        f"""ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('{config}', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('{config}', coalesce(description, '')), 'B')
+        ) STORED""",
+        "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector "
+        "ON tasks USING GIN (search_vector)",
+    ]
+    if settings.search_trigram_enabled if trigram is None else trigram:
+        statements += [
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+            "CREATE INDEX IF NOT EXISTS ix_tasks_title_trgm "
+            "ON tasks USING GIN (title gin_trgm_ops)",
+            "CREATE INDEX IF NOT EXISTS ix_tasks_description_trgm "
+            "ON tasks USING GIN (description gin_trgm_ops)",
+        ]
+    return statements
+
+
+def register_search_ddl(table: FromClause) -> None:
+    """
+    Arama DDL'ini tablonun create/drop event'lerine baglar.
+
+    Boylece create_all (testler, gelistirme) da FTS tablosunu ve
+    trigger'lari / tsvector kolonunu olusturur.
+    """
+    for statement in SQLITE_CREATE_DDL:
+        ddl = DDL(statement).execute_if(dialect="sqlite")
+        event.listen(table, "after_create", ddl)
+    for statement in postgres_create_ddl():
+        ddl = DDL(statement).execute_if(dialect="postgresql")
+        event.listen(table, "after_create", ddl)
+    # tasks_fts, tasks'a bagli ayri bir tablo; tasks ile birlikte silinmeli
+    drop_fts = DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect="sqlite")
+    event.listen(table, "after_drop", drop_fts)
+
+
+# --- SORGU YARDIMCILARI ---
+
+def search_terms(search: str) -> list[str]:
+    """Arama metnini kelimelere ayirir; operator/tirnak gibi karakterler atilir."""
+    return re.findall(r"\w+", search.lower())
+
+
+def sqlite_match_query(terms: list[str]) -> str:
+    """FTS5 MATCH ifadesi: her kelime on ek (prefix) olarak, hepsi AND."""
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def postgres_tsquery(terms: list[str]) -> str:
+    """to_tsquery ifadesi: her kelime on ek (prefix) olarak, hepsi AND."""
+    return " & ".join(f"{term}:*" for term in terms)
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.repositories.task import TaskRepository
 from app.db.repositories.user import UserRepository
+from app.core.principal_cache import principal_cache
 from app.core.resilience import with_db_retry
 
 class BaseUnitOfWork(ABC):
@@ -50,14 +51,16 @@ class TaskUnitOfWork(BaseUnitOfWork):
     @with_db_retry
     async def commit(self):
         """
-        Degisiklikleri kaydeder ve veritabanindan gelen guncel bilgileri(ID vb.)
-        nesnelere geri yukler(refresh).
+        Degisiklikleri kaydeder.
+
+        Sunucuda uretilen degerler (ID, updated_at) entity'lerde
+        eager_defaults ile yazma statement'inin RETURNING'inden gelir;
+        session'da kac nesne yuklu olursa olsun commit ekstra SELECT yapmaz.
         """
         await super().commit()
-        
-        for obj in self.session.identity_map.values():
-            try:
-                await self.session.refresh(obj)
-            except Exception:
-                #Bazi nesneler(silinenler vs.) refresh edilemez onlari atlamaliyiz.
-                continue
\ No newline at end of file
+
+        # Degisen kullanicilar commit'ten SONRA cache'ten silinir; once
+        # silinseydi araya giren bir istek eski satiri tekrar cache'leyebilirdi.
+        if self.users.changed_ids and principal_cache is not None:
+            await principal_cache.invalidate(*self.users.changed_ids)
+        self.users.changed_ids.clear()
\ No newline at end of file
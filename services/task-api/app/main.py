@@ -13,6 +13,7 @@ from app.core.middleware import RateLimitMiddleware
 from app.api.v1.health import router as health_router
 from app.core.correlation import CorrelationIdMiddleware
 from app.core.messaging import rabbitmq_client
+from app.core.token_revocation import token_revocation
 
 setup_logging()
 
@@ -23,11 +24,14 @@ logger.info("Starting my little tiny app...(finally i made it)")
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await redis_cache.connect()
+    await token_revocation.start()
     await rabbitmq_client.connect()
     logger.info("Database tables created")
     yield
     
     await rabbitmq_client.disconnect()
+    await token_revocation.stop()
+    await redis_cache.disconnect()
     logger.info("Shutting down application...")
 
 
@@ -20,6 +20,10 @@ class PaginationParams(BaseModel):
     """Sayfalama Parametreleri"""
     page: int = Field(default=1,ge=1,descriptiption="Sayfa numarasi")
     page_size : int =Field(default=10, ge=1, le=100, description="Sayfa basina kayit")
+    # Verilirse sayfa numarasi yerine cursor (keyset) sayfalama kullanilir
+    cursor: str | None = Field(
+        default=None, description="Onceki sayfanin next_cursor degeri"
+    )
 
 class PaginatedResponse(BaseModel, Generic[T]):
     """Sayfalama icin response modeli """
@@ -28,3 +32,11 @@ class PaginatedResponse(BaseModel, Generic[T]):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = None # cursor sayfalamaya gecis icin
+    total_is_estimate: bool = False # True ise total cache'lenmis/tahmini bir degerdir
+
+class CursorPaginatedResponse[T](BaseModel):
+    """Cursor (keyset) sayfalama icin response modeli; toplam sayi hesaplanmaz."""
+    items: list[T]
+    page_size: int
+    next_cursor: str | None = None
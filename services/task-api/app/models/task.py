@@ -3,6 +3,8 @@ from enum import Enum
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.models.common import ErrorDetail
+
 
 class TaskStatus(str, Enum):
     PENDING = "pending"
@@ -49,4 +51,39 @@ class TaskFilter(BaseModel):
     """Task Filtreleme parametreleri"""
     status: TaskStatus | None = None
     priority: TaskPriority | None = None
-    search: str | None = None
\ No newline at end of file
+    search: str | None = None
+
+
+class TaskBatchCreate(BaseModel):
+    """Toplu task olusturma istegi"""
+    items: list[TaskCreate] = Field(..., min_length=1)
+
+
+class TaskBatchUpdateItem(TaskUpdate):
+    """Toplu guncellemede tek bir task: id ve degisecek alanlar"""
+    id: int
+
+
+class TaskBatchUpdate(BaseModel):
+    """Toplu task guncelleme istegi"""
+    items: list[TaskBatchUpdateItem] = Field(..., min_length=1)
+
+
+class TaskBatchDelete(BaseModel):
+    """Toplu task silme istegi"""
+    ids: list[int] = Field(..., min_length=1)
+
+
+class TaskBatchItemResult(BaseModel):
+    """Toplu islemde tek bir ogenin sonucu; istekteki sirayla doner."""
+    id: int
+    success: bool
+    data: TaskResponse | None = None
+    error: ErrorDetail | None = None
+
+
+class TaskBatchResult(BaseModel):
+    """Toplu islem sonucu"""
+    items: list[TaskBatchItemResult]
+    succeeded: int
+    failed: int
@@ -29,6 +29,24 @@ class UserResponse(BaseModel):
     created_at: datetime
 
 
+class UserPrincipal(BaseModel):
+    """
+    Istegi yapan dogrulanmis kullanici (get_current_user'in dondurdugu deger).
+
+    Yetkilendirme icin gereken alanlari tasir; sifre hash'i icermez.
+    Kisa sureli cache'lendigi icin (bkz. PrincipalCache) DB entity'si
+    yerine bu model kullanilir.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+    id: int
+    email: str
+    full_name: str | None
+    is_active: bool
+    is_superuser: bool
+    created_at: datetime
+
+
 class TokenResponse(BaseModel):
     """Giris Basarili oldugunda donecek token paketi"""
 
@@ -37,9 +55,16 @@ class TokenResponse(BaseModel):
     token_type: str = "bearer"
 
 
+class LogoutRequest(BaseModel):
+    """Cikis istegi; verilirse refresh token da iptal edilir."""
+
+    refresh_token: str | None = None
+
+
 class TokenPayload(BaseModel):
     """JWT Token'in sifrelenmis icerigi(Payload)."""
 
     sub: str  # User ID (Subject)
     exp: datetime
     type: str  # "Access" veya "Refresh"
+    jti: str | None = None  # Token id'si (iptal icin)
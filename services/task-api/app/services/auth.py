@@ -16,9 +16,10 @@ from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
 )
+from app.core.token_revocation import token_revocation
 from app.db.entities import UserEntity
 from app.db.unit_of_work import TaskUnitOfWork
 from app.models.user import TokenResponse, UserCreate, UserLogin, UserResponse
@@ -55,7 +56,7 @@ class AuthService:
         if existing_user:
             raise UserAlreadyExistException(email=user_in.email)
 
-        hashed_password = hash_password(user_in.password)
+        hashed_password = await hash_password_async(user_in.password)
         new_user = UserEntity(
             email=user_in.email,
             hashed_password=hashed_password,
@@ -88,7 +89,7 @@ class AuthService:
             raise InvalidCredentialsException()
 
         # sifreyi dogrula
-        if not verify_password(user_in.password, user.hashed_password):
+        if not await verify_password_async(user_in.password, user.hashed_password):
             raise InvalidCredentialsException()
 
         return TokenResponse(
@@ -100,15 +101,22 @@ class AuthService:
         """
         Gecerli bir refresh token kullanarak yeni bir token cifti uretir
 
+        Kullanilan refresh token iptal edilir (rotasyon); ayni token ikinci
+        kez kullanilamaz.
+
         Args:
             refresh_token (str) : Kullanicinin elindeki yenileme token'i.
         Raises:
-            InvalidTokenException: Token gecersizse veya tipi yanlissa.
+            InvalidTokenException: Token gecersiz, iptal edilmis veya tipi yanlissa.
         """
         # Token'i coz ve dogrula.
         payload = decode_token(refresh_token)
         if not payload or payload.get("type") != "refresh":
             raise InvalidTokenException()
+        # Kontrol ve iptal tek adimda (SET NX): ayni token ile es zamanli iki
+        # istekten yalnizca biri yeni token alir.
+        if not await token_revocation.revoke(payload.get("jti"), payload.get("exp")):
+            raise InvalidTokenException()
 
         # Yeni Tokenleri bass
 
@@ -117,3 +125,32 @@ class AuthService:
             access_token=create_access_token(user_id),
             refresh_token=create_refresh_token(user_id),
         )
+
+    async def logout(
+        self, access_payload: dict, refresh_token: str | None = None
+    ) -> None:
+        """
+        Oturumu kapatir: access token'i ve (verildiyse) refresh token'i iptal eder.
+
+        Args:
+            access_payload (dict): Istegi yapan dogrulanmis access token'in payload'i.
+            refresh_token (str | None): Birlikte iptal edilecek refresh token.
+        Raises:
+            InvalidTokenException: Refresh token gecersizse veya baskasina aitse.
+        """
+        if refresh_token is not None:
+            refresh_payload = decode_token(refresh_token)
+            if (
+                not refresh_payload
+                or refresh_payload.get("type") != "refresh"
+                or refresh_payload.get("sub") != access_payload.get("sub")
+            ):
+                raise InvalidTokenException()
+            await token_revocation.revoke(
+                refresh_payload.get("jti"), refresh_payload.get("exp")
+            )
+
+        await token_revocation.revoke(
+            access_payload.get("jti"), access_payload.get("exp")
+        )
+        logger.info(f"User logged out:{access_payload.get('sub')}")
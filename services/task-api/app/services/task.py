@@ -1,38 +1,262 @@
 
 # --- CACHE IMPORTLARI ---
-from asyncio import create_task
+import base64
+import json
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import UTC, datetime
+from typing import NamedTuple
+
+from pydantic import TypeAdapter
+
 from app.core.cache import redis_cache
+from app.config import settings
 from app.core.cache_keys import (
     get_task_detail_cache_key,
+    get_task_generation_key,
+    get_task_list_body_cache_key,
     get_task_list_cache_key,
-    get_task_user_pattern,
+    get_task_list_total_cache_key,
 )
 from app.core.events import task_event_publisher
+from app.models.events import TaskEventType
 from app.models.task import TaskStatus
-from app.core.exceptions import TaskNotFoundException
+from app.core.exceptions import (
+    TaskBadRequestException,
+    TaskBatchTooLargeException,
+    TaskNotFoundException,
+)
 from app.core.logging import get_logger
+from app.core.single_flight import task_list_single_flight
 from app.db.entities import TaskEntity
 from app.db.repositories.specifications import (
+    KeysetPaginationSpecification,
+    OrderBySpecification,
     PaginationSpecification,
+    SearchRankSpecification,
+    SearchSpecification,
     Specification,
     TaskPrioritySpecification,
-    TaskSearchSpecification,
     TaskStatusSpecification,
     TaskUserSpecification,
 )
 
 #--- UNIT OF PATTERN IMPORTLARI
+from app.db.database import async_session_maker
 from app.db.unit_of_work import TaskUnitOfWork
-from app.models.common import PaginationParams
-from app.models.task import TaskCreate, TaskFilter, TaskResponse, TaskUpdate
+from app.models.common import (
+    ApiResponse,
+    CursorPaginatedResponse,
+    ErrorDetail,
+    PaginatedResponse,
+    PaginationParams,
+)
+from app.models.task import (
+    TaskBatchItemResult,
+    TaskBatchResult,
+    TaskBatchUpdateItem,
+    TaskCreate,
+    TaskFilter,
+    TaskResponse,
+    TaskUpdate,
+)
 
 logger = get_logger(__name__)
 
+_datetime_adapter = TypeAdapter(datetime)
+
+
+def _encode_cursor(task: TaskResponse) -> str:
+    """Sayfanin son task'indan opak (base64url) cursor uretir."""
+    raw = json.dumps(
+        {"c": task.created_at.isoformat(), "i": task.id}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(raw.encode()).rstrip(b"=").decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Cursor'i (created_at, id) seek noktasina cozer.
+
+    Raises:
+        TaskBadRequestException: Cursor bozuk veya bu API'ye ait degilse.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        return datetime.fromisoformat(data["c"]), int(data["i"])
+    except (ValueError, TypeError, KeyError):
+        raise TaskBadRequestException("Invalid pagination cursor") from None
+
+
+class TaskPage(NamedTuple):
+    """
+    Bir liste sayfasi.
+
+    Attributes:
+        items: Sayfadaki task'lar
+        total: Filtrelenmis toplam kayit (cursor modunda None)
+        next_cursor: Sonraki sayfanin cursor'i (son sayfada None)
+        total_is_estimate: total cache'lenmis/tahmini bir deger mi
+    """
+    items: list[TaskResponse]
+    total: int | None
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
+
+
+def _check_batch(task_ids: list[int] | None, size: int) -> None:
+    """
+    Toplu istegin boyutunu ve (varsa) id tekrarlarini kontrol eder.
+
+    Raises:
+        TaskBatchTooLargeException: task_batch_max_size asildiysa.
+        TaskBadRequestException: Ayni id birden fazla kez verildiyse.
+    """
+    if size > settings.task_batch_max_size:
+        raise TaskBatchTooLargeException(size, settings.task_batch_max_size)
+    if task_ids is not None and len(set(task_ids)) != len(task_ids):
+        raise TaskBadRequestException("Duplicate task ids in batch")
+
+
+def _build_batch_result(
+        task_ids: list[int],
+        tasks: Mapping[int, TaskResponse | None]
+) -> TaskBatchResult:
+    """
+    Istekteki sirayla oge bazli sonuclari olusturur.
+
+    tasks'ta olmayan id'ler (yok veya baska kullaniciya ait) TASK_NOT_FOUND
+    ile basarisiz sayilir; silmede basarili ogelerin degeri None'dur.
+    """
+    items = []
+    for task_id in task_ids:
+        if task_id in tasks:
+            items.append(
+                TaskBatchItemResult(id=task_id, success=True, data=tasks[task_id])
+            )
+        else:
+            error = TaskNotFoundException(task_id=task_id)
+            items.append(TaskBatchItemResult(
+                id=task_id,
+                success=False,
+                error=ErrorDetail(code=error.error_code, message=error.message)
+            ))
+    succeeded = sum(item.success for item in items)
+    return TaskBatchResult(
+        items=items, succeeded=succeeded, failed=len(items) - succeeded
+    )
+
+
+def _encode_task_page(page: TaskPage) -> dict:
+    """TaskPage'i cache'e yazilacak JSON-uyumlu dict'e cevirir."""
+    return {
+        "items": [t.model_dump() for t in page.items],
+        "total": page.total,
+        "next_cursor": page.next_cursor,
+        "total_is_estimate": page.total_is_estimate,
+    }
+
+
+def _decode_task_page(data: dict) -> TaskPage:
+    """Cache'deki liste verisini TaskPage'e donusturur."""
+    return TaskPage(
+        items=[TaskResponse.model_validate(item) for item in data["items"]],
+        total=data["total"],
+        next_cursor=data.get("next_cursor"),
+        total_is_estimate=data.get("total_is_estimate", False),
+    )
+
+
+def _render_task_page_body(page: TaskPage, pagination: PaginationParams) -> bytes:
+    """
+    Liste sayfasini API response JSON'una render eder, timestamp haric.
+
+    ApiResponse'un son alani timestamp oldugu icin body'nin geri kalani
+    sabit bir prefix olarak cache'lenebilir (bkz. _stamp_response_body).
+    Cursor modunda toplam sayi ve sayfa numarasi yoktur.
+    """
+    data: PaginatedResponse[TaskResponse] | CursorPaginatedResponse[TaskResponse]
+    if pagination.cursor is not None:
+        data = CursorPaginatedResponse[TaskResponse](
+            items=page.items,
+            page_size=pagination.page_size,
+            next_cursor=page.next_cursor
+        )
+    else:
+        # Sayfa modunda total her zaman doludur
+        total = page.total or 0
+        total_pages = (total + pagination.page_size - 1) // pagination.page_size
+        data = PaginatedResponse[TaskResponse](
+            items=page.items,
+            total=total,
+            page=pagination.page,
+            page_size=pagination.page_size,
+            total_pages=total_pages,
+            next_cursor=page.next_cursor,
+            total_is_estimate=page.total_is_estimate
+        )
+    response = ApiResponse(success=True, data=data)
+    body, _, _ = response.model_dump_json().encode().rpartition(b',"timestamp":')
+    return body
+
+
+def _stamp_response_body(body: bytes) -> bytes:
+    """Cache'lenmis body prefix'ine guncel timestamp'i ekleyip JSON'u kapatir."""
+    timestamp = _datetime_adapter.dump_json(datetime.now(UTC))
+    return body + b',"timestamp":' + timestamp + b"}"
+
 
 class TaskService:
     def __init__(self, uow: TaskUnitOfWork):
         self.uow = uow
 
+    async def _get_cache_generation(self, user_id: int) -> int:
+        """Kullanicinin guncel cache generation'ini dondurur."""
+        return await redis_cache.get_generation(get_task_generation_key(user_id))
+
+    async def _invalidate_user_cache(self, user_id: int) -> None:
+        """
+        Kullanicinin tum liste cache'ini gecersiz kilar.
+
+        KEYS/SCAN yerine generation sayacini tek bir INCR ile arttirir;
+        eski key'ler okunmaz hale gelir ve TTL ile kendiliginden silinir.
+        """
+        await redis_cache.bump_generation(get_task_generation_key(user_id))
+
+    async def _write_through_task(self, user_id: int, task: TaskResponse) -> None:
+        """
+        Commit sonrasi taskin taze halini detay cache'ine yazar.
+
+        Boylece yazmanin hemen ardindan gelen get_by_id (read-after-write)
+        DB'ye gitmez. Ayni id icin daha once yazilmis bir tombstone da
+        bu sekilde ezilir. Write-through kapaliysa detay key'i sadece silinir.
+        """
+        cache_key = get_task_detail_cache_key(user_id, task.id)
+        if not settings.cache_write_through_enabled:
+            await redis_cache.delete(cache_key)
+            return
+        await redis_cache.set(
+            cache_key, task.model_dump(), local_value=task, broadcast=True
+        )
+
+    async def _write_through_tasks(
+        self, user_id: int, tasks: list[TaskResponse]
+    ) -> None:
+        """_write_through_task'in toplu hali; tek pipeline ve tek pub/sub mesaji."""
+        if not tasks:
+            return
+        detail_tasks = {
+            get_task_detail_cache_key(user_id, task.id): task for task in tasks
+        }
+        if not settings.cache_write_through_enabled:
+            await redis_cache.delete_many(list(detail_tasks))
+            return
+        await redis_cache.set_many(
+            {key: task.model_dump() for key, task in detail_tasks.items()},
+            local_values=detail_tasks,
+            broadcast=True
+        )
+
     async def create(self, task_in: TaskCreate, user_id: int) -> TaskResponse:
         """Yeni task olusturur ve user_id'yi otomatik atar"""
         logger.info(f"Creating task for user{user_id}: {task_in.title}")
@@ -40,11 +264,13 @@ class TaskService:
         new_task = TaskEntity(**task_in.model_dump(), user_id=user_id)
         created_task = await self.uow.tasks.create(new_task)
         await self.uow.commit()
-        # ---CACHE INVALIDATION---
-        await redis_cache.delete_pattern(get_task_user_pattern(user_id))
 
-        # Event publish
+        # ---CACHE: detay write-through, liste sayfalari invalidate---
         task_response= TaskResponse.model_validate(created_task)
+        await self._write_through_task(user_id, task_response)
+        await self._invalidate_user_cache(user_id)
+
+        # Event publish
         await task_event_publisher.publish_task_created(
             task_id=created_task.id,
             user_id=user_id,
@@ -58,120 +284,349 @@ class TaskService:
               user_id: int,
               filters:TaskFilter,
               pagination:PaginationParams | None = None
-              ) -> tuple[list[TaskResponse],int]:
-        """Sadece kullaniciya ait filtrelenmis ve sayfalanmis tasklari(cache'li) getirir."""
+              ) -> TaskPage:
+        """
+        Sadece kullaniciya ait filtrelenmis ve sayfalanmis tasklari(cache'li) getirir.
+
+        Returns:
+            TaskPage; cursor modunda total None'dur.
+        Raises:
+            TaskBadRequestException: Cursor gecersizse.
+        """
         logger.info(f"Fetching All Tasks for user {user_id}")
+        if pagination and pagination.cursor:
+            _decode_cursor(pagination.cursor)
 
         # ---Cache KEY olusturalim.
+        generation = await self._get_cache_generation(user_id)
         cache_key = get_task_list_cache_key(
             user_id=user_id,
             status=filters.status.value if filters.status else None,
             priority=filters.priority.value if filters.priority else None,
             search=filters.search,
-            page=pagination.page if pagination else 1
+            page=pagination.page if pagination else 1,
+            generation=generation,
+            page_size=pagination.page_size if pagination else 0,
+            cursor=pagination.cursor if pagination else None
+        )
+
+        # --- CACHE: hit'lerde gerekirse arka planda erken yenilenir (XFetch).
+        # Miss'lerde worker icinde single-flight, worker'lar arasinda Redis lock'u
+        # sayesinde ayni sayfa icin tek bir DB yuklemesi yapilir.
+        return await task_list_single_flight.do(
+            cache_key,
+            lambda: redis_cache.get_or_compute(
+                cache_key,
+                compute=lambda: self._load_task_page(
+                    self.uow, user_id, filters, pagination
+                ),
+                refresh=lambda: self._with_own_uow(
+                    lambda uow: self._load_task_page(uow, user_id, filters, pagination)
+                ),
+                encoder=_encode_task_page,
+                decoder=_decode_task_page,
+                lock_ttl_ms=settings.cache_lock_ttl_ms,
+            )
+        )
+
+    async def get_all_response_body(
+            self,
+            user_id: int,
+            filters: TaskFilter,
+            pagination: PaginationParams
+    ) -> bytes:
+        """
+        Liste endpoint'inin JSON body'sini hazir byte olarak dondurur.
+
+        Render edilmis ApiResponse[PaginatedResponse[TaskResponse]] body'si
+        ayrica cache'lenir. Hit durumunda ne JSON parse, ne Pydantic
+        validation ne de tekrar JSON encode yapilir; byte'lar dogrudan
+        Response'a yazilir.
+
+        Body, timestamp alani haric saklanir; timestamp her istekte
+        guncel zamanla eklenir.
+        """
+        generation = await self._get_cache_generation(user_id)
+        body_key = get_task_list_body_cache_key(
+            user_id=user_id,
+            status=filters.status.value if filters.status else None,
+            priority=filters.priority.value if filters.priority else None,
+            search=filters.search,
+            page=pagination.page,
+            generation=generation,
+            page_size=pagination.page_size,
+            cursor=pagination.cursor
+        )
+
+        cached_body = await redis_cache.get_raw(body_key)
+        if cached_body is not None:
+            logger.debug(f"Cache HIT for rendered body: {body_key}")
+            return _stamp_response_body(cached_body)
+
+        page = await self.get_all(
+            user_id=user_id, filters=filters, pagination=pagination
         )
+        body = _render_task_page_body(page, pagination)
+        await redis_cache.set_raw(body_key, body)
 
-        # --- CACHE'den denetelim
-        cached_data = await redis_cache.get(cache_key)
-        if cached_data:
-            logger.debug(f"Cache HIT for key:{cache_key}")
-            items= [TaskResponse.model_validate(item) for item in cached_data["items"]]
-            return items, cached_data["total"]
-        logger.debug(f"Cache MISS for key: {cache_key}")
+        return _stamp_response_body(body)
 
-        # --- DB'DEN CEK
+    async def _load_task_page(
+            self,
+            uow: TaskUnitOfWork,
+            user_id: int,
+            filters: TaskFilter,
+            pagination: PaginationParams | None
+    ) -> TaskPage:
+        """
+        Liste sayfasini, toplam kayit sayisini ve sonraki sayfanin cursor'ini
+        DB'den yukler.
+
+        Sayfa modunda sayfa ve toplam tek sorguda (COUNT(*) OVER()) gelir.
+        task_list_total_estimate_threshold aciksa ve kullanicinin bu filtre
+        icin cache'lenmis toplami esigin ustundeyse exact count hic
+        calistirilmaz; cache'teki deger tahmini total olarak doner.
+
+        Cursor modunda OFFSET yerine (created_at, id) seek'i kullanilir ve
+        count calistirilmaz; derin sayfalar ilk sayfa kadar ucuzdur.
+
+        Yuklenen task'larin detay cache'i de ayni anda doldurulur; listeden
+        bir task'a tiklayan istemci icin get_by_id DB'ye gitmez.
+        """
+        logger.debug(f"Loading task page from DB for user {user_id}")
         specs:list[Specification] = [TaskUserSpecification(user_id)]
-        
+        dialect = uow.session.get_bind().dialect.name
+        search = filters.search if filters else None
+
         if filters:
             if filters.status:
                 specs.append(TaskStatusSpecification(filters.status))
             if filters.priority:
                 specs.append(TaskPrioritySpecification(filters.priority))
-            if filters.search:
-                specs.append(TaskSearchSpecification(filters.search))
-        
-        #toplam sayiyi aliyoruz.
-        total = await self.uow.tasks.count(*specs)
-
-        if pagination:
-            specs.append(PaginationSpecification(pagination.page, pagination.page_size))
-        
-        entities = await self.uow.tasks.find(*specs)
+            if search:
+                specs.append(SearchSpecification(search, dialect))
+
+        total_is_estimate = False
+        if pagination and pagination.cursor is not None:
+            after = _decode_cursor(pagination.cursor) if pagination.cursor else None
+            specs.append(KeysetPaginationSpecification(pagination.page_size, after))
+            entities = await uow.tasks.find(*specs)
+            has_next = len(entities) > pagination.page_size
+            entities = entities[:pagination.page_size]
+            total = None
+        else:
+            # Aramada en alakali task'lar once; cursor modu (created_at, id)
+            # seek'i kullandigi icin orada alaka siralamasi yapilmaz.
+            if search:
+                specs.append(SearchRankSpecification(search, dialect))
+            # En yeni task'lar once; id esit created_at'ler icin sirayi sabitler.
+            # (user_id, created_at, id) index'i bu siralamayi dogrudan verir.
+            specs.append(OrderBySpecification("created_at", descending=True))
+            specs.append(OrderBySpecification("id", descending=True))
+            if pagination:
+                specs.append(
+                    PaginationSpecification(pagination.page, pagination.page_size)
+                )
+
+            total_key = get_task_list_total_cache_key(
+                user_id=user_id,
+                status=filters.status.value if filters and filters.status else None,
+                priority=(
+                    filters.priority.value if filters and filters.priority else None
+                ),
+                search=filters.search if filters else None
+            )
+            estimate_total = await self._get_estimated_total(total_key)
+            if estimate_total is not None:
+                entities = await uow.tasks.find(*specs)
+                offset = 0
+                if pagination:
+                    offset = (pagination.page - 1) * pagination.page_size
+                # Tahmin, gercekte gorulen kayitlardan az olamaz
+                total = max(estimate_total, offset + len(entities))
+                total_is_estimate = True
+                has_next = (
+                    pagination is not None and len(entities) == pagination.page_size
+                )
+            else:
+                entities, total = await uow.tasks.find_with_total(*specs)
+                await self._store_estimated_total(total_key, total)
+                has_next = (
+                    pagination is not None
+                    and pagination.page * pagination.page_size < total
+                )
 
         task_responses = [TaskResponse.model_validate(e) for e in entities]
+        # Ayni siralamayi kullandiklari icin sayfa modundan da cursor'a gecilebilir
+        next_cursor = None
+        if has_next and task_responses:
+            next_cursor = _encode_cursor(task_responses[-1])
+
+        await self._warm_detail_cache(user_id, task_responses)
+
+        return TaskPage(task_responses, total, next_cursor, total_is_estimate)
+
+    async def _get_estimated_total(self, total_key: str) -> int | None:
+        """
+        Buyuk kullanicilar icin cache'lenmis toplami dondurur.
+
+        Mod kapaliysa, cache'te deger yoksa veya deger esigin altindaysa
+        None doner (exact count yapilir).
+        """
+        threshold = settings.task_list_total_estimate_threshold
+        if threshold <= 0:
+            return None
+        total = await redis_cache.get(total_key)
+        if total is None or total < threshold:
+            return None
+        return total
+
+    async def _store_estimated_total(self, total_key: str, total: int) -> None:
+        """Esigi asan exact toplami sonraki sayfalar icin tahmin olarak saklar."""
+        threshold = settings.task_list_total_estimate_threshold
+        if 0 < threshold <= total:
+            await redis_cache.set(
+                total_key, total, ttl=settings.task_list_total_estimate_ttl_seconds
+            )
 
-        #---cache'e kaydedelim.
-        cached_data = {
-            "items": [t.model_dump() for t in task_responses],  # ✅ Mevcut listeyi kullan
-            "total": total
+    async def _find_cached_missing(self, user_id: int, task_ids: list[int]) -> set[int]:
+        """
+        Detay cache'inde tombstone'u olan (yok veya baska kullaniciya ait)
+        id'leri tek MGET ile bulur.
+
+        Toplu update/delete bu id'leri DB'ye gondermeden basarisiz sayar.
+        Hit olan task'lar decode edilip L1'e de alinir.
+        """
+        keys = {
+            get_task_detail_cache_key(user_id, task_id): task_id for task_id in task_ids
         }
-        await redis_cache.set(cache_key,cached_data)
+        cached = await redis_cache.get_many(
+            list(keys), decoder=TaskResponse.model_validate
+        )
+        return {keys[key] for key, task in cached.items() if task is None}
 
-        return task_responses, total
+    async def _warm_detail_cache(
+            self,
+            user_id: int,
+            tasks: list[TaskResponse]
+    ) -> None:
+        """
+        Task'larin detay cache'ini tek pipeline ile (tek round trip) doldurur.
+
+        SET NX kullanilir; liste yuklemesi bir yazmayla yarisirsa
+        write-through ile yazilmis taze deger eski okumayla ezilmez.
+        """
+        if not tasks:
+            return
+        detail_tasks = {
+            get_task_detail_cache_key(user_id, task.id): task
+            for task in tasks
+        }
+        await redis_cache.set_many(
+            {key: task.model_dump() for key, task in detail_tasks.items()},
+            local_values=detail_tasks,
+            nx=True
+        )
 
     async def get_by_id(self, task_id: int, user_id: int) -> TaskResponse:
         """Sadece kullanicinin kendisine ait belirli bir taski getirir"""
         logger.info(f"Fetching task for user {user_id} : {task_id}")
         
-        #1-Cache key olusturalim
-        cache_key = get_task_detail_cache_key(
-            user_id=user_id,
-            task_id=task_id
+        #1-Cache key olusturalim (detay key'i generation'dan bagimsizdir)
+        cache_key = get_task_detail_cache_key(user_id=user_id, task_id=task_id)
+        #2-Cache'den getir, yoksa DB'den yukleyip cache'e yaz.
+        # Olmayan veya baska kullaniciya ait task'lar tombstone olarak
+        # cache'lenir; tekrar eden istekler tek Redis okumasina mal olur.
+        task = await redis_cache.get_or_compute(
+            cache_key,
+            compute=lambda: self._find_task(self.uow, task_id, user_id),
+            refresh=lambda: self._with_own_uow(
+                lambda uow: self._find_task(uow, task_id, user_id)
+            ),
+            encoder=lambda task: task.model_dump(),
+            decoder=TaskResponse.model_validate,
+            negative_ttl=settings.cache_negative_ttl_seconds,
         )
-        #2-Cache den getirmeyi deneyelim once
-        cached_data = await redis_cache.get(cache_key)
-        if cached_data:
-            logger.debug(f"Cache HIT for task {task_id}")
-            return TaskResponse.model_validate(cached_data)
-        #3-DB'DEN CEKELIM.
-        entity = await self.uow.tasks.get_by_id(task_id)
+        if task is None:
+            raise TaskNotFoundException(task_id=task_id)
+        return task
+
+    async def _find_task(
+            self,
+            uow: TaskUnitOfWork,
+            task_id: int,
+            user_id: int
+    ) -> TaskResponse | None:
+        """Kullaniciya ait taski DB'den yukler, yoksa veya baskasinin ise None doner."""
+        entity = await uow.tasks.get_by_id(task_id)
 
         if not entity:
-            raise TaskNotFoundException(task_id=task_id)
+            return None
 
         # sahiplik kontrolu yapiyoruz bu task bu kullaniciya mi ait
         if entity.user_id != user_id:
             logger.warning(f"User {user_id} tried to access task {task_id}")
-            raise TaskNotFoundException(task_id=task_id)
-        
-        valid_data = TaskResponse.model_validate(entity).model_dump()
-        await redis_cache.set(cache_key,valid_data)
+            return None
 
         return TaskResponse.model_validate(entity)
 
+    @staticmethod
+    async def _with_own_uow[R](loader: Callable[[TaskUnitOfWork], Awaitable[R]]) -> R:
+        """
+        Arka plan cache yenilemeleri icin istekten bagimsiz bir session acar.
+
+        Istegin session'i response donunce kapanir; arka planda calisan
+        yenileme onu kullanamaz.
+        """
+        async with async_session_maker() as session:
+            return await loader(TaskUnitOfWork(session))
+
     async def update(
         self, task_id: int, task_in: TaskUpdate, user_id: int
     ) -> TaskResponse:
-        """Sadece kullanicinin kendisine ait taski gunceller."""
+        """
+        Sadece kullanicinin kendisine ait taski gunceller.
+
+        Okuma + Python'da sahiplik kontrolu yerine tek bir sahiplik kosullu
+        UPDATE ... RETURNING calisir. Status completed'a cekiliyorsa once
+        "zaten completed degilse" kosuluyla denenir; satir donerse bu bir
+        completed'a gecistir. Donmezse (task zaten completed veya yok)
+        kosulsuz tekrar denenir.
+        """
         logger.info(f"Updating Task for user {user_id} :{task_id}")
 
-        entity = await self.uow.tasks.get_by_id(task_id)
-
-        if not entity:
-            raise TaskNotFoundException(task_id=task_id)
+        update_data = task_in.model_dump(exclude_unset=True)
+        updated_entity = None
+        completed_transition = False
 
-        if entity.user_id != user_id:
-            logger.warning(f"User {user_id} tried to access task {task_id}")
-            raise TaskNotFoundException(task_id=task_id)
-        old_status = entity.status
+        if update_data.get("status") == TaskStatus.COMPLETED:
+            updated_entity = await self.uow.tasks.update_owned(
+                task_id, user_id, update_data, unless_status=TaskStatus.COMPLETED
+            )
+            completed_transition = updated_entity is not None
 
-        update_data = task_in.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(entity, key, value)
+        if updated_entity is None:
+            updated_entity = await self.uow.tasks.update_owned(
+                task_id, user_id, update_data
+            )
 
-        updated_entity = await self.uow.tasks.update(entity)
+        # Task yok veya baska kullaniciya ait: ikisi de 404
+        if updated_entity is None:
+            raise TaskNotFoundException(task_id=task_id)
         await self.uow.commit()
-        await redis_cache.delete_pattern(get_task_user_pattern(user_id))
 
-        #Event Publish
         task_response= TaskResponse.model_validate(updated_entity)
+        await self._write_through_task(user_id, task_response)
+        await self._invalidate_user_cache(user_id)
+
+        #Event Publish
         await task_event_publisher.publish_task_updated(
             task_id=updated_entity.id,
             user_id=user_id,
             task_data=task_response.model_dump(mode='json')
         )
         # Eger status completed'a cekildiyse ekstra event
-        if old_status != TaskStatus.COMPLETED and updated_entity.status == TaskStatus.COMPLETED:
+        if completed_transition:
             await task_event_publisher.publish_task_completed(
                 task_id=updated_entity.id,
                 user_id=user_id,
@@ -181,23 +636,161 @@ class TaskService:
         return task_response
 
     async def delete(self, task_id: int, user_id: int) -> None:
-        """Sadece kullanicinin kendisine ait taski silmesini saglar."""
-        logger.info(f"deleting task for user {user_id} : {task_id}")
-        entity = await self.uow.tasks.get_by_id(task_id)
+        """
+        Sadece kullanicinin kendisine ait taski silmesini saglar.
 
-        if not entity:
-            raise TaskNotFoundException(task_id)
+        Sahiplik kontrolu tek bir DELETE ... WHERE user_id=:uid RETURNING
+        ile yapilir; task yoksa veya baskasinin ise 404 doner.
+        """
+        logger.info(f"deleting task for user {user_id} : {task_id}")
 
-        if entity.user_id != user_id:
-            logger.warning(f"User {user_id} tried to access task {task_id}")
+        if not await self.uow.tasks.delete_owned(task_id, user_id):
             raise TaskNotFoundException(task_id=task_id)
-
-        await self.uow.tasks.delete(entity)
         await self.uow.commit()
-        await redis_cache.delete_pattern(get_task_user_pattern(user_id))
+        # Silinen task icin detay key'ine tombstone yazilir (varsa eski
+        # degerin yerine gecer); sonraki get_by_id DB'ye gitmeden 404 doner.
+        await redis_cache.set_missing(
+            get_task_detail_cache_key(user_id, task_id), broadcast=True
+        )
+        await self._invalidate_user_cache(user_id)
 
         # Event Publish
         await task_event_publisher.publish_task_deleted(
             task_id=task_id,
             user_id=user_id
-        )
\ No newline at end of file
+        )
+
+    async def create_many(
+        self, items: list[TaskCreate], user_id: int
+    ) -> TaskBatchResult:
+        """
+        Task'lari tek INSERT ve tek commit ile olusturur.
+
+        Ya hepsi olusturulur ya hicbiri. Liste cache'i bir kez gecersiz
+        kilinir ve event'ler tek seferde publish edilir.
+
+        Raises:
+            TaskBatchTooLargeException: task_batch_max_size asildiysa.
+        """
+        _check_batch(None, len(items))
+        logger.info(f"Creating {len(items)} tasks for user {user_id}")
+
+        entities = await self.uow.tasks.create_many(
+            [{**item.model_dump(), "user_id": user_id} for item in items]
+        )
+        await self.uow.commit()
+
+        task_responses = [TaskResponse.model_validate(e) for e in entities]
+        await self._write_through_tasks(user_id, task_responses)
+        await self._invalidate_user_cache(user_id)
+
+        await task_event_publisher.publish_batch(user_id, [
+            (TaskEventType.CREATED, task.id, task.model_dump(mode='json'))
+            for task in task_responses
+        ])
+
+        return _build_batch_result(
+            [task.id for task in task_responses],
+            {task.id: task for task in task_responses}
+        )
+
+    async def update_many(
+        self, items: list[TaskBatchUpdateItem], user_id: int
+    ) -> TaskBatchResult:
+        """
+        Kullanicinin task'larini toplu gunceller; oge bazli sonuc doner.
+
+        Ayni alanlara ayni degerleri yazan ogeler gruplanir ve her grup tek
+        UPDATE ... WHERE id IN (...) AND user_id=:uid RETURNING ile
+        calisir. completed'a gecis update() ile ayni sekilde tespit edilir.
+        Bulunamayan (yok veya baska kullaniciya ait) ogeler islemi
+        durdurmaz, sonucta basarisiz olarak doner; detay cache'inde
+        tombstone'u olan ogeler DB'ye hic gonderilmez.
+
+        Raises:
+            TaskBatchTooLargeException: task_batch_max_size asildiysa.
+            TaskBadRequestException: Ayni id birden fazla kez verildiyse.
+        """
+        task_ids = [item.id for item in items]
+        _check_batch(task_ids, len(items))
+        logger.info(f"Updating {len(items)} tasks for user {user_id}")
+
+        known_missing = await self._find_cached_missing(user_id, task_ids)
+        groups: dict[tuple, tuple[dict, list[int]]] = {}
+        for item in items:
+            if item.id in known_missing:
+                continue
+            update_data = item.model_dump(exclude_unset=True, exclude={"id"})
+            group_key = tuple(sorted(update_data.items()))
+            groups.setdefault(group_key, (update_data, []))[1].append(item.id)
+
+        updated: dict[int, TaskEntity] = {}
+        completed_ids: set[int] = set()
+        for update_data, ids in groups.values():
+            remaining = ids
+            if update_data.get("status") == TaskStatus.COMPLETED:
+                transitioned = await self.uow.tasks.update_many_owned(
+                    ids, user_id, update_data, unless_status=TaskStatus.COMPLETED
+                )
+                completed_ids.update(e.id for e in transitioned)
+                updated.update((e.id, e) for e in transitioned)
+                remaining = [task_id for task_id in ids if task_id not in completed_ids]
+            entities = await self.uow.tasks.update_many_owned(
+                remaining, user_id, update_data
+            )
+            for entity in entities:
+                updated[entity.id] = entity
+        await self.uow.commit()
+
+        task_responses = {
+            task_id: TaskResponse.model_validate(updated[task_id])
+            for task_id in task_ids if task_id in updated
+        }
+        await self._write_through_tasks(user_id, list(task_responses.values()))
+        if task_responses:
+            await self._invalidate_user_cache(user_id)
+
+        events = []
+        for task in task_responses.values():
+            task_data = task.model_dump(mode='json')
+            events.append((TaskEventType.UPDATED, task.id, task_data))
+            if task.id in completed_ids:
+                events.append((TaskEventType.COMPLETED, task.id, task_data))
+        await task_event_publisher.publish_batch(user_id, events)
+
+        return _build_batch_result(task_ids, task_responses)
+
+    async def delete_many(self, task_ids: list[int], user_id: int) -> TaskBatchResult:
+        """
+        Kullanicinin task'larini tek DELETE ile siler; oge bazli sonuc doner.
+
+        Silinen task'larin detay key'lerine tek pipeline ile tombstone
+        yazilir. Bulunamayan ogeler sonucta basarisiz olarak doner; detay
+        cache'inde tombstone'u olanlar DB'ye hic gonderilmez.
+
+        Raises:
+            TaskBatchTooLargeException: task_batch_max_size asildiysa.
+            TaskBadRequestException: Ayni id birden fazla kez verildiyse.
+        """
+        _check_batch(task_ids, len(task_ids))
+        logger.info(f"Deleting {len(task_ids)} tasks for user {user_id}")
+
+        known_missing = await self._find_cached_missing(user_id, task_ids)
+        deleted_ids = await self.uow.tasks.delete_many_owned(
+            [task_id for task_id in task_ids if task_id not in known_missing], user_id
+        )
+        await self.uow.commit()
+
+        deleted = [task_id for task_id in task_ids if task_id in deleted_ids]
+        if deleted:
+            await redis_cache.set_missing_many(
+                [get_task_detail_cache_key(user_id, task_id) for task_id in deleted],
+                broadcast=True
+            )
+            await self._invalidate_user_cache(user_id)
+
+        await task_event_publisher.publish_batch(user_id, [
+            (TaskEventType.DELETED, task_id, None) for task_id in deleted
+        ])
+
+        return _build_batch_result(task_ids, dict.fromkeys(deleted))
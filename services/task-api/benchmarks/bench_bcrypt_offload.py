@@ -0,0 +1,124 @@
+"""
+bcrypt offload yuk testi.
+
+Ayni worker'da es zamanli login'ler devam ederken hafif bir task
+endpoint'inin gecikmesini (p50/p99) olcer:
+    - inline : verify_password event loop icinde (eski davranis)
+    - offload: verify_password_async (sinirli thread pool)
+
+Inline modda her bcrypt cagrisi event loop'u ~100-300 ms durdurur ve
+task endpoint'inin p99'u bcrypt suresine firlar; offload modda login yoku
+altinda da p99 login'siz degerine yakin kalmalidir.
+
+Redis veya DB gerektirmez; uygulama in-process (httpx ASGITransport)
+calistirilir.
+
+Calistirma (task-api dizininde):
+    python -m benchmarks.bench_bcrypt_offload --logins 8 --duration 5
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.core.security import (
+    bcrypt_bulkhead,
+    hash_password,
+    verify_password,
+    verify_password_async,
+)
+
+PASSWORD = "benchmark-password"
+
+
+def build_app(offload: bool) -> FastAPI:
+    """Bir login ve bir task endpoint'i olan minimal uygulamayi kurar."""
+    app = FastAPI()
+    hashed = hash_password(PASSWORD)
+
+    @app.post("/login")
+    async def login():
+        if offload:
+            ok = await verify_password_async(PASSWORD, hashed)
+        else:
+            ok = verify_password(PASSWORD, hashed)
+        return {"success": ok}
+
+    @app.get("/tasks/1")
+    async def get_task():
+        # Cache'ten sunulan bir task okumasini temsil eder
+        await asyncio.sleep(0)
+        return {"success": True, "data": {"id": 1}}
+
+    return app
+
+
+async def run(offload: bool, logins: int, duration: float) -> tuple[float, float, int]:
+    """
+    'logins' adet login dongusu calisirken task endpoint'ini olcer.
+
+    Returns:
+        (p50_ms, p99_ms, tamamlanan_login_sayisi)
+    """
+    app = build_app(offload)
+    transport = httpx.ASGITransport(app=app)
+    samples: list[float] = []
+    login_count = 0
+    deadline = time.monotonic() + duration
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def login_loop() -> None:
+            nonlocal login_count
+            while time.monotonic() < deadline:
+                await client.post("/login")
+                login_count += 1
+
+        async def task_loop() -> None:
+            while time.monotonic() < deadline:
+                start = time.perf_counter()
+                await client.get("/tasks/1")
+                samples.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(0.005)
+
+        await asyncio.gather(task_loop(), *(login_loop() for _ in range(logins)))
+
+    samples.sort()
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return statistics.median(samples), p99, login_count
+
+
+async def main(logins: int, duration: float) -> None:
+    logging.disable(logging.WARNING)
+
+    baseline_p50, baseline_p99, _ = await run(offload=True, logins=0, duration=duration)
+    print(
+        f"no logins          : task p50={baseline_p50:7.2f}ms "
+        f"p99={baseline_p99:7.2f}ms"
+    )
+
+    for name, offload in (("inline bcrypt", False), ("offloaded bcrypt", True)):
+        p50, p99, count = await run(offload, logins, duration)
+        print(
+            f"{name:<19}: task p50={p50:7.2f}ms p99={p99:7.2f}ms "
+            f"({count} logins, {count / duration:.1f}/s)"
+        )
+    print(f"bcrypt pool stats  : {bcrypt_bulkhead.get_stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--logins", type=int, default=8, help="Es zamanli login dongusu sayisi"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=5.0, help="Her senaryonun suresi (saniye)"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.duration))
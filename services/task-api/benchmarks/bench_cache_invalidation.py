@@ -0,0 +1,111 @@
+"""
+Cache invalidation benchmark'i.
+
+KEYS tabanli eski invalidation ile generation sayaci (INCR) tabanli
+yeni invalidation'in yazma gecikmesini keyspace buyudukce karsilastirir.
+
+Calistirma (task-api dizininde, calisan bir Redis ile):
+    python -m benchmarks.bench_cache_invalidation --sizes 10000 100000 1000000
+
+Uyari: Benchmark sadece "bench:" prefix'li key'ler olusturur ve sonunda
+siler, ama yine de production Redis'e karsi calistirmayin.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from redis.asyncio import Redis
+
+from app.config import settings
+
+PREFIX = "bench:tasks:user"
+HOT_USER_ID = 1
+USER_COUNT = 10_000
+
+
+async def seed_keyspace(redis: Redis, size: int) -> None:
+    """Keyspace'i 'size' adet sahte cache key'i ile doldurur."""
+    pipe = redis.pipeline(transaction=False)
+    for i in range(size):
+        user_id = i % USER_COUNT
+        pipe.set(f"{PREFIX}:{user_id}:v0:detail:{i}", "x", ex=600)
+        if i % 10_000 == 0:
+            await pipe.execute()
+    await pipe.execute()
+
+
+async def keys_invalidation(redis: Redis) -> None:
+    """Eski yontem: KEYS + DELETE (keyspace boyutunda O(N))."""
+    keys = await redis.keys(f"{PREFIX}:{HOT_USER_ID}:*")
+    if keys:
+        await redis.delete(*keys)
+
+
+async def generation_invalidation(redis: Redis) -> None:
+    """Yeni yontem: tek INCR (O(1))."""
+    await redis.incr(f"{PREFIX}:{HOT_USER_ID}:gen")
+
+
+async def measure(redis: Redis, func, iterations: int) -> tuple[float, float]:
+    """Fonksiyonu 'iterations' kez calistirip p50/p99 gecikmesini (ms) dondurur."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func(redis)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return statistics.median(samples), p99
+
+
+async def cleanup(redis: Redis) -> None:
+    """Benchmark key'lerini SCAN ile temizler."""
+    batch = []
+    async for key in redis.scan_iter(match=f"{PREFIX}:*", count=1000):
+        batch.append(key)
+        if len(batch) >= 1000:
+            await redis.unlink(*batch)
+            batch.clear()
+    if batch:
+        await redis.unlink(*batch)
+
+
+async def main(sizes: list[int], iterations: int) -> None:
+    redis = Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=settings.redis_db,
+        password=settings.redis_password,
+    )
+    await redis.ping()
+
+    print(
+        f"{'keyspace':>10} | {'KEYS p50':>9} | {'KEYS p99':>9} | "
+        f"{'INCR p50':>9} | {'INCR p99':>9}"
+    )
+    try:
+        for size in sizes:
+            await cleanup(redis)
+            await seed_keyspace(redis, size)
+            keys_p50, keys_p99 = await measure(redis, keys_invalidation, iterations)
+            incr_p50, incr_p99 = await measure(
+                redis, generation_invalidation, iterations
+            )
+            print(
+                f"{size:>10} | {keys_p50:>7.2f}ms | {keys_p99:>7.2f}ms | "
+                f"{incr_p50:>7.3f}ms | {incr_p99:>7.3f}ms"
+            )
+    finally:
+        await cleanup(redis)
+        await redis.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.iterations))
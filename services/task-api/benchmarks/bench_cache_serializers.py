@@ -0,0 +1,90 @@
+"""
+Cache serializer microbenchmark'i.
+
+Gercekci bir 100 elemanli get_all payload'i icin her codec'in encode/decode
+suresini ve Redis'e giden byte miktarini karsilastirir. Redis gerektirmez.
+
+CacheCodec JSON frame'lerini orjson kuruluysa orjson ile cozer; "json"
+satirinin decode suresi bu yuzden stdlib json.loads ile dogrudan olculur.
+
+Calistirma (task-api dizininde):
+    python -m benchmarks.bench_cache_serializers --items 100 --rounds 2000
+"""
+import argparse
+import json
+import time
+from datetime import UTC, datetime, timedelta
+
+from app.core.serializers import build_codec
+from app.models.task import TaskPriority, TaskResponse, TaskStatus
+
+CODECS = [
+    ("json", None),
+    ("orjson", None),
+    ("msgpack", None),
+    ("orjson", "zlib"),
+    ("orjson", "lz4"),
+    ("msgpack", "lz4"),
+]
+
+
+def build_payload(item_count: int) -> dict:
+    """TaskService.get_all'in cache'e yazdigi zarfin aynisini uretir."""
+    now = datetime.now(UTC)
+    items = [
+        TaskResponse(
+            id=i,
+            user_id=42,
+            title=f"Task {i}: prepare quarterly report section",
+            description="Collect the numbers from the finance dashboard and "
+            "write a short summary for the weekly sync." if i % 3 else None,
+            status=list(TaskStatus)[i % 3],
+            priority=list(TaskPriority)[i % 3],
+            due_date=now + timedelta(days=i) if i % 2 else None,
+            created_at=now,
+            updated_at=now,
+        ).model_dump()
+        for i in range(item_count)
+    ]
+    return {
+        "v": {"items": items, "total": item_count * 7},
+        "d": 0.0123,
+        "e": time.time() + 300,
+    }
+
+
+def measure(func, rounds: int) -> float:
+    """Fonksiyonun ortalama calisma suresini mikrosaniye olarak dondurur."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1_000_000
+
+
+def main(item_count: int, rounds: int) -> None:
+    payload = build_payload(item_count)
+    print(f"{'codec':<16} | {'encode':>10} | {'decode':>10} | {'bytes':>8}")
+    for serializer, compression in CODECS:
+        codec = build_codec(serializer, compression, threshold=1024)
+        if codec.name != (f"{serializer}+{compression}" if compression else serializer):
+            print(f"{serializer}+{compression or '-':<9} | not installed, skipped")
+            continue
+        data = codec.encode(payload)
+        encode_us = measure(lambda: codec.encode(payload), rounds)
+        if serializer == "json":
+            # Baseline: header atlanip stdlib ile cozulur
+            decode_us = measure(lambda: json.loads(data[1:]), rounds)
+        else:
+            decode_us = measure(lambda: codec.decode(data), rounds)
+        print(
+            f"{codec.name:<16} | {encode_us:>8.1f}us | {decode_us:>8.1f}us"
+            f" | {len(data):>8}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.items, args.rounds)
@@ -0,0 +1,140 @@
+"""
+Middleware overhead benchmark'i.
+
+Ayni basit endpoint'i once eski BaseHTTPMiddleware tabanli
+CorrelationId + RateLimit middleware'leri, sonra saf ASGI versiyonlari ile
+sarar ve in-process (httpx ASGITransport) istek/saniye degerini olcer.
+Redis veya DB gerektirmez; limiter worker ici bucket'larla calisir ve limit
+olcumu etkilemeyecek kadar yuksek tutulur.
+
+Calistirma (task-api dizininde):
+    python -m benchmarks.bench_middleware --requests 5000 --concurrency 1 10 50
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.correlation import (
+    CORRELATION_ID_HEADER,
+    CorrelationIdMiddleware,
+    generate_correlation_id,
+    set_correlation_id,
+)
+from app.core.middleware import RateLimitMiddleware
+from app.core.rate_limiter import RateLimiter
+
+PATH = "/api/v1/tasks/ping"
+
+
+class LegacyCorrelationIdMiddleware(BaseHTTPMiddleware):
+    """Eski yontem: BaseHTTPMiddleware ile correlation ID."""
+
+    async def dispatch(self, request: Request, call_next):
+        correlation_id = (
+            request.headers.get(CORRELATION_ID_HEADER) or generate_correlation_id()
+        )
+        set_correlation_id(correlation_id)
+        response = await call_next(request)
+        response.headers[CORRELATION_ID_HEADER] = correlation_id
+        return response
+
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    """Eski yontem: BaseHTTPMiddleware ile rate limiting."""
+
+    def __init__(self, app, limiter: RateLimiter):
+        super().__init__(app)
+        self.limiter = limiter
+
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path in RateLimitMiddleware.EXCLUDED_PATHS:
+            return await call_next(request)
+        identifier = RateLimitMiddleware.get_identifier(request)
+        cost = RateLimitMiddleware.get_cost(request)
+        allowed, info = await self.limiter.is_allowed(identifier, cost)
+        headers = {
+            "X-RateLimit-Limit": str(info["limit"]),
+            "X-RateLimit-Remaining": str(info["remaining"]),
+            "X-RateLimit-Reset-After": str(info["reset_after"]),
+        }
+        if not allowed:
+            return JSONResponse(
+                status_code=429, content={"success": False}, headers=headers
+            )
+        response = await call_next(request)
+        for key, value in headers.items():
+            response.headers[key] = value
+        return response
+
+
+def build_app(legacy: bool) -> FastAPI:
+    """Endpoint'i istenen middleware versiyonlariyla saran uygulamayi kurar."""
+    app = FastAPI()
+
+    @app.get(PATH)
+    async def ping():
+        return {"success": True}
+
+    limiter = RateLimiter(max_requests=10**9, window_seconds=60)
+    if legacy:
+        app.add_middleware(LegacyCorrelationIdMiddleware)
+        app.add_middleware(LegacyRateLimitMiddleware, limiter=limiter)
+    else:
+        app.add_middleware(CorrelationIdMiddleware)
+        app.add_middleware(RateLimitMiddleware, limiter=limiter)
+    return app
+
+
+async def measure_rps(app: FastAPI, requests: int, concurrency: int) -> float:
+    """'concurrency' adet client ile toplam 'requests' istek atar, rps dondurur."""
+    per_worker = max(1, requests // concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        # Isinma (route/middleware stack kurulumu olcume girmesin)
+        for _ in range(50):
+            await client.get(PATH)
+
+        async def worker() -> None:
+            for _ in range(per_worker):
+                response = await client.get(PATH)
+                assert response.status_code == 200, response.status_code
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    return per_worker * concurrency / elapsed
+
+
+async def main(requests: int, concurrency_levels: list[int]) -> None:
+    # Istek loglari olcumu etkilemesin
+    logging.disable(logging.WARNING)
+
+    print(
+        f"{'concurrency':>11} | {'BaseHTTP rps':>12} | {'ASGI rps':>9} | "
+        f"{'speedup':>7}"
+    )
+    for concurrency in concurrency_levels:
+        legacy_rps = await measure_rps(build_app(legacy=True), requests, concurrency)
+        asgi_rps = await measure_rps(build_app(legacy=False), requests, concurrency)
+        print(
+            f"{concurrency:>11} | {legacy_rps:>12.0f} | {asgi_rps:>9.0f} | "
+            f"{asgi_rps / legacy_rps:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,139 @@
+"""
+Rate limiter overhead benchmark'i.
+
+Eski GET + Python + SET (JSON) token bucket'i, Lua script (EVALSHA)
+tabanli bucket ve lokal lease'li hibrit limiter'i es zamanli istekler
+altinda karsilastirir:
+    - istek basina limiter gecikmesi (p50/p99)
+    - ayni identifier'a gelen burst'te limitin ne kadar asildigi
+
+Calistirma (task-api dizininde, calisan bir Redis ile):
+    python -m benchmarks.bench_rate_limiter --concurrency 1 10 100 --requests 5000
+
+Uyari: Benchmark sadece "bench:" prefix'li identifier'lar kullanir ve sonunda
+siler, ama yine de production Redis'e karsi calistirmayin.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.core.cache import redis_cache
+from app.core.rate_limiter import HybridRateLimiter, RateLimiter
+
+IDENTIFIER_PREFIX = "bench:"
+
+
+class LegacyRateLimiter(RateLimiter):
+    """Eski yontem: redis_cache uzerinden GET, Python'da hesap, SET (JSON)."""
+
+    def _get_key(self, identifier: str) -> str:
+        return f"ratelimit:{identifier}"
+
+    async def is_allowed(self, identifier: str) -> tuple[bool, dict]:
+        key = self._get_key(identifier)
+        now = time.time()
+        data = await redis_cache.get(key)
+        if data is None:
+            tokens, last_update = self.max_requests, now
+        else:
+            tokens, last_update = data["tokens"], data["last_update"]
+        tokens = min(self.max_requests, tokens + (now - last_update) * self.refill_rate)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        await redis_cache.set(
+            key, {"tokens": tokens, "last_update": now}, ttl=self.window_seconds * 2
+        )
+        return allowed, {"remaining": max(0, int(tokens))}
+
+
+async def measure_latency(
+    limiter: RateLimiter, concurrency: int, requests: int
+) -> tuple[float, float]:
+    """
+    'concurrency' adet worker ile toplam 'requests' kontrol yapar.
+
+    Her worker ayri bir identifier kullanir; boylece sadece limiter
+    maliyeti olculur, 429'lar sonucu etkilemez.
+    """
+    samples: list[float] = []
+    per_worker = max(1, requests // concurrency)
+
+    async def worker(index: int) -> None:
+        identifier = f"{IDENTIFIER_PREFIX}latency:{index}"
+        for _ in range(per_worker):
+            start = time.perf_counter()
+            await limiter.is_allowed(identifier)
+            samples.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    samples.sort()
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return statistics.median(samples), p99
+
+
+async def measure_burst(limiter: RateLimiter, burst: int) -> int:
+    """Ayni identifier'a ayni anda 'burst' istek atar, izin verilenleri sayar."""
+    identifier = f"{IDENTIFIER_PREFIX}burst:{type(limiter).__name__}"
+    results = await asyncio.gather(
+        *(limiter.is_allowed(identifier) for _ in range(burst))
+    )
+    return sum(allowed for allowed, _ in results)
+
+
+async def cleanup() -> None:
+    """Benchmark bucket'larini SCAN ile temizler."""
+    batch = []
+    pattern = f"ratelimit*{IDENTIFIER_PREFIX}*"
+    async for key in redis_cache.redis.scan_iter(match=pattern, count=1000):
+        batch.append(key)
+    if batch:
+        await redis_cache.redis.unlink(*batch)
+
+
+async def main(concurrency_levels: list[int], requests: int, limit: int) -> None:
+    await redis_cache.connect()
+    if redis_cache.redis is None:
+        raise SystemExit("Redis is not reachable, check REDIS_HOST/REDIS_PORT")
+
+    limiters = [
+        ("GET+SET", LegacyRateLimiter(max_requests=10**9, window_seconds=60)),
+        ("EVALSHA", RateLimiter(max_requests=10**9, window_seconds=60)),
+        (
+            "HYBRID",
+            HybridRateLimiter(max_requests=10**9, window_seconds=60, lease_size=20),
+        ),
+    ]
+
+    print(f"{'concurrency':>11} | {'limiter':>8} | {'p50':>8} | {'p99':>8}")
+    try:
+        for concurrency in concurrency_levels:
+            for name, limiter in limiters:
+                await cleanup()
+                p50, p99 = await measure_latency(limiter, concurrency, requests)
+                print(f"{concurrency:>11} | {name:>8} | {p50:>6.3f}ms | {p99:>6.3f}ms")
+
+        print(f"\nburst of {limit * 5} concurrent requests, limit={limit}")
+        for name, limiter_cls in (
+            ("GET+SET", LegacyRateLimiter),
+            ("EVALSHA", RateLimiter),
+            ("HYBRID", HybridRateLimiter),
+        ):
+            await cleanup()
+            bucket = limiter_cls(max_requests=limit, window_seconds=60)
+            allowed = await measure_burst(bucket, limit * 5)
+            over = max(0, allowed - limit)
+            print(f"{name:>8}: allowed {allowed} (over limit by {over})")
+    finally:
+        await cleanup()
+        await redis_cache.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.requests, args.limit))
@@ -0,0 +1,74 @@
+"""
+JWT dogrulama overhead microbenchmark'i.
+
+Istek basina token cozme maliyetini karsilastirir:
+    - verify : her cagrida HMAC imza dogrulamasi + claim parse (eski davranis)
+    - cached : decode_token, token ozeti ile worker ici cache'ten (hit)
+
+Ayrica 'tokens' adet farkli token'in round-robin gonderildigi gercekci bir
+karisimda cache'li decode_token'in cagri basina maliyetini olcer.
+Redis veya DB gerektirmez.
+
+Calistirma (task-api dizininde):
+    python -m benchmarks.bench_token_decode --iterations 100000 --tokens 1000
+"""
+import argparse
+import timeit
+
+from app.core.security import (
+    _verify_token,
+    clear_token_cache,
+    create_access_token,
+    decode_token,
+    get_token_cache_stats,
+)
+
+
+def per_call_us(func, iterations: int) -> float:
+    """func'i 'iterations' kez calistirir, cagri basina mikrosaniye dondurur."""
+    return timeit.timeit(func, number=iterations) / iterations * 1_000_000
+
+
+def main(iterations: int, token_count: int) -> None:
+    token = create_access_token(user_id=1)
+    tokens = [create_access_token(user_id=i) for i in range(token_count)]
+
+    verify_us = per_call_us(lambda: _verify_token(token), iterations)
+
+    clear_token_cache()
+    decode_token(token)
+    cached_us = per_call_us(lambda: decode_token(token), iterations)
+
+    clear_token_cache()
+    position = 0
+
+    def mixed() -> None:
+        nonlocal position
+        decode_token(tokens[position % token_count])
+        position += 1
+
+    mixed_us = per_call_us(mixed, iterations)
+
+    print(f"verify every call : {verify_us:8.2f} us/call")
+    print(
+        f"cached (hit)      : {cached_us:8.2f} us/call "
+        f"({verify_us / cached_us:.1f}x)"
+    )
+    print(
+        f"cached ({token_count} tokens): {mixed_us:8.2f} us/call "
+        f"({verify_us / mixed_us:.1f}x)"
+    )
+    print(f"cache stats       : {get_token_cache_stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100_000)
+    parser.add_argument(
+        "--tokens",
+        type=int,
+        default=1000,
+        help="Round-robin gonderilen farkli token sayisi",
+    )
+    args = parser.parse_args()
+    main(args.iterations, args.tokens)
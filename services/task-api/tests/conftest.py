@@ -2,9 +2,14 @@ from collections.abc import AsyncGenerator
 from typing import Any
 
 import pytest
+from fakeredis import FakeAsyncRedis
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.core.cache import redis_cache
+from app.core.principal_cache import principal_cache
+from app.core.rate_limiter import rate_limiter
+from app.core.token_revocation import token_revocation
 from app.db.database import get_db_session
 from app.db.entities import Base
 from app.main import app
@@ -18,6 +23,40 @@ def anyio_backend() -> str:
     return "asyncio"
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_limiter() -> None:
+    """
+    Testlerde Redis yok; limiter worker ici yedek bucket'larla calisir.
+    Testler ayni client IP'sini paylastigi icin bucket'lar her testte sifirlanir.
+    """
+    rate_limiter.reset_local_state()
+
+
+@pytest.fixture(autouse=True)
+def reset_principal_cache() -> None:
+    """Her testte DB yeniden kurulur, user id'ler tekrar eder; cache sifirlanir."""
+    if principal_cache is not None:
+        principal_cache.clear_local()
+
+
+@pytest.fixture(autouse=True)
+def reset_token_revocation() -> None:
+    """Redis yokken iptaller worker belleginde tutulur; testler arasinda sifirlanir."""
+    token_revocation.reset_local_state()
+
+
+@pytest.fixture(scope="function")
+async def fake_redis(monkeypatch) -> AsyncGenerator[FakeAsyncRedis, None]:
+    """
+    Redis gerektiren testler icin redis_cache'e (Lua destekli) fakeredis baglar.
+    Test bitince baglanti tekrar None olur; diger testler Redis'siz calisir.
+    """
+    redis = FakeAsyncRedis()
+    monkeypatch.setattr(redis_cache, "redis", redis)
+    yield redis
+    await redis.aclose()
+
+
 @pytest.fixture(scope="function")
 async def test_engine():
     """Her test için yeni bir database engine oluşturur."""
@@ -11,12 +11,17 @@ Bu testler gerçek HTTP istekleri yaparak:
 
 - Token refresh flow
 
+- Logout ve token iptali
+
 - Protected endpoint erişimi
 
 """
 
 from httpx import AsyncClient
 
+from app.core.security import decode_token
+from app.core.token_revocation import TokenRevocationList
+
 
 class TestRegister:
     """Post /api/v1/auth/register testleri"""
@@ -165,3 +170,61 @@ class TestRefreshToken:
         )
 
         assert response.status_code == 401
+
+    async def test_refresh_token_cannot_be_reused(self, client: AsyncClient, test_user):
+        """Kullanilan refresh token iptal edilir (rotasyon)."""
+        login_data = {"email": test_user["email"], "password": test_user["password"]}
+        login_response = await client.post("/api/v1/auth/login", json=login_data)
+        refresh_token = login_response.json()["data"]["refresh_token"]
+
+        body = {"refresh_token": refresh_token}
+        first = await client.post("/api/v1/auth/refresh", json=body)
+        second = await client.post("/api/v1/auth/refresh", json=body)
+
+        assert first.status_code == 200
+        assert second.status_code == 401
+
+    async def test_refresh_rejected_after_rotation_on_another_worker(
+        self, client: AsyncClient, test_user, fake_redis
+    ):
+        """Baska worker'in rotasyonu, pub/sub bu worker'a ulasmadan da reddedilir."""
+        login_data = {"email": test_user["email"], "password": test_user["password"]}
+        login_response = await client.post("/api/v1/auth/login", json=login_data)
+        refresh_token = login_response.json()["data"]["refresh_token"]
+        payload = decode_token(refresh_token)
+
+        other_worker = TokenRevocationList(capacity=100)
+        assert await other_worker.revoke(payload["jti"], payload["exp"]) is True
+        response = await client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": refresh_token}
+        )
+
+        assert response.status_code == 401
+
+
+class TestLogout:
+    """POST /api/v1/auth/logout testleri"""
+
+    async def test_logout_revokes_access_and_refresh_tokens(
+        self, client: AsyncClient, test_user
+    ):
+        """Logout sonrasi iki token da reddedilir."""
+        login_data = {"email": test_user["email"], "password": test_user["password"]}
+        login_response = await client.post("/api/v1/auth/login", json=login_data)
+        tokens = login_response.json()["data"]
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+        assert (await client.get("/api/v1/auth/me", headers=headers)).status_code == 200
+
+        response = await client.post(
+            "/api/v1/auth/logout",
+            json={"refresh_token": tokens["refresh_token"]},
+            headers=headers,
+        )
+        assert response.status_code == 200
+
+        assert (await client.get("/api/v1/auth/me", headers=headers)).status_code == 401
+        refresh_response = await client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+        assert refresh_response.status_code == 401
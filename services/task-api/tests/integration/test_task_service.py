@@ -0,0 +1,215 @@
+"""
+TaskService'in cache davranisi icin integration testleri.
+
+Bu testler:
+
+- Create/update sonrasi detay okumasinin (write-through) DB'ye gitmeden
+  yeni degerleri dondurmesi
+
+- Liste yuklemesinin detay cache'ini isitirken (SET NX) daha yeni bir
+  kaydi ezmemesi
+
+- Tahmini total modu: esigi asan toplamin sonraki sayfalarda exact count
+  yerine kullanilmasi, gorulen kayitlara gore alt sinir ve Redis yokken
+  exact count'a donulmesi
+
+- Toplu update/delete'in detay cache'inde tombstone'u olan id'leri
+  (tek MGET ile bulup) DB'ye gondermemesi
+
+"""
+
+from app.config import settings
+from app.core.cache import redis_cache
+from app.core.cache_keys import get_task_list_total_cache_key
+from app.db.entities import UserEntity
+from app.db.repositories.task import TaskRepository
+from app.db.unit_of_work import TaskUnitOfWork
+from app.models.common import PaginationParams
+from app.models.task import (
+    TaskBatchUpdateItem,
+    TaskCreate,
+    TaskFilter,
+    TaskStatus,
+    TaskUpdate,
+)
+from app.services.task import TaskService
+
+
+async def make_service(test_session) -> tuple[TaskService, int]:
+    uow = TaskUnitOfWork(test_session)
+    user = await uow.users.create(
+        UserEntity(
+            email="service@example.com", hashed_password="x", full_name="Service"
+        )
+    )
+    await uow.commit()
+    return TaskService(uow), user.id
+
+
+def forbid_db_reads(monkeypatch) -> None:
+    """get_by_id'nin DB'ye gitmesini test hatasina cevirir."""
+    async def fail(*args, **kwargs):
+        raise AssertionError("detail read should be served from cache")
+
+    monkeypatch.setattr(TaskService, "_find_task", fail)
+
+
+class TestWriteThrough:
+    """create/update write-through testleri"""
+
+    async def test_read_after_create_and_update_hits_cache(
+        self, test_session, fake_redis, monkeypatch
+    ):
+        """Yazmanin hemen ardindan get_by_id yeni degerleri cache'ten dondurur."""
+        service, user_id = await make_service(test_session)
+        created = await service.create(TaskCreate(title="Ilk"), user_id=user_id)
+        update = TaskUpdate(title="Ikinci", status=TaskStatus.COMPLETED)
+        await service.update(created.id, update, user_id=user_id)
+        forbid_db_reads(monkeypatch)
+
+        task = await service.get_by_id(created.id, user_id=user_id)
+
+        assert task.title == "Ikinci"
+        assert task.status == TaskStatus.COMPLETED
+
+    async def test_read_after_create_hits_cache(
+        self, test_session, fake_redis, monkeypatch
+    ):
+        """Olusturulan task'in detayi DB'ye gitmeden okunur."""
+        service, user_id = await make_service(test_session)
+        created = await service.create(TaskCreate(title="Yeni"), user_id=user_id)
+        forbid_db_reads(monkeypatch)
+
+        task = await service.get_by_id(created.id, user_id=user_id)
+
+        assert task == created
+
+
+class TestWarmDetailCache:
+    """_warm_detail_cache testleri"""
+
+    async def test_warm_does_not_overwrite_newer_entry(
+        self, test_session, fake_redis, monkeypatch
+    ):
+        """Eski liste okumasiyla isitma, write-through'un yeni degerini ezmez."""
+        service, user_id = await make_service(test_session)
+        stale = await service.create(TaskCreate(title="Eski"), user_id=user_id)
+        await service.update(stale.id, TaskUpdate(title="Yeni"), user_id=user_id)
+
+        await service._warm_detail_cache(user_id, [stale])
+        forbid_db_reads(monkeypatch)
+
+        task = await service.get_by_id(stale.id, user_id=user_id)
+
+        assert task.title == "Yeni"
+
+
+def new_tasks(count: int) -> list[TaskCreate]:
+    return [TaskCreate(title=f"T{i}") for i in range(count)]
+
+
+def forbid_exact_count(monkeypatch) -> None:
+    """find_with_total'in (exact COUNT) calismasini test hatasina cevirir."""
+    async def fail(*args, **kwargs):
+        raise AssertionError("total should come from the cached estimate")
+
+    monkeypatch.setattr(TaskRepository, "find_with_total", fail)
+
+
+class TestEstimatedTotal:
+    """task_list_total_estimate_threshold testleri"""
+
+    async def test_estimate_is_reused_on_later_pages(
+        self, test_session, fake_redis, monkeypatch
+    ):
+        """Esigi asan exact total saklanir; sonraki sayfa COUNT calistirmaz."""
+        monkeypatch.setattr(settings, "task_list_total_estimate_threshold", 5)
+        service, user_id = await make_service(test_session)
+        await service.create_many(new_tasks(6), user_id)
+
+        first = await service.get_all(
+            user_id, TaskFilter(), PaginationParams(page_size=2)
+        )
+        forbid_exact_count(monkeypatch)
+        second = await service.get_all(
+            user_id, TaskFilter(), PaginationParams(page=2, page_size=2)
+        )
+
+        assert (first.total, first.total_is_estimate) == (6, False)
+        assert (second.total, second.total_is_estimate) == (6, True)
+        assert len(second.items) == 2
+
+    async def test_stale_estimate_is_raised_to_rows_seen(
+        self, test_session, fake_redis, monkeypatch
+    ):
+        """Sayfa eski tahminin otesine gecerse total gorulen kayit sayisina cikar."""
+        monkeypatch.setattr(settings, "task_list_total_estimate_threshold", 5)
+        service, user_id = await make_service(test_session)
+        await service.create_many(new_tasks(10), user_id)
+        await redis_cache.set(get_task_list_total_cache_key(user_id), 5)
+        forbid_exact_count(monkeypatch)
+
+        page = await service.get_all(
+            user_id, TaskFilter(), PaginationParams(page=3, page_size=3)
+        )
+
+        assert len(page.items) == 3
+        assert (page.total, page.total_is_estimate) == (9, True)
+        assert page.next_cursor is not None
+
+    async def test_exact_count_without_redis(self, test_session, monkeypatch):
+        """Redis yoksa tahmin saklanamaz; her sayfa exact total dondurur."""
+        monkeypatch.setattr(settings, "task_list_total_estimate_threshold", 5)
+        service, user_id = await make_service(test_session)
+        await service.create_many(new_tasks(6), user_id)
+
+        pages = [
+            await service.get_all(
+                user_id, TaskFilter(), PaginationParams(page=page, page_size=2)
+            )
+            for page in (1, 2)
+        ]
+
+        assert [(p.total, p.total_is_estimate) for p in pages] == [(6, False)] * 2
+
+
+class TestBatchTombstones:
+    """update_many/delete_many tombstone on filtresi testleri"""
+
+    async def test_tombstoned_ids_are_not_sent_to_db(
+        self, test_session, fake_redis, monkeypatch
+    ):
+        """Silinmis task DB'ye gitmeden TASK_NOT_FOUND olur; digerleri islenir."""
+        service, user_id = await make_service(test_session)
+        deleted = await service.create(TaskCreate(title="Silinen"), user_id=user_id)
+        kept = await service.create(TaskCreate(title="Kalan"), user_id=user_id)
+        await service.delete(deleted.id, user_id=user_id)
+
+        sent_ids = []
+        update_many_owned = TaskRepository.update_many_owned
+        delete_many_owned = TaskRepository.delete_many_owned
+
+        async def record_update(self, task_ids, *args, **kwargs):
+            sent_ids.extend(task_ids)
+            return await update_many_owned(self, task_ids, *args, **kwargs)
+
+        async def record_delete(self, task_ids, *args, **kwargs):
+            sent_ids.extend(task_ids)
+            return await delete_many_owned(self, task_ids, *args, **kwargs)
+
+        monkeypatch.setattr(TaskRepository, "update_many_owned", record_update)
+        monkeypatch.setattr(TaskRepository, "delete_many_owned", record_delete)
+
+        updated = await service.update_many(
+            [
+                TaskBatchUpdateItem(id=deleted.id, title="x"),
+                TaskBatchUpdateItem(id=kept.id, title="Yeni"),
+            ],
+            user_id=user_id,
+        )
+        removed = await service.delete_many([deleted.id, kept.id], user_id=user_id)
+
+        assert sent_ids == [kept.id, kept.id]
+        for result in (updated, removed):
+            assert [item.success for item in result.items] == [False, True]
+            assert result.items[0].error.code == "TASK_NOT_FOUND"
@@ -4,11 +4,20 @@ Task endpointlerinin integration testleri.
 Bu testler:
 -Task CRUD islemleri
 -Authorization (sadece kendi tasklarina erisim)
+-Cursor (keyset) sayfalama
+-Full-text arama (FTS5) ve alaka siralamasi
+-Toplu (batch) create/update/delete endpointleri
+-Cache'lenmis (render edilmis) liste body'si ve timestamp eklenmesi
 denetlemektedir.
 """
 
 from httpx import AsyncClient
 
+from app.config import settings
+from app.models.common import ApiResponse, PaginatedResponse
+from app.models.task import TaskResponse
+from app.services.task import TaskService
+
 
 class TestCreateTask:
     """POST /api/v1/tasks testleri"""
@@ -316,3 +325,212 @@ class TestTaskAuthorization:
         )
 
         assert get_response.status_code == 200
+
+
+class TestCursorPagination:
+    """GET /api/v1/tasks?cursor= testleri"""
+
+    async def test_cursor_walks_all_tasks_once(self, client: AsyncClient, auth_headers):
+        """next_cursor ile tum task'lar tekrarsiz ve en yeniden eskiye gezilir."""
+        for i in range(5):
+            await client.post(
+                "/api/v1/tasks/", json={"title": f"Task {i}"}, headers=auth_headers
+            )
+
+        titles, cursor, pages = [], "", 0
+        while cursor is not None:
+            response = await client.get(
+                "/api/v1/tasks/",
+                params={"cursor": cursor, "page_size": 2},
+                headers=auth_headers,
+            )
+            assert response.status_code == 200
+            data = response.json()["data"]
+            assert "total" not in data
+            titles += [task["title"] for task in data["items"]]
+            cursor = data["next_cursor"]
+            pages += 1
+
+        assert titles == [f"Task {i}" for i in reversed(range(5))]
+        assert pages == 3
+
+    async def test_invalid_cursor_is_rejected(self, client: AsyncClient, auth_headers):
+        """Bozuk cursor 400 doner."""
+        response = await client.get(
+            "/api/v1/tasks/", params={"cursor": "not-a-cursor"}, headers=auth_headers
+        )
+
+        assert response.status_code == 400
+
+
+class TestSearchTasks:
+    """GET /api/v1/tasks?search= testleri"""
+
+    async def test_search_ranks_title_matches_first(
+        self, client: AsyncClient, auth_headers
+    ):
+        """On ek eslesir, baslikta gecen task aciklamada gecenden once gelir."""
+        await client.post(
+            "/api/v1/tasks/",
+            json={"title": "Toplanti", "description": "Rapor taslagini konus"},
+            headers=auth_headers,
+        )
+        for title in ("Rapor hazirla", "Market"):
+            await client.post(
+                "/api/v1/tasks/", json={"title": title}, headers=auth_headers
+            )
+
+        response = await client.get(
+            "/api/v1/tasks/", params={"search": "rap"}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        titles = [task["title"] for task in data["items"]]
+        assert titles == ["Rapor hazirla", "Toplanti"]
+        assert data["total"] == 2
+
+    async def test_search_index_follows_updates_and_deletes(
+        self, client: AsyncClient, auth_headers
+    ):
+        """Guncellenen ve silinen task'lar arama index'ine yansir."""
+        async def search(term: str):
+            return await client.get(
+                "/api/v1/tasks/", params={"search": term}, headers=auth_headers
+            )
+
+        created = await client.post(
+            "/api/v1/tasks/", json={"title": "Eski baslik"}, headers=auth_headers
+        )
+        task_id = created.json()["data"]["id"]
+
+        await client.put(
+            f"/api/v1/tasks/{task_id}",
+            json={"title": "Yeni baslik"},
+            headers=auth_headers,
+        )
+        renamed = await search("yeni")
+        old = await search("eski")
+
+        await client.delete(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+        deleted = await search("yeni")
+
+        assert renamed.json()["data"]["total"] == 1
+        assert old.json()["data"]["total"] == 0
+        assert deleted.json()["data"]["total"] == 0
+
+
+class TestBatchTasks:
+    """POST/PATCH/DELETE /api/v1/tasks/batch testleri"""
+
+    async def test_batch_create_returns_tasks_in_order(
+        self, client: AsyncClient, auth_headers
+    ):
+        """Toplu olusturulan task'lar sirayla doner ve listeye yansir."""
+        response = await client.post(
+            "/api/v1/tasks/batch",
+            json={"items": [{"title": f"Batch {i}"} for i in range(3)]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 201
+        data = response.json()["data"]
+        titles = [item["data"]["title"] for item in data["items"]]
+        assert titles == ["Batch 0", "Batch 1", "Batch 2"]
+        assert data["succeeded"] == 3 and data["failed"] == 0
+
+        listed = await client.get("/api/v1/tasks/", headers=auth_headers)
+        assert listed.json()["data"]["total"] == 3
+
+    async def test_batch_update_reports_missing_tasks(
+        self, client: AsyncClient, auth_headers
+    ):
+        """Bulunamayan task islemi durdurmaz; oge bazli basarisiz doner."""
+        created = await client.post(
+            "/api/v1/tasks/batch",
+            json={"items": [{"title": "Birinci"}, {"title": "Ikinci"}]},
+            headers=auth_headers,
+        )
+        first, second = (item["id"] for item in created.json()["data"]["items"])
+
+        response = await client.patch(
+            "/api/v1/tasks/batch",
+            json={"items": [
+                {"id": first, "status": "completed"},
+                {"id": 999999, "status": "completed"},
+                {"id": second, "title": "Ikinci (yeni)"},
+            ]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [item["success"] for item in data["items"]] == [True, False, True]
+        assert data["items"][1]["error"]["code"] == "TASK_NOT_FOUND"
+        detail = await client.get(f"/api/v1/tasks/{first}", headers=auth_headers)
+        assert detail.json()["data"]["status"] == "completed"
+        detail = await client.get(f"/api/v1/tasks/{second}", headers=auth_headers)
+        assert detail.json()["data"]["title"] == "Ikinci (yeni)"
+
+    async def test_batch_delete_removes_tasks(self, client: AsyncClient, auth_headers):
+        """Toplu silinen task'lar 404 doner, bulunamayanlar basarisiz sayilir."""
+        created = await client.post(
+            "/api/v1/tasks/", json={"title": "Silinecek"}, headers=auth_headers
+        )
+        task_id = created.json()["data"]["id"]
+
+        response = await client.request(
+            "DELETE",
+            "/api/v1/tasks/batch",
+            json={"ids": [task_id, 999999]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"]["succeeded"] == 1
+        assert response.json()["data"]["failed"] == 1
+        detail = await client.get(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+        assert detail.status_code == 404
+
+    async def test_batch_size_is_capped(
+        self, client: AsyncClient, auth_headers, monkeypatch
+    ):
+        """task_batch_max_size'i asan istek 413 doner."""
+        monkeypatch.setattr(settings, "task_batch_max_size", 2)
+
+        response = await client.post(
+            "/api/v1/tasks/batch",
+            json={"items": [{"title": f"Batch {i}"} for i in range(3)]},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 413
+
+
+class TestRenderedListBody:
+    """GET /api/v1/tasks render edilmis body cache'i testleri"""
+
+    async def test_cache_hit_returns_same_body_with_new_timestamp(
+        self, client: AsyncClient, auth_headers, fake_redis, monkeypatch
+    ):
+        """Ikinci istek cache'ten gelir: veri ayni, timestamp yeni, JSON gecerli."""
+        # Timestamp'in son key olmasina dayanan rpartition'i sasirtmaya calisan baslik
+        title = 'Rapor ,"timestamp":"2000-01-01T00:00:00Z"}'
+        await client.post("/api/v1/tasks/", json={"title": title}, headers=auth_headers)
+        response_model = ApiResponse[PaginatedResponse[TaskResponse]]
+
+        first = await client.get("/api/v1/tasks/", headers=auth_headers)
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("rendered body should be served from cache")
+
+        monkeypatch.setattr(TaskService, "get_all", fail)
+        second = await client.get("/api/v1/tasks/", headers=auth_headers)
+
+        assert first.status_code == second.status_code == 200
+        first_body = response_model.model_validate_json(first.content)
+        second_body = response_model.model_validate_json(second.content)
+        assert first_body.data == second_body.data
+        assert second_body.data.items[0].title == title
+        assert second_body.timestamp > first_body.timestamp
+        assert first_body.timestamp.year > 2000
@@ -0,0 +1,234 @@
+"""
+TaskUnitOfWork'un veritabani ile integration testleri.
+
+Bu testler:
+
+- Create/update'in session'da yuklu nesne sayisindan bagimsiz,
+  sabit sayida statement calistirmasi
+
+- Sunucuda uretilen kolonlarin (id, updated_at) RETURNING ile doldurulmasi
+
+- Sahiplik kosullu tek statement update/delete ve completed'a gecis tespiti
+
+- Sayfa + toplamin tek sorguda (COUNT(*) OVER()) alinmasi
+
+- Toplu create/update/delete'in task sayisindan bagimsiz tek statement olmasi
+
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.entities import TaskEntity, UserEntity
+from app.db.repositories.specifications import (
+    PaginationSpecification,
+    TaskStatusSpecification,
+    TaskUserSpecification,
+)
+from app.db.unit_of_work import TaskUnitOfWork
+from app.models.task import TaskPriority, TaskStatus
+
+
+def make_task(user_id: int, title: str) -> TaskEntity:
+    return TaskEntity(
+        user_id=user_id,
+        title=title,
+        status=TaskStatus.PENDING,
+        priority=TaskPriority.MEDIUM,
+    )
+
+
+@contextmanager
+def recorded_statements(engine: AsyncEngine) -> Iterator[list[str]]:
+    """Blok icinde calisan statement'larin turunu (INSERT, SELECT...) toplar."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement.split()[0].upper())
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+class TestCommitStatements:
+    """Commit'in statement sayisi testleri"""
+
+    async def test_writes_do_not_refresh_loaded_entities(
+        self, test_engine, test_session
+    ):
+        """Session'da 20 task yukluyken create ve update tek statement calistirir."""
+        uow = TaskUnitOfWork(test_session)
+        user = await uow.users.create(
+            UserEntity(email="uow@example.com", hashed_password="x", full_name="Uow")
+        )
+        await uow.commit()
+        # Identity map weak referans tutar; nesneler yuklu kalsin diye listede
+        loaded = [
+            await uow.tasks.create(make_task(user.id, f"loaded {i}")) for i in range(20)
+        ]
+        await uow.commit()
+
+        with recorded_statements(test_engine) as statements:
+            created = await uow.tasks.create(make_task(user.id, "new"))
+            await uow.commit()
+            create_statements = list(statements)
+
+            statements.clear()
+            created.title = "renamed"
+            await uow.tasks.update(created)
+            await uow.commit()
+            update_statements = list(statements)
+
+        assert len(loaded) == 20
+        assert create_statements == ["INSERT"]
+        assert update_statements == ["UPDATE"]
+        state = inspect(created)
+        assert created.id is not None
+        assert "updated_at" not in state.unloaded
+        assert created.updated_at is not None
+
+
+class TestOwnedWrites:
+    """TaskRepository.update_owned / delete_owned testleri"""
+
+    async def test_owned_update_and_delete(self, test_engine, test_session):
+        """Sahibi disindaki kullanici icin satir donmez; sahibi icin tek statement."""
+        uow = TaskUnitOfWork(test_session)
+        owner = await uow.users.create(
+            UserEntity(
+                email="owner@example.com", hashed_password="x", full_name="Owner"
+            )
+        )
+        await uow.commit()
+        task = await uow.tasks.create(make_task(owner.id, "owned"))
+        await uow.commit()
+
+        with recorded_statements(test_engine) as statements:
+            foreign = await uow.tasks.update_owned(
+                task.id, owner.id + 1, {"title": "x"}
+            )
+            updated = await uow.tasks.update_owned(
+                task.id, owner.id, {"title": "renamed"}
+            )
+            await uow.commit()
+
+        assert foreign is None
+        assert updated.title == "renamed"
+        assert statements == ["UPDATE", "UPDATE"]
+
+        assert await uow.tasks.delete_owned(task.id, owner.id + 1) is False
+        assert await uow.tasks.delete_owned(task.id, owner.id) is True
+        await uow.commit()
+        assert await uow.tasks.get_by_id(task.id) is None
+
+    async def test_completed_transition_guard(self, test_session):
+        """unless_status ile zaten completed olan task guncellenmez."""
+        uow = TaskUnitOfWork(test_session)
+        owner = await uow.users.create(
+            UserEntity(email="done@example.com", hashed_password="x", full_name="Done")
+        )
+        await uow.commit()
+        task = await uow.tasks.create(make_task(owner.id, "todo"))
+        await uow.commit()
+        values = {"status": TaskStatus.COMPLETED}
+
+        first = await uow.tasks.update_owned(
+            task.id, owner.id, values, unless_status=TaskStatus.COMPLETED
+        )
+        second = await uow.tasks.update_owned(
+            task.id, owner.id, values, unless_status=TaskStatus.COMPLETED
+        )
+
+        assert first is not None
+        assert first.status == TaskStatus.COMPLETED
+        assert second is None
+
+
+class TestFindWithTotal:
+    """BaseRepository.find_with_total testleri"""
+
+    async def test_page_and_total_in_one_query(self, test_engine, test_session):
+        """Sayfa ve filtrelenmis toplam tek SELECT ile gelir."""
+        uow = TaskUnitOfWork(test_session)
+        owner = await uow.users.create(
+            UserEntity(email="page@example.com", hashed_password="x", full_name="Page")
+        )
+        await uow.commit()
+        for i in range(7):
+            await uow.tasks.create(make_task(owner.id, f"task {i}"))
+        await uow.commit()
+        specs = [
+            TaskUserSpecification(owner.id),
+            TaskStatusSpecification(TaskStatus.PENDING),
+        ]
+
+        with recorded_statements(test_engine) as statements:
+            items, total = await uow.tasks.find_with_total(
+                *specs, PaginationSpecification(2, 3)
+            )
+
+        assert len(items) == 3
+        assert total == 7
+        assert statements == ["SELECT"]
+
+    async def test_page_past_the_end_still_reports_total(self, test_session):
+        """Bos sayfada toplam ayrica sayilir."""
+        uow = TaskUnitOfWork(test_session)
+        owner = await uow.users.create(
+            UserEntity(
+                email="empty@example.com", hashed_password="x", full_name="Empty"
+            )
+        )
+        await uow.commit()
+        await uow.tasks.create(make_task(owner.id, "only"))
+        await uow.commit()
+
+        items, total = await uow.tasks.find_with_total(
+            TaskUserSpecification(owner.id), PaginationSpecification(5, 10)
+        )
+
+        assert items == []
+        assert total == 1
+
+
+class TestBatchWrites:
+    """TaskRepository.create_many / update_many_owned / delete_many_owned testleri"""
+
+    async def test_batch_writes_use_one_statement_each(self, test_engine, test_session):
+        """20 task icin create, update ve delete birer statement calistirir."""
+        uow = TaskUnitOfWork(test_session)
+        owner = await uow.users.create(
+            UserEntity(
+                email="batch@example.com", hashed_password="x", full_name="Batch"
+            )
+        )
+        await uow.commit()
+        rows = [
+            {"user_id": owner.id, "title": f"batch {i}", "status": TaskStatus.PENDING,
+             "priority": TaskPriority.MEDIUM}
+            for i in range(20)
+        ]
+
+        with recorded_statements(test_engine) as statements:
+            created = await uow.tasks.create_many(rows)
+            ids = [task.id for task in created]
+            created_titles = [task.title for task in created]
+            updated = await uow.tasks.update_many_owned(
+                ids, owner.id, {"title": "renamed"}
+            )
+            foreign = await uow.tasks.delete_many_owned(ids, owner.id + 1)
+            deleted = await uow.tasks.delete_many_owned(ids[:5], owner.id)
+            await uow.commit()
+
+        assert created_titles == [f"batch {i}" for i in range(20)]
+        assert {task.title for task in updated} == {"renamed"}
+        assert len(updated) == 20
+        assert foreign == set()
+        assert deleted == set(ids[:5])
+        assert statements == ["INSERT", "UPDATE", "DELETE", "DELETE"]
@@ -0,0 +1,171 @@
+"""
+RedisCache yardimci mantiginin unit testleri.
+
+Bu testler:
+
+- Cache zarfinin (deger + delta + expiry) ve tombstone'larin cozulmesi
+
+- XFetch erken yenileme karari
+
+- Tek round trip'lik coklu key okuma/yazma/silme (get_many/set_many/
+  delete_many): kismi hit'ler, L1 yolu, kismi NX yazimi, cozulemeyen
+  degerler ve Redis baglantisi yokken davranis
+
+"""
+
+import time
+
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from app.core.cache import CacheEntry, RedisCache
+from app.core.local_cache import LocalLRUCache
+
+
+def make_cache(server: FakeServer) -> RedisCache:
+    """fakeredis'e bagli, L1'i acik bir RedisCache olusturur."""
+    cache = RedisCache(local_cache=LocalLRUCache(max_size=100, ttl_seconds=30))
+    cache.redis = FakeAsyncRedis(server=server)
+    return cache
+
+
+class TestCacheEnvelope:
+    """Cache zarfi testleri"""
+
+    def test_unwrap_envelope(self):
+        """Zarfli kayit meta verisiyle cozulur."""
+        entry = RedisCache._unwrap({"v": {"id": 1}, "d": 0.2, "e": 123.0})
+
+        assert entry.value == {"id": 1}
+        assert entry.delta == 0.2
+        assert entry.expiry == 123.0
+
+    def test_unwrap_tombstone(self):
+        """Tombstone (negatif cache) zarfi None degerli bir kayittir."""
+        entry = RedisCache._unwrap({"v": None, "d": 0.0, "e": 123.0})
+
+        assert entry is not None
+        assert entry.value is None
+        assert entry.expiry == 123.0
+
+    def test_unwrap_legacy_value(self):
+        """Zarfsiz eski kayitlar deger olarak okunur."""
+        entry = RedisCache._unwrap({"items": [], "total": 0})
+
+        assert entry.value == {"items": [], "total": 0}
+        assert entry.expiry == 0.0
+
+
+class TestXFetch:
+    """Erken yenileme (XFetch) testleri"""
+
+    def test_fresh_entry_is_not_refreshed(self):
+        """Bitisine cok zaman olan kayit yenilenmez."""
+        entry = CacheEntry(value=1, delta=0.05, expiry=time.time() + 300)
+
+        refreshed = [RedisCache.should_refresh_early(entry, 1.0) for _ in range(1000)]
+
+        assert not any(refreshed)
+
+    def test_expired_entry_is_always_refreshed(self):
+        """Bitis zamani gecmis kayit her zaman yenilenir."""
+        entry = CacheEntry(value=1, delta=0.05, expiry=time.time() - 1)
+
+        assert all(RedisCache.should_refresh_early(entry, beta=1.0) for _ in range(100))
+
+    def test_refresh_probability_rises_near_expiry(self):
+        """Bitise yaklastikca yenileme olasiligi artar."""
+        now = time.time()
+        far = CacheEntry(value=1, delta=1.0, expiry=now + 3)
+        near = CacheEntry(value=1, delta=1.0, expiry=now + 0.5)
+
+        refresh = RedisCache.should_refresh_early
+        far_hits = sum(refresh(far, 1.0, now) for _ in range(2000))
+        near_hits = sum(refresh(near, 1.0, now) for _ in range(2000))
+
+        assert near_hits > far_hits
+
+    def test_entry_without_metadata_is_not_refreshed(self):
+        """Meta verisi olmayan kayit sadece TTL ile dolar."""
+        assert RedisCache.should_refresh_early(CacheEntry(value=1), beta=1.0) is False
+
+
+class TestPipelinedOperations:
+    """get_many / set_many / delete_many testleri"""
+
+    async def test_get_many_returns_partial_hits(self):
+        """Sadece bulunan key'ler doner; tombstone None degeriyle hit sayilir."""
+        cache = make_cache(FakeServer())
+        await cache.set_many({"task:1": {"title": "a"}, "task:2": {"title": "b"}})
+        await cache.set_missing("task:3")
+
+        result = await cache.get_many(["task:1", "task:2", "task:3", "task:4"])
+
+        assert result == {
+            "task:1": {"title": "a"},
+            "task:2": {"title": "b"},
+            "task:3": None,
+        }
+
+    async def test_get_many_with_decoder_uses_local_cache(self):
+        """Decoder verilince hit'ler L1'e alinir; sonraki okuma MGET'e gitmez."""
+        cache = make_cache(FakeServer())
+        await cache.set_many({"task:1": {"title": "a"}})
+
+        keys = ["task:1", "task:2"]
+        first = await cache.get_many(keys, decoder=lambda v: v["title"])
+        await cache.redis.delete("task:1")
+        second = await cache.get_many(keys, decoder=lambda v: v["title"])
+
+        assert first == second == {"task:1": "a"}
+
+    async def test_set_many_nx_writes_only_missing_keys(self):
+        """NX ile var olan key korunur, olmayanlar yazilir (karisik hit/miss)."""
+        cache = make_cache(FakeServer())
+        await cache.set("task:1", {"title": "newer"})
+
+        items = {"task:1": {"title": "stale"}, "task:2": {"title": "fresh"}}
+        await cache.set_many(items, nx=True)
+
+        assert await cache.get("task:1") == {"title": "newer"}
+        assert await cache.get("task:2") == {"title": "fresh"}
+        assert await cache.get("task:3") is None
+
+    async def test_undecodable_value_is_a_miss(self):
+        """Cozulemeyen kayit hata firlatmaz, miss sayilir; digerleri okunur."""
+        cache = make_cache(FakeServer())
+        await cache.set_many({"task:1": {"title": "ok"}})
+        await cache.redis.set("task:2", b"{not json")
+
+        assert await cache.get("task:1") == {"title": "ok"}
+        assert await cache.get("task:2") is None
+        assert await cache.get_many(["task:1", "task:2"]) == {"task:1": {"title": "ok"}}
+
+    async def test_delete_many_removes_redis_and_local_copies(self):
+        """Verilen key'ler (olmayanlar dahil) tek DEL ile silinir, L1 de temizlenir."""
+        cache = make_cache(FakeServer())
+        values = {"task:1": 1, "task:2": 2, "task:3": 3}
+        await cache.set_many(values, local_values=values)
+
+        await cache.delete_many(["task:1", "task:2", "task:missing"])
+
+        assert "task:1" not in cache.local
+        assert await cache.get("task:1") is None
+        assert await cache.get("task:2") is None
+        assert await cache.get("task:3") == 3
+
+    async def test_operations_are_noops_when_redis_is_down(self):
+        """Baglanti kopuksa veya hic yoksa hata firlatilmaz; okumalar miss doner."""
+        server = FakeServer()
+        cache = make_cache(server)
+        server.connected = False
+
+        await cache.set_many({"task:1": 1})
+        await cache.delete_many(["task:1"])
+        assert await cache.get("task:1") is None
+        assert await cache.get_many(["task:1"]) == {}
+
+        cache.redis = None
+        await cache.set_many({"task:1": 1})
+        await cache.delete_many(["task:1"])
+        assert await cache.get("task:1") is None
+        assert await cache.get_many(["task:1"]) == {}
@@ -0,0 +1,63 @@
+"""
+Cache key yardimci fonksiyonlarinin unit testleri.
+
+Bu testler:
+
+- Generation (namespace versiyonu) key'lere dogru yansiyor mu
+
+"""
+
+from app.core.cache_keys import (
+    get_task_detail_cache_key,
+    get_task_generation_key,
+    get_task_list_body_cache_key,
+    get_task_list_cache_key,
+)
+
+
+class TestCacheKeys:
+    """Cache key formati testleri"""
+
+    def test_generation_key_format(self):
+        """Generation sayaci kullaniciya ozel key'de tutulur."""
+        assert get_task_generation_key(1) == "tasks:user:1:gen"
+
+    def test_list_key_contains_generation(self):
+        """Liste key'i generation'i icerir."""
+        key = get_task_list_cache_key(1, "pending", "high", None, 1, generation=3)
+
+        assert key == "tasks:user:1:v3:list:pending:high::1:10"
+
+    def test_list_key_contains_page_size(self):
+        """Farkli sayfa boyutlari ayni key'i paylasmaz."""
+        small = get_task_list_cache_key(1, page=1, page_size=10)
+        large = get_task_list_cache_key(1, page=1, page_size=20)
+
+        assert small != large
+
+    def test_cursor_mode_has_its_own_key(self):
+        """Cursor modu (bos cursor dahil) sayfa modu key'i ile cakismaz."""
+        page_key = get_task_list_cache_key(1, page=1, page_size=10)
+        first_cursor_key = get_task_list_cache_key(1, page=1, page_size=10, cursor="")
+        next_cursor_key = get_task_list_cache_key(1, page=1, page_size=10, cursor="abc")
+
+        assert len({page_key, first_cursor_key, next_cursor_key}) == 3
+
+    def test_body_key_is_separate_from_list_key(self):
+        """Render edilmis body, obje cache'inden ayri key'de tutulur."""
+        key = get_task_list_body_cache_key(
+            1, None, None, None, 2, generation=3, page_size=20
+        )
+
+        assert key == "tasks:user:1:v3:body:all:all::2:20"
+
+    def test_detail_key_has_no_generation(self):
+        """Detay key'i generation icermez (write-through ile guncellenir)."""
+        assert get_task_detail_cache_key(1, 5) == "tasks:user:1:detail:5"
+
+    def test_new_generation_changes_keys(self):
+        """Generation artinca eski key'ler artik okunmaz."""
+        old_key = get_task_list_cache_key(1, generation=3)
+        new_key = get_task_list_cache_key(1, generation=4)
+
+        assert old_key != new_key
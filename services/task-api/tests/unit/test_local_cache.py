@@ -0,0 +1,78 @@
+"""
+L1 (in-process) cache unit testleri.
+
+Bu testler:
+
+- LRU eviction
+
+- TTL expiration
+
+- Hit/miss/eviction sayaclari
+
+"""
+
+import time
+
+from app.core.local_cache import LocalLRUCache
+
+
+class TestLocalLRUCache:
+    """LocalLRUCache testleri"""
+
+    def test_get_returns_cached_value(self):
+        """Kaydedilen deger geri okunabilir."""
+        cache = LocalLRUCache(max_size=10, ttl_seconds=30)
+        cache.set("a", {"x": 1})
+
+        assert cache.get("a") == {"x": 1}
+
+    def test_least_recently_used_is_evicted(self):
+        """Kapasite asilinca en az kullanilan kayit atilir."""
+        cache = LocalLRUCache(max_size=2, ttl_seconds=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # a en son kullanilan oldu
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_expired_entry_is_a_miss(self):
+        """Suresi dolan kayit okunamaz."""
+        cache = LocalLRUCache(max_size=10, ttl_seconds=30)
+        cache.set("a", 1, ttl=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_ttl_is_capped_by_local_ttl(self):
+        """L1, kendi TTL'inden uzun sure tutmaz."""
+        cache = LocalLRUCache(max_size=10, ttl_seconds=0.01)
+        cache.set("a", 1, ttl=300)
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+
+    def test_stats_count_hits_and_misses(self):
+        """Hit ve miss sayaclari dogru tutulur."""
+        cache = LocalLRUCache(max_size=10, ttl_seconds=30)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+
+    def test_delete_removes_entry(self):
+        """Silinen kayit okunamaz."""
+        cache = LocalLRUCache(max_size=10, ttl_seconds=30)
+        cache.set("a", 1)
+
+        assert cache.delete("a") is True
+        assert cache.get("a") is None
+        assert cache.delete("a") is False
@@ -0,0 +1,140 @@
+"""
+Saf ASGI middleware'lerinin (RateLimitMiddleware, CorrelationIdMiddleware)
+unit testleri.
+
+Bu testler:
+
+- Normal ve streaming response'lara X-RateLimit-* ve X-Correlation-ID
+  header'larinin eklenmesi
+
+- Limit asildiginda 429 JSON body'si ve Retry-After header'i
+
+- EXCLUDED_PATHS'in rate limit'ten muaf olmasi
+
+- HTTP disi scope'larin (lifespan/websocket) degistirilmeden gecirilmesi
+
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.core.correlation import CORRELATION_ID_HEADER, CorrelationIdMiddleware
+from app.core.middleware import RateLimitMiddleware
+from app.core.rate_limiter import RateLimiter
+
+
+async def items(request):
+    return JSONResponse({"items": [1, 2]})
+
+
+async def stream(request):
+    async def chunks():
+        for chunk in (b"first,", b"second"):
+            yield chunk
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+async def health(request):
+    return JSONResponse({"status": "ok"})
+
+
+def build_client(max_requests: int = 3) -> AsyncClient:
+    """main.py ile ayni sirada (rate limit en dista) middleware'li kucuk uygulama."""
+    limiter = RateLimiter(max_requests=max_requests, window_seconds=60)
+    app = Starlette(
+        routes=[
+            Route("/items", items), Route("/stream", stream), Route("/health", health)
+        ],
+        middleware=[
+            Middleware(RateLimitMiddleware, limiter=limiter),
+            Middleware(CorrelationIdMiddleware),
+        ],
+    )
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+class TestResponseHeaders:
+    """Header ekleme testleri"""
+
+    @pytest.mark.parametrize("path", ["/items", "/stream"])
+    async def test_headers_are_added(self, path):
+        """Rate limit ve correlation header'lari eklenir, body bozulmaz."""
+        async with build_client() as client:
+            response = await client.get(
+                path, headers={CORRELATION_ID_HEADER: "req-123"}
+            )
+
+        assert response.status_code == 200
+        assert response.headers["X-RateLimit-Limit"] == "3"
+        assert response.headers["X-RateLimit-Remaining"] == "2"
+        assert "X-RateLimit-Reset-After" in response.headers
+        assert response.headers[CORRELATION_ID_HEADER] == "req-123"
+        if path == "/stream":
+            assert response.text == "first,second"
+
+    async def test_correlation_id_is_generated(self):
+        """Istekte ID yoksa yeni bir ID uretilir."""
+        async with build_client() as client:
+            response = await client.get("/items")
+
+        assert len(response.headers[CORRELATION_ID_HEADER]) == 36
+
+
+class TestRateLimitResponse:
+    """429 ve muaf path testleri"""
+
+    async def test_limit_exceeded_returns_429_with_retry_after(self):
+        """Kapasite bitince 429 JSON body'si ve Retry-After doner."""
+        async with build_client(max_requests=1) as client:
+            await client.get("/items")
+            response = await client.get("/items")
+
+        assert response.status_code == 429
+        error = response.json()["error"]
+        assert response.json()["success"] is False
+        assert error["code"] == "RATE_LIMIT_EXCEEDED"
+        assert error["retry_after"] > 0
+        assert int(response.headers["Retry-After"]) >= 1
+        assert response.headers["X-RateLimit-Remaining"] == "0"
+
+    async def test_excluded_paths_are_not_limited(self):
+        """EXCLUDED_PATHS token harcamaz ve rate limit header'i almaz."""
+        async with build_client(max_requests=1) as client:
+            responses = [await client.get("/health") for _ in range(3)]
+            limited = await client.get("/items")
+
+        assert all(r.status_code == 200 for r in responses)
+        assert all("X-RateLimit-Limit" not in r.headers for r in responses)
+        assert limited.status_code == 200
+
+
+class TestNonHttpScopes:
+    """lifespan/websocket scope testleri"""
+
+    @pytest.mark.parametrize("scope_type", ["lifespan", "websocket"])
+    @pytest.mark.parametrize(
+        "middleware", [RateLimitMiddleware, CorrelationIdMiddleware]
+    )
+    async def test_scope_is_passed_through_unchanged(self, middleware, scope_type):
+        """HTTP disi scope'lar ayni scope/receive/send ile ic uygulamaya gider."""
+        calls = []
+
+        async def inner(scope, receive, send):
+            calls.append((scope, receive, send))
+
+        async def receive():
+            return {}
+
+        async def send(message):
+            pass
+
+        scope = {"type": scope_type, "path": "/ws"}
+        await middleware(inner)(scope, receive, send)
+
+        assert calls == [(scope, receive, send)]
+        assert scope == {"type": scope_type, "path": "/ws"}
@@ -0,0 +1,79 @@
+"""
+Principal cache unit testleri.
+
+Bu testler:
+
+- Cache'lenen kullanicinin DB'ye gitmeden donmesi
+
+- Invalidation sonrasi kaydin silinmesi
+
+- Kullanici guncellenince commit sonrasi cache'in temizlenmesi
+
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+from app.core.local_cache import LocalLRUCache
+from app.core.principal_cache import PrincipalCache
+from app.db.unit_of_work import TaskUnitOfWork
+from app.models.user import UserPrincipal
+
+
+def make_principal(user_id: int = 1, is_active: bool = True) -> UserPrincipal:
+    return UserPrincipal(
+        id=user_id,
+        email=f"user{user_id}@example.com",
+        full_name="Test User",
+        is_active=is_active,
+        is_superuser=False,
+        created_at=datetime.now(UTC),
+    )
+
+
+class TestPrincipalCache:
+    """PrincipalCache testleri"""
+
+    async def test_set_and_get_from_local(self):
+        """Yazilan kullanici ayni worker'da L1'den okunur."""
+        cache = PrincipalCache(local=LocalLRUCache(max_size=10, ttl_seconds=5))
+        principal = make_principal()
+
+        await cache.set(principal)
+
+        assert await cache.get(1) is principal
+        assert await cache.get(2) is None
+
+    async def test_invalidate_removes_entry(self):
+        """Invalidate edilen kullanici bir sonraki istekte DB'den okunur."""
+        cache = PrincipalCache(local=LocalLRUCache(max_size=10, ttl_seconds=5))
+        await cache.set(make_principal(1))
+        await cache.set(make_principal(2))
+
+        await cache.invalidate(1)
+
+        assert await cache.get(1) is None
+        assert await cache.get(2) is not None
+
+
+class TestUserChangeInvalidation:
+    """Kullanici degisikliginde cache invalidation testleri"""
+
+    async def test_commit_invalidates_updated_users(self, monkeypatch):
+        """Guncellenen kullanici commit'ten sonra cache'ten silinir."""
+        cache = PrincipalCache(local=LocalLRUCache(max_size=10, ttl_seconds=5))
+        await cache.set(make_principal(7))
+        monkeypatch.setattr("app.db.unit_of_work.principal_cache", cache)
+
+        session = AsyncMock()
+        session.identity_map = {}
+        uow = TaskUnitOfWork(session)
+        user = make_principal(7, is_active=False)
+
+        await uow.users.update(user)
+        assert await cache.get(7) is not None
+
+        await uow.commit()
+
+        assert await cache.get(7) is None
+        assert uow.users.changed_ids == set()
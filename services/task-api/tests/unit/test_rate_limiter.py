@@ -0,0 +1,151 @@
+"""
+Rate limiter unit testleri.
+
+Bu testler:
+
+- Hibrit limiter'in lokal lease'den harcamasi
+
+- Global bucket bosken lokal red ve limitin asilmamasi
+
+- Route maliyetine (cost) gore token harcanmasi
+
+- Redis yokken worker ici yedek bucket'larla sinirlama (degraded mod)
+
+- Lua token bucket'in (EVALSHA) refill'i, cost > 1, bos bucket'ta red ve
+  SCRIPT FLUSH sonrasi script'in yeniden yuklenmesi (fakeredis[lua])
+
+"""
+
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.core.rate_limiter import HybridRateLimiter, RateLimiter
+
+
+class InMemoryHybridLimiter(HybridRateLimiter):
+    """Global bucket'i Redis yerine bellekte tutan test limiter'i (refill yok)."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.global_tokens = float(self.max_requests)
+        self.take_calls = 0
+
+    async def _take(self, identifier, cost=1, max_take=None):
+        self.take_calls += 1
+        if self.global_tokens < cost:
+            return 0.0, self.global_tokens
+        granted = max(cost, min(max_take or cost, int(self.global_tokens)))
+        self.global_tokens -= granted
+        return float(granted), self.global_tokens
+
+
+class TestHybridRateLimiter:
+    """HybridRateLimiter testleri"""
+
+    async def test_requests_are_served_from_local_lease(self):
+        """Lease bitene kadar global bucket'a gidilmez."""
+        limiter = InMemoryHybridLimiter(
+            max_requests=100, window_seconds=60, lease_size=10
+        )
+
+        results = [await limiter.is_allowed("ip:1") for _ in range(10)]
+
+        assert all(allowed for allowed, _ in results)
+        assert limiter.take_calls == 1
+        assert limiter.global_tokens == 90
+
+    async def test_limit_is_not_exceeded_and_denial_is_cached(self):
+        """Global bucket bitince reddedilir, red karari lokal tutulur."""
+        limiter = InMemoryHybridLimiter(
+            max_requests=25, window_seconds=3600, lease_size=10
+        )
+
+        results = [await limiter.is_allowed("ip:1") for _ in range(40)]
+        allowed_count = sum(allowed for allowed, _ in results)
+        take_calls = limiter.take_calls
+
+        denied, info = await limiter.is_allowed("ip:1")
+
+        assert allowed_count == 25
+        assert denied is False
+        assert info["remaining"] == 0
+        assert limiter.take_calls == take_calls
+
+    async def test_lease_size_is_capped_by_limit(self):
+        """Lease, limitten buyuk olamaz."""
+        limiter = InMemoryHybridLimiter(
+            max_requests=5, window_seconds=60, lease_size=50
+        )
+
+        assert limiter.lease_size == 5
+
+    async def test_cost_spends_multiple_tokens(self):
+        """Agir route'lar cost kadar token harcar."""
+        limiter = InMemoryHybridLimiter(
+            max_requests=20, window_seconds=3600, lease_size=4
+        )
+
+        results = [await limiter.is_allowed("user:1", cost=5) for _ in range(5)]
+
+        assert [allowed for allowed, _ in results] == [True, True, True, True, False]
+        assert limiter.global_tokens == 0
+
+
+class TestDegradedMode:
+    """Redis'e ulasilamadiginda yedek limiter testleri"""
+
+    async def test_limit_is_enforced_locally_without_redis(self):
+        """Redis yokken herkese bos bucket verilmez, limit lokal uygulanir."""
+        limiter = RateLimiter(max_requests=3, window_seconds=3600)
+
+        results = [await limiter.is_allowed("ip:1") for _ in range(5)]
+
+        assert [allowed for allowed, _ in results] == [True, True, True, False, False]
+        assert limiter.get_stats()["degraded"] is True
+        assert limiter.get_stats()["backend"] == "local"
+
+
+@pytest.fixture
+def lua_limiter(fake_redis, monkeypatch) -> RateLimiter:
+    """fakeredis'teki Lua script'ini kullanan, yedek bucket'a dusmeyen limiter."""
+    # Ilk Lua cagrisi (lupa yuklemesi) timeout butcesine takilmasin
+    monkeypatch.setattr(settings, "rate_limit_redis_timeout_seconds", 5.0)
+    return RateLimiter(max_requests=4, window_seconds=1)
+
+
+class TestLuaTokenBucket:
+    """TOKEN_BUCKET_SCRIPT (EVALSHA) testleri"""
+
+    async def test_empty_bucket_denies_and_refills(self, lua_limiter):
+        """Kapasite bitince reddedilir; Redis saatine gore zamanla yeniden dolar."""
+        results = [(await lua_limiter.is_allowed("user:1"))[0] for _ in range(5)]
+        await asyncio.sleep(0.3)  # 4 token/saniye -> en az 1 token
+        refilled, _ = await lua_limiter.is_allowed("user:1")
+
+        assert results == [True, True, True, True, False]
+        assert refilled is True
+        assert lua_limiter.fallback_decisions == 0
+
+    async def test_cost_spends_multiple_tokens(self, lua_limiter):
+        """cost > 1 tek seferde o kadar token harcar; yetmeyen istek reddedilir."""
+        first, first_info = await lua_limiter.is_allowed("user:2", cost=3)
+        second, second_info = await lua_limiter.is_allowed("user:2", cost=3)
+
+        assert first is True
+        assert first_info["remaining"] == 1
+        assert second is False
+        assert second_info["reset_after"] > 0
+        assert lua_limiter.fallback_decisions == 0
+
+    async def test_script_is_reloaded_after_flush(self, lua_limiter, fake_redis):
+        """SCRIPT FLUSH sonrasi NoScriptError yakalanir, script yeniden yuklenir."""
+        await lua_limiter.is_allowed("user:3")
+        await fake_redis.script_flush()
+
+        allowed, info = await lua_limiter.is_allowed("user:3")
+
+        assert allowed is True
+        assert info["remaining"] == 2
+        assert lua_limiter.fallback_decisions == 0
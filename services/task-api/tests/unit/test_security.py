@@ -2,18 +2,30 @@
 Security Utility fonksiyonlarının unit teslerini yapar.
 Bu testler:
 
-- Şifre hashleme ve doğrulama
+- Şifre hashleme ve doğrulama (senkron ve thread pool'da)
 
 - JWT token oluşturma ve decode etme
 
+- Doğrulanmış token cache'i (imza token başına bir kez doğrulanır)
+
 """
 
+import time
+
+import jwt
+
+from app.core import security
 from app.core.security import (
+    bcrypt_bulkhead,
+    clear_token_cache,
     create_access_token,
     create_refresh_token,
     decode_token,
+    get_access_token_subject,
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
 )
 
 
@@ -74,6 +86,20 @@ class TestPasswordHashing:
         assert result is False
 
 
+class TestAsyncPasswordHashing:
+    """Thread pool'da calisan bcrypt testleri"""
+
+    async def test_async_hash_and_verify(self):
+        """Async versiyonlar senkron versiyonlarla ayni sonucu verir."""
+        hashed = await hash_password_async("mysecretpassword")
+
+        assert verify_password("mysecretpassword", hashed)
+        assert await verify_password_async("mysecretpassword", hashed) is True
+        assert await verify_password_async("wrongpassword", hashed) is False
+        assert bcrypt_bulkhead.active_count == 0
+        assert bcrypt_bulkhead.waiting_count == 0
+
+
 class TestJWTTokens:
     """JWT Token Testleri"""
 
@@ -151,3 +177,49 @@ class TestJWTTokens:
         payload = decode_token(empty_token)
 
         assert payload is None
+
+    def test_access_token_subject_is_user_id(self):
+        """Access token'dan DB'ye gitmeden kullanici id'si alinir."""
+        assert get_access_token_subject(create_access_token(user_id=42)) == "42"
+
+    def test_refresh_token_has_no_access_subject(self):
+        """Refresh token ve bozuk token kullanici olarak taninmaz."""
+        assert get_access_token_subject(create_refresh_token(user_id=42)) is None
+        assert get_access_token_subject("not-a-token") is None
+
+
+class TestTokenDecodeCache:
+    """Dogrulanmis token cache testleri"""
+
+    def test_signature_is_verified_once_per_token(self, monkeypatch):
+        """Ayni token ikinci kez imza dogrulamasi yapilmadan cozulur."""
+        clear_token_cache()
+        calls = []
+        original_decode = jwt.decode
+        def counting_decode(*args, **kwargs):
+            calls.append(1)
+            return original_decode(*args, **kwargs)
+
+        monkeypatch.setattr(security.jwt, "decode", counting_decode)
+        token = create_access_token(user_id=5)
+
+        first = decode_token(token)
+        second = decode_token(token)
+
+        assert first == second
+        assert second["sub"] == "5"
+        assert len(calls) == 1
+
+    def test_expired_token_is_not_served_from_cache(self):
+        """Cache kaydi token'in exp aninda duser."""
+        clear_token_cache()
+        token = jwt.encode(
+            {"sub": "5", "type": "access", "exp": int(time.time()) + 1},
+            security.settings.jwt_secret_key,
+            algorithm=security.settings.jwt_algorithm,
+        )
+
+        assert decode_token(token) is not None
+        time.sleep(1.1)
+
+        assert decode_token(token) is None
@@ -0,0 +1,127 @@
+"""
+Cache serializer unit testleri.
+
+Bu testler:
+
+- Her codec'in datetime/date/Enum iceren payload'i geri cozebilmesi
+
+- Sikistirma esigi ve eski (header'siz) JSON kayitlari
+
+- Varsayilan serializer ayarinin kurulu kutuphaneyle uyusmasi
+
+"""
+
+import json
+from datetime import UTC, date, datetime
+
+import pytest
+
+from app.config import Settings
+from app.core import serializers
+from app.core.serializers import DateTimeEncoder, build_codec
+from app.models.task import TaskStatus
+
+PAYLOAD = {
+    "v": {
+        "items": [
+            {
+                "id": 1,
+                "status": TaskStatus.PENDING,
+                "created_at": datetime(2026, 1, 1, 12, 0, tzinfo=UTC),
+                "due": date(2026, 1, 2),
+            }
+        ],
+        "total": 1,
+    },
+    "d": 0.01,
+    "e": 123.0,
+}
+
+EXPECTED = {
+    "v": {
+        "items": [
+            {
+                "id": 1,
+                "status": "pending",
+                "created_at": "2026-01-01T12:00:00+00:00",
+                "due": "2026-01-02",
+            }
+        ],
+        "total": 1,
+    },
+    "d": 0.01,
+    "e": 123.0,
+}
+
+
+class TestDateTimeEncoder:
+    """DateTimeEncoder testleri"""
+
+    def test_date_is_serialized_as_iso_string(self):
+        """date objesi ISO string'e cevrilir (bound method degil)."""
+        assert json.dumps(date(2026, 1, 2), cls=DateTimeEncoder) == '"2026-01-02"'
+
+
+class TestCacheCodec:
+    """CacheCodec testleri"""
+
+    def test_default_serializer_is_installed(self):
+        """Varsayilan ayar sadece orjson kuruluysa orjson'dur; aksi halde json."""
+        default = Settings.model_fields["cache_serializer"].default
+        expected = "orjson" if serializers.orjson is not None else "json"
+
+        assert default == expected
+        assert build_codec(default).serializer.name == default
+
+    @pytest.mark.parametrize(
+        "serializer,installed",
+        [
+            ("json", True),
+            ("orjson", serializers.orjson is not None),
+            ("msgpack", serializers.msgpack is not None),
+        ],
+    )
+    def test_round_trip(self, serializer, installed):
+        """Her serializer payload'i ayni JSON-uyumlu veriye geri cozer."""
+        if not installed:
+            pytest.skip(f"{serializer} is not installed")
+        codec = build_codec(serializer)
+
+        assert codec.decode(codec.encode(PAYLOAD)) == EXPECTED
+
+    def test_small_payload_is_not_compressed(self):
+        """Esigin altindaki payload sikistirilmaz."""
+        codec = build_codec("json", compression="zlib", threshold=1024)
+
+        data = codec.encode({"a": 1})
+
+        assert data[0] & 0x0F == serializers.COMPRESSION_NONE
+
+    def test_large_payload_is_compressed(self):
+        """Esigin ustundeki payload sikistirilir ve geri cozulur."""
+        codec = build_codec("json", compression="zlib", threshold=64)
+        payload = {"items": ["x" * 10] * 100}
+
+        data = codec.encode(payload)
+
+        assert data[0] & 0x0F == serializers.COMPRESSION_ZLIB
+        assert len(data) < len(json.dumps(payload))
+        assert codec.decode(data) == payload
+
+    def test_codecs_can_read_each_other(self):
+        """Farkli ayarli worker'lar birbirinin yazdigini okuyabilir."""
+        writer = build_codec("json", compression="zlib", threshold=0)
+        reader = build_codec("json")
+
+        assert reader.decode(writer.encode({"a": 1})) == {"a": 1}
+
+    def test_legacy_json_is_decoded(self):
+        """Header'siz eski JSON kayitlari okunabilir."""
+        codec = build_codec("json")
+
+        assert codec.decode(b'{"items": [], "total": 0}') == {"items": [], "total": 0}
+
+    def test_unknown_serializer_fails(self):
+        """Bilinmeyen serializer adi reddedilir."""
+        with pytest.raises(ValueError):
+            build_codec("pickle")
@@ -0,0 +1,89 @@
+"""
+SingleFlight (request coalescing) unit testleri.
+
+Bu testler:
+
+- Es zamanli cagrilarin tek yukleme paylasmasi
+
+- Hata ve iptal durumlarinin follower'lara etkisi
+
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """SingleFlight testleri"""
+
+    async def test_concurrent_calls_share_one_load(self):
+        """Ayni key icin es zamanli cagrilar fonksiyonu bir kez calistirir."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*[flight.do("key", load) for _ in range(10)])
+
+        assert results == ["result"] * 10
+        assert calls == 1
+        assert flight.get_stats()["shared_calls"] == 9
+        assert flight.in_flight == 0
+
+    async def test_different_keys_are_not_shared(self):
+        """Farkli key'ler birbirini beklemez."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        await asyncio.gather(flight.do("a", load), flight.do("b", load))
+
+        assert calls == 2
+
+    async def test_leader_error_is_shared(self):
+        """Leader hatasi follower'lara da iletilir."""
+        flight = SingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.01)
+            raise ValueError("db down")
+
+        results = await asyncio.gather(
+            flight.do("key", load), flight.do("key", load), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    async def test_leader_cancel_does_not_cancel_followers(self):
+        """Leader iptal edilirse follower kendisi yukler."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "result"
+
+        leader = asyncio.create_task(flight.do("key", load))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", load))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await follower == "result"
+        assert calls == 2
@@ -0,0 +1,131 @@
+"""
+Token iptali unit testleri.
+
+Bu testler:
+
+- Bloom filtresinin eklenen elemanlari kacirmamasi ve false positive orani
+
+- Iptal edilmemis token'larin filtrede elenmesi
+
+- Yerel denylist'in her durumda once sorulmasi; Redis hatasi veya acik
+  breaker'da kararin yerel denylist'e gore verilmesi
+
+- Iptalin SET NX ile atomik olmasi (ayni jti yalnizca bir kez iptal edilir)
+
+"""
+
+import asyncio
+import time
+
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from app.core.cache import redis_cache
+from app.core.cache_keys import get_revoked_token_key
+from app.core.resilience import CircuitBreaker
+from app.core.token_revocation import BloomFilter, TokenRevocationList
+
+
+class TestBloomFilter:
+    """BloomFilter testleri"""
+
+    def test_added_items_are_always_found(self):
+        """Eklenen eleman icin false negative olmaz."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        items = [f"jti-{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+
+    def test_false_positive_rate_is_near_target(self):
+        """Kapasitede false positive orani hedefin makul katinda kalir."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+
+        assert false_positives / 10000 < 0.03
+
+
+class TestTokenRevocationList:
+    """TokenRevocationList testleri (Redis yok, yerel denylist)"""
+
+    async def test_revoked_token_is_detected(self):
+        """Iptal edilen jti reddedilir, digerleri edilmez."""
+        revocations = TokenRevocationList(capacity=100)
+
+        await revocations.revoke("revoked-jti", time.time() + 60)
+
+        assert await revocations.is_revoked("revoked-jti") is True
+        assert await revocations.is_revoked("active-jti") is False
+        assert await revocations.is_revoked(None) is False
+
+    async def test_expired_token_is_not_stored(self):
+        """Suresi dolmus token icin denylist kaydi tutulmaz."""
+        revocations = TokenRevocationList(capacity=100)
+
+        await revocations.revoke("old-jti", time.time() - 1)
+
+        assert await revocations.is_revoked("old-jti") is False
+        assert revocations.get_stats()["entries"] == 0
+
+
+def connect_fake_redis(monkeypatch) -> tuple[FakeAsyncRedis, FakeServer]:
+    """redis_cache'e baglantisi kesilebilen bir fakeredis baglar."""
+    server = FakeServer()
+    redis = FakeAsyncRedis(server=server)
+    monkeypatch.setattr(redis_cache, "redis", redis)
+    return redis, server
+
+
+class TestRedisDenylist:
+    """TokenRevocationList testleri (fakeredis)"""
+
+    async def test_revoke_is_atomic(self, fake_redis):
+        """Ayni jti icin es zamanli iptallerden yalnizca biri True doner."""
+        revocations = TokenRevocationList(capacity=100)
+        exp = time.time() + 60
+
+        results = await asyncio.gather(
+            *(revocations.revoke("jti", exp) for _ in range(5))
+        )
+
+        assert sorted(results) == [False, False, False, False, True]
+        assert await revocations.revoke("jti", exp) is False
+        assert await revocations.is_revoked("jti") is True
+
+    async def test_local_denylist_is_checked_first(self, monkeypatch):
+        """Redis'e yazilamayan iptal, Redis geri geldiginde de reddedilir."""
+        redis, server = connect_fake_redis(monkeypatch)
+        revocations = TokenRevocationList(capacity=100)
+        server.connected = False
+        assert await revocations.revoke("jti", time.time() + 60) is True
+        server.connected = True
+
+        assert await redis.exists(get_revoked_token_key("jti")) == 0
+        assert await revocations.is_revoked("jti") is True
+        assert await revocations.revoke("jti", time.time() + 60) is False
+        assert revocations.get_stats()["redis_checks"] == 0
+
+    async def test_redis_error_falls_back_to_local_denylist(self, monkeypatch):
+        """EXISTS hata verirse filtrede cikan her jti iptal sayilmaz."""
+        _, server = connect_fake_redis(monkeypatch)
+        revocations = TokenRevocationList(capacity=100)
+        revocations.bloom.add("other-jti")
+        server.connected = False
+
+        assert await revocations.is_revoked("other-jti") is False
+        assert revocations.breaker.get_stats()["failure"] == 1
+
+    async def test_open_breaker_skips_redis(self, fake_redis):
+        """Breaker aciksa Redis'e gidilmez, karar yerel denylist'e gore verilir."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60, name="test")
+        revocations = TokenRevocationList(capacity=100, breaker=breaker)
+        revocations.bloom.add("jti")
+        breaker._record_failure()
+
+        assert await revocations.is_revoked("jti") is False
+        assert await revocations.revoke("jti", time.time() + 60) is True
+        assert await revocations.is_revoked("jti") is True
+        assert await fake_redis.exists(get_revoked_token_key("jti")) == 0